@@ -20,10 +20,16 @@ from core.extractors.concrete.arxiv_source_explorer import ArxivSourceExplorer
 from core.llm.openai_client import UnifiedOpenAIClient
 from core.log import get_logger
 from core.models.rows import User
-from core.services.crawl_service import CrawlService
+from core.services.crawl_service import CrawlService, WorkerCrawlService
+from core.services.paper_service import PaperService
+from core.services.star_service import StarService
 
 logger = get_logger(__name__)
 
+DEFAULT_USER_ID = 1
+DEFAULT_USER_EMAIL = "default@example.com"
+DEFAULT_USER_DISPLAY_NAME = "default_user"
+
 
 def get_settings(request: Request) -> Settings:
     """Get settings from app state."""
@@ -92,24 +98,43 @@ def get_background_batch_manager(request: Request) -> BackgroundBatchManager:
     return manager
 
 
+def get_paper_service(request: Request) -> PaperService:
+    """Get process-wide paper service from app state."""
+    service: PaperService = request.app.state.paper_service
+    return service
+
+
+def get_star_service(request: Request) -> StarService:
+    """Get process-wide star service from app state."""
+    service: StarService = request.app.state.star_service
+    return service
+
+
+def load_default_user(engine: Engine) -> User:
+    """Load (or create) the default user as a detached, session-free copy."""
+    with Session(engine) as session:
+        user = UserRepository(session).get_or_create(
+            DEFAULT_USER_ID, DEFAULT_USER_EMAIL, DEFAULT_USER_DISPLAY_NAME
+        )
+        return User(
+            user_id=user.user_id, email=user.email, display_name=user.display_name
+        )
+
+
 # User authentication dependency
 def get_current_user(
     request: Request,
-    user_repo: Annotated[UserRepository, Depends(get_user_repository)],
+    engine: Annotated[Engine, Depends(get_engine)],
 ) -> User:
-    """Get current user (simplified for now)."""
-    # For now, return a default user
-    # In a real application, this would extract user info from JWT token
-    DEFAULT_USER_ID = 1
-    user = user_repo.get_by_id(DEFAULT_USER_ID)
-    if not user:
-        user = User(
-            user_id=DEFAULT_USER_ID,
-            email="default@example.com",
-            display_name="default_user",
-        )
-        user = user_repo.create(user)
-
+    """Get current user (simplified for now).
+
+    The default user is resolved once and cached in app state; a real
+    implementation would extract user info from a JWT token instead.
+    """
+    user: User | None = getattr(request.app.state, "default_user", None)
+    if user is None:
+        user = load_default_user(engine)
+        request.app.state.default_user = user
     return user
 
 
@@ -121,9 +146,9 @@ def get_summary_generator(request: Request) -> UnifiedOpenAIClient:
 
 
 # Crawler dependencies
-def get_crawl_service(request: Request) -> CrawlService:
+def get_crawl_service(request: Request) -> CrawlService | WorkerCrawlService:
     """Get crawl service from app state."""
-    service: CrawlService = request.app.state.crawl_service
+    service: CrawlService | WorkerCrawlService = request.app.state.crawl_service
     return service
 
 
@@ -3,13 +3,14 @@
 import datetime
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
 from pydantic import BaseModel
 
+from api.dependencies import get_settings
 from api.literals import HEALTH_ENDPOINT, HTML_HEADERS, HTTPStatus
 from core import get_logger
-from core.config import load_settings
+from core.config import Settings
 from core.models import AuthError
 
 logger = get_logger(__name__)
@@ -36,9 +37,10 @@ async def root() -> HTMLResponse:
 
 
 @router.get(HEALTH_ENDPOINT, response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+async def health_check(
+    current_settings: Settings = Depends(get_settings),
+) -> HealthResponse:
     """Health check endpoint."""
-    current_settings = load_settings()
     return HealthResponse(
         status="healthy",
         version=current_settings.api_version,
@@ -57,9 +59,11 @@ class TestAuthResponse(BaseModel):
 
 
 @router.get("/test-auth", response_model=TestAuthResponse)
-async def test_auth(request: Request) -> TestAuthResponse:
+async def test_auth(
+    request: Request,
+    current_settings: Settings = Depends(get_settings),
+) -> TestAuthResponse:
     """Test authentication endpoint - shows current auth status."""
-    current_settings = load_settings()
 
     if current_settings.auth_required:
         auth_header = request.headers.get(current_settings.auth_header_name)
@@ -11,7 +11,7 @@ from core.models.api.responses import (
     CrawlerResponse,
     CrawlerStatusResponse,
 )
-from core.services.crawl_service import CrawlService
+from core.services.crawl_service import CrawlService, WorkerCrawlService
 
 logger = get_logger(__name__)
 
@@ -20,7 +20,7 @@ router = APIRouter(prefix="/v1/crawler", tags=["crawler"])
 
 @router.put("", response_model=CrawlerResponse)
 async def start_crawler(
-    crawl_service: CrawlService = Depends(get_crawl_service),
+    crawl_service: CrawlService | WorkerCrawlService = Depends(get_crawl_service),
     explorer: ArxivSourceExplorer = Depends(get_arxiv_explorer),
     engine: Engine = Depends(get_engine),
 ) -> CrawlerResponse:
@@ -52,7 +52,7 @@ async def start_crawler(
 
 @router.delete("", response_model=CrawlerResponse)
 async def stop_crawler(
-    crawl_service: CrawlService = Depends(get_crawl_service),
+    crawl_service: CrawlService | WorkerCrawlService = Depends(get_crawl_service),
 ) -> CrawlerResponse:
     """Stop crawler."""
     try:
@@ -70,7 +70,7 @@ async def stop_crawler(
 
 @router.get("", response_model=CrawlerStatusResponse)
 async def get_crawler_status(
-    crawl_service: CrawlService = Depends(get_crawl_service),
+    crawl_service: CrawlService | WorkerCrawlService = Depends(get_crawl_service),
     engine: Engine = Depends(get_engine),
 ) -> CrawlerStatusResponse:
     """Get crawler status."""
@@ -92,18 +92,12 @@ async def get_crawler_status(
 
 @router.get("/progress", response_model=CrawlerProgressResponse)
 async def get_crawler_progress(
-    crawl_service: CrawlService = Depends(get_crawl_service),
+    crawl_service: CrawlService | WorkerCrawlService = Depends(get_crawl_service),
     engine: Engine = Depends(get_engine),
 ) -> CrawlerProgressResponse:
     """Get crawler progress."""
     try:
-        progress = crawl_service.get_progress(engine)
-        return CrawlerProgressResponse(
-            total_papers_found=progress.total_papers_found,
-            total_papers_stored=progress.total_papers_stored,
-            completed_date_categories=progress.completed_date_categories,
-            failed_date_categories=progress.failed_date_categories,
-        )
+        return crawl_service.get_progress(engine)
     except Exception as e:
         logger.error(f"Error getting crawler progress: {e}")
         raise HTTPException(
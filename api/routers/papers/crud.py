@@ -1,14 +1,21 @@
 """Paper CRUD operations router."""
 
-from fastapi import APIRouter, Depends, Query
+from collections.abc import Iterator
+
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.engine import Engine
 from sqlmodel import Session
 
 from api.dependencies import (
     get_current_user,
     get_db,
+    get_engine,
+    get_paper_service,
     get_summary_generator,
 )
 from api.utils.error_handler import handle_async_api_operation
+from api.utils.json_response import model_json_response
 from core.database.repository.paper import PaperRepository
 from core.llm.openai_client import UnifiedOpenAIClient
 from core.models import (
@@ -18,6 +25,8 @@ from core.models import (
     PaperListResponse,
     PaperResponse,
 )
+from core.models.api.requests import PaperImportBatchRequest
+from core.models.api.responses import PaperImportBatchResponse
 from core.models.rows import User
 from core.services.paper_service import PaperService
 
@@ -33,7 +42,8 @@ async def get_papers(
     ),
     offset: int = Query(default=0, ge=0, description="Number of papers to skip"),
     language: str = Query(default="Korean", description="Language for summaries"),
-) -> PaperListResponse:
+    paper_service: PaperService = Depends(get_paper_service),
+) -> Response:
     """Get papers with pagination.
 
     Args:
@@ -49,7 +59,6 @@ async def get_papers(
     """
 
     async def get_papers_operation() -> PaperListResponse:
-        paper_service = PaperService()
         user_id = current_user.user_id
         return await paper_service.get_papers(
             db_session,
@@ -59,9 +68,10 @@ async def get_papers(
             language=language,
         )
 
-    return await handle_async_api_operation(
+    papers = await handle_async_api_operation(
         get_papers_operation, error_message="Failed to get papers"
     )
+    return model_json_response(papers)
 
 
 @router.get("/lightweight", response_model=PaperListLightweightResponse)
@@ -73,7 +83,8 @@ async def get_papers_lightweight(
     ),
     offset: int = Query(default=0, ge=0, description="Number of papers to skip"),
     language: str = Query(default="Korean", description="Language for summaries"),
-) -> PaperListLightweightResponse:
+    paper_service: PaperService = Depends(get_paper_service),
+) -> Response:
     """Get papers with overview only for better performance.
 
     This endpoint returns papers with only overview (not full summaries)
@@ -93,7 +104,6 @@ async def get_papers_lightweight(
     """
 
     async def get_papers_lightweight_operation() -> PaperListLightweightResponse:
-        paper_service = PaperService()
         user_id = current_user.user_id
         return await paper_service.get_papers_lightweight(
             db_session,
@@ -103,9 +113,47 @@ async def get_papers_lightweight(
             language=language,
         )
 
-    return await handle_async_api_operation(
+    papers = await handle_async_api_operation(
         get_papers_lightweight_operation, error_message="Failed to get papers"
     )
+    return model_json_response(papers)
+
+
+@router.get("/lightweight/stream")
+async def stream_papers_lightweight(
+    db_engine: Engine = Depends(get_engine),
+    current_user: User = Depends(get_current_user),
+    limit: int = Query(
+        default=100, ge=1, le=1000, description="Number of papers to return"
+    ),
+    offset: int = Query(default=0, ge=0, description="Number of papers to skip"),
+    language: str = Query(default="Korean", description="Language for summaries"),
+) -> StreamingResponse:
+    """Stream papers with overview as newline-delimited JSON.
+
+    Each line is one PaperListItemResponse, written as soon as the database
+    cursor yields the row, so time-to-first-byte does not grow with limit.
+
+    Args:
+        limit: Number of papers to return (1-1000)
+        offset: Number of papers to skip
+        language: Language for summaries
+        current_user: Current user information
+
+    Returns:
+        NDJSON stream of paper list items
+    """
+    user_id = current_user.user_id
+
+    def generate_rows() -> Iterator[str]:
+        with Session(db_engine) as session:
+            paper_repo = PaperRepository(session)
+            for item in paper_repo.iter_papers_with_overview(
+                user_id=user_id, skip=offset, limit=limit, language=language
+            ):
+                yield item.model_dump_json() + "\n"
+
+    return StreamingResponse(generate_rows(), media_type="application/x-ndjson")
 
 
 @router.post("/", response_model=PaperResponse, status_code=201)
@@ -113,6 +161,7 @@ async def create_paper(
     paper_data: PaperCreateRequest,
     db_session: Session = Depends(get_db),
     summary_client: UnifiedOpenAIClient = Depends(get_summary_generator),
+    paper_service: PaperService = Depends(get_paper_service),
 ) -> PaperResponse:
     """Create a new paper.
 
@@ -128,7 +177,6 @@ async def create_paper(
 
     async def create_paper_operation() -> PaperResponse:
         paper_repo = PaperRepository(db_session)
-        paper_service = PaperService()
         return await paper_service.create_paper(paper_data, paper_repo, summary_client)
 
     return await handle_async_api_operation(
@@ -136,6 +184,33 @@ async def create_paper(
     )
 
 
+@router.post("/import:batch", response_model=PaperImportBatchResponse)
+async def import_papers_batch(
+    import_data: PaperImportBatchRequest,
+    db_session: Session = Depends(get_db),
+    paper_service: PaperService = Depends(get_paper_service),
+) -> PaperImportBatchResponse:
+    """Import several papers by URL.
+
+    Args:
+        import_data: Paper URLs to import
+
+    Returns:
+        Per-URL results with created/existing/failed counts
+
+    Raises:
+        HTTPException: If the import fails as a whole
+    """
+
+    async def import_papers_operation() -> PaperImportBatchResponse:
+        paper_repo = PaperRepository(db_session)
+        return await paper_service.import_papers(import_data.urls, paper_repo)
+
+    return await handle_async_api_operation(
+        import_papers_operation, error_message="Failed to import papers"
+    )
+
+
 @router.delete(
     "/{paper_identifier}",
     response_model=PaperDeleteResponse,
@@ -144,6 +219,7 @@ async def create_paper(
 async def delete_paper(
     paper_identifier: str,
     db_session: Session = Depends(get_db),
+    paper_service: PaperService = Depends(get_paper_service),
 ) -> PaperDeleteResponse:
     """Delete a paper by ID or arXiv ID.
 
@@ -158,7 +234,6 @@ async def delete_paper(
     """
 
     async def delete_paper_operation() -> PaperDeleteResponse:
-        paper_service = PaperService()
         return paper_service.delete_paper(paper_identifier, db_session)
 
     return await handle_async_api_operation(
@@ -173,11 +248,14 @@ async def get_paper(
     paper_identifier: str,
     db_session: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    language: str = Query(default="English", description="Language for summary"),
+    paper_service: PaperService = Depends(get_paper_service),
 ) -> PaperResponse:
     """Get a paper by ID or arXiv ID.
 
     Args:
         paper_identifier: Paper ID or arXiv ID
+        language: Language for summary, falling back to English
 
     Returns:
         Paper information with summary
@@ -187,9 +265,10 @@ async def get_paper(
     """
 
     async def get_paper_operation() -> PaperResponse:
-        paper_service = PaperService()
         user_id = current_user.user_id
-        return await paper_service.get_paper(paper_identifier, db_session, user_id)
+        return await paper_service.get_paper(
+            paper_identifier, db_session, user_id, language
+        )
 
     return await handle_async_api_operation(
         get_paper_operation,
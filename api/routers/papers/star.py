@@ -1,15 +1,22 @@
 """Paper star operations router."""
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlmodel import Session
 
 from api.dependencies import (
     get_current_user,
     get_db,
+    get_paper_service,
+    get_star_service,
 )
 from api.utils.error_handler import handle_async_api_operation
-from core.models.api.requests import StarRequest
-from core.models.api.responses import StarredPapersResponse, StarResponse
+from api.utils.json_response import model_json_response
+from core.models.api.requests import StarBatchRequest, StarRequest
+from core.models.api.responses import (
+    StarBatchResponse,
+    StarredPapersResponse,
+    StarResponse,
+)
 from core.models.rows import User
 from core.services.paper_service import PaperService
 from core.services.star_service import StarService
@@ -17,12 +24,44 @@ from core.services.star_service import StarService
 router = APIRouter()
 
 
+@router.post("/stars:batch", response_model=StarBatchResponse)
+async def apply_star_batch(
+    batch_data: StarBatchRequest,
+    db_session: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    star_service: StarService = Depends(get_star_service),
+) -> StarBatchResponse:
+    """Star or unstar several papers in one transaction.
+
+    Args:
+        batch_data: Ordered star/unstar operations
+        current_user: Current user information
+
+    Returns:
+        Per-item results in request order
+
+    Raises:
+        HTTPException: If the batch cannot be applied
+    """
+
+    async def apply_star_batch_operation() -> StarBatchResponse:
+        user_id = current_user.user_id
+        return star_service.apply_star_batch(db_session, user_id, batch_data.items)
+
+    return await handle_async_api_operation(
+        apply_star_batch_operation,
+        error_message="Failed to apply star batch",
+        not_found_message="User not found",
+    )
+
+
 @router.post("/{paper_id}/star", response_model=StarResponse)
 async def add_star(
     paper_id: int,
     star_data: StarRequest,
     db_session: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    star_service: StarService = Depends(get_star_service),
 ) -> StarResponse:
     """Add a star to a paper.
 
@@ -39,7 +78,6 @@ async def add_star(
     """
 
     async def add_star_operation() -> StarResponse:
-        star_service = StarService()
         user_id = current_user.user_id
         return star_service.add_star(db_session, user_id, paper_id, star_data.note)
 
@@ -58,7 +96,8 @@ async def get_starred_papers(
         default=20, ge=1, le=100, description="Number of papers to return"
     ),
     offset: int = Query(default=0, ge=0, description="Number of papers to skip"),
-) -> StarredPapersResponse:
+    paper_service: PaperService = Depends(get_paper_service),
+) -> Response:
     """Get all starred papers for the current user.
 
     Args:
@@ -74,7 +113,6 @@ async def get_starred_papers(
     """
 
     async def get_starred_papers_operation() -> StarredPapersResponse:
-        paper_service = PaperService()
         user_id = current_user.user_id
         if user_id is None:
             raise ValueError(f"User not found: {current_user}")
@@ -85,9 +123,10 @@ async def get_starred_papers(
             limit=limit,
         )
 
-    return await handle_async_api_operation(
+    papers = await handle_async_api_operation(
         get_starred_papers_operation, error_message="Failed to get starred papers"
     )
+    return model_json_response(papers)
 
 
 @router.delete("/{paper_id}/star", response_model=StarResponse)
@@ -95,6 +134,7 @@ async def remove_star(
     paper_id: int,
     db_session: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    star_service: StarService = Depends(get_star_service),
 ) -> StarResponse:
     """Remove a star from a paper.
 
@@ -110,7 +150,6 @@ async def remove_star(
     """
 
     async def remove_star_operation() -> StarResponse:
-        star_service = StarService()
         user_id = current_user.user_id
         return star_service.remove_star(db_session, user_id, paper_id)
 
@@ -126,6 +165,7 @@ async def get_star_status(
     paper_id: int,
     db_session: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    star_service: StarService = Depends(get_star_service),
 ) -> StarResponse:
     """Check if a paper is starred by the current user.
 
@@ -141,7 +181,6 @@ async def get_star_status(
     """
 
     async def get_star_status_operation() -> StarResponse:
-        star_service = StarService()
         user_id = current_user.user_id
         return star_service.is_paper_starred(db_session, user_id, paper_id)
 
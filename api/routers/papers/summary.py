@@ -12,6 +12,7 @@ from api.dependencies import (
     get_current_user,
     get_db,
     get_engine,
+    get_paper_service,
     get_settings,
     get_summary_generator,
 )
@@ -21,7 +22,12 @@ from core.database.repository.summary import SummaryRepository
 from core.database.repository.summary_read import SummaryReadRepository
 from core.llm.openai_client import UnifiedOpenAIClient
 from core.models import PaperCreateRequest
-from core.models.api.responses import SummaryDetailResponse, SummaryReadResponse
+from core.models.api.requests import SummaryReadBatchRequest
+from core.models.api.responses import (
+    SummaryDetailResponse,
+    SummaryReadBatchResponse,
+    SummaryReadResponse,
+)
 from core.models.rows import User
 from core.services.paper_service import PaperService
 from core.services.stream_service import StreamService
@@ -35,6 +41,7 @@ async def stream_paper_summary(
     db_engine: Engine = Depends(get_engine),
     summary_client: UnifiedOpenAIClient = Depends(get_summary_generator),
     settings: Settings = Depends(get_settings),
+    paper_service: PaperService = Depends(get_paper_service),
 ) -> StreamingResponse:
     """Stream paper creation and summarization process.
 
@@ -50,7 +57,8 @@ async def stream_paper_summary(
 
     async def generate_stream() -> AsyncGenerator[str, None]:
         stream_service = StreamService(
-            default_interests=settings.default_interests_list
+            default_interests=settings.default_interests_list,
+            paper_service=paper_service,
         )
 
         with Session(db_engine) as session:
@@ -156,12 +164,48 @@ async def mark_summary_as_read(
     )
 
 
+@router.post("/summaries/read:batch", response_model=SummaryReadBatchResponse)
+async def mark_summaries_as_read(
+    batch_data: SummaryReadBatchRequest,
+    db_session: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    paper_service: PaperService = Depends(get_paper_service),
+) -> SummaryReadBatchResponse:
+    """Mark the summaries of several papers as read in one transaction.
+
+    Args:
+        batch_data: Paper IDs and summary language
+        current_user: Current user information
+
+    Returns:
+        Per-paper results in request order
+
+    Raises:
+        HTTPException: If the batch cannot be applied
+    """
+
+    async def mark_read_batch_operation() -> SummaryReadBatchResponse:
+        user_id = current_user.user_id
+        if user_id is None:
+            raise ValueError("User ID is required")
+        return await paper_service.mark_summaries_as_read(
+            batch_data.paper_ids, user_id, db_session, batch_data.language
+        )
+
+    return await handle_async_api_operation(
+        mark_read_batch_operation,
+        error_message="Failed to mark summaries as read",
+        not_found_message="User not found",
+    )
+
+
 @router.get("/{paper_id}/summary", response_model=SummaryDetailResponse)
 async def get_paper_summary(
     paper_id: int,
     language: str = Query(default="Korean", description="Language for summary"),
     db_session: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    paper_service: PaperService = Depends(get_paper_service),
 ) -> SummaryDetailResponse:
     """Get full summary for a specific paper on demand.
 
@@ -181,7 +225,6 @@ async def get_paper_summary(
     """
 
     async def get_paper_summary_operation() -> SummaryDetailResponse:
-        paper_service = PaperService()
         user_id = current_user.user_id
         return await paper_service.get_paper_summary(
             paper_id, db_session, user_id, language
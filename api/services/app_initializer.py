@@ -2,18 +2,34 @@
 
 from typing import Any
 
+import httpx
 from fastapi import FastAPI
 from sqlalchemy.engine import Engine
 
+from api.dependencies import load_default_user
 from core.config import Settings
 from core.database.engine import create_database_engine, create_database_tables
 from core.extractors.concrete.arxiv_extractor import ArxivExtractor
 from core.extractors.concrete.arxiv_source_explorer import ArxivSourceExplorer
+from core.extractors.concrete.crawl_retry_manager import CrawlRetryManager
+from core.extractors.concrete.crawler_lease import CrawlerLeaseManager
+from core.extractors.concrete.crawler_worker import (
+    create_arxiv_explorer,
+    create_arxiv_http_client,
+    create_crawl_retry_manager,
+    create_daily_crawl_manager,
+    create_historical_crawl_manager,
+)
+from core.extractors.concrete.daily_crawl_manager import DailyCrawlManager
 from core.extractors.concrete.historical_crawl_manager import HistoricalCrawlManager
-from core.extractors.factory import register_extractor
+from core.extractors.factory import register_extractor, register_source_explorer
+from core.extractors.rate_limiter import AsyncTokenBucket
 from core.llm.openai_client import UnifiedOpenAIClient
 from core.log import get_logger
-from core.services.crawl_service import CrawlService
+from core.models.rows import User
+from core.services.crawl_service import CrawlService, WorkerCrawlService
+from core.services.paper_service import PaperService
+from core.services.star_service import StarService
 
 logger = get_logger(__name__)
 
@@ -25,11 +41,18 @@ class AppServiceInitializer:
         """Initialize with application settings."""
         self.settings = settings
         self.engine: Engine | None = None
+        self.http_client: httpx.AsyncClient | None = None
+        self.arxiv_rate_limiter: AsyncTokenBucket | None = None
         self.arxiv_explorer: ArxivSourceExplorer | None = None
         self.historical_crawl_manager: HistoricalCrawlManager | None = None
-        self.crawl_service: CrawlService | None = None
+        self.daily_crawl_manager: DailyCrawlManager | None = None
+        self.crawl_retry_manager: CrawlRetryManager | None = None
+        self.crawl_service: CrawlService | WorkerCrawlService | None = None
         self.openai_client: UnifiedOpenAIClient | None = None
         self.background_batch_manager: Any | None = None
+        self.paper_service: PaperService | None = None
+        self.star_service: StarService | None = None
+        self.default_user: User | None = None
 
     async def initialize_all_services(
         self,
@@ -43,6 +66,7 @@ class AppServiceInitializer:
         logger.info("Initializing all application services...")
 
         await self.initialize_database(engine)
+        await self.initialize_request_services()
         await self.initialize_crawler_services(arxiv_base_url)
         await self.initialize_llm_services(llm_base_url, llm_api_key)
         await self.initialize_batch_services()
@@ -63,6 +87,15 @@ class AppServiceInitializer:
 
         logger.info("Database initialized successfully")
 
+    async def initialize_request_services(self) -> None:
+        """Build the stateless services and default user shared by all requests."""
+        if not self.engine:
+            raise RuntimeError("Database must be initialized before request services")
+
+        self.paper_service = PaperService(self.settings)
+        self.star_service = StarService()
+        self.default_user = load_default_user(self.engine)
+
     async def initialize_crawler_services(
         self, arxiv_base_url: str | None = None
     ) -> None:
@@ -70,35 +103,61 @@ class AppServiceInitializer:
         if not self.engine:
             raise RuntimeError("Database must be initialized before crawler services")
 
+        # Shared connection pool for all arXiv traffic
+        self.http_client = create_arxiv_http_client(self.settings)
+
+        # One limiter paces every arXiv request of this process; the crawler
+        # worker, when enabled, paces its own share of the budget
+        self.arxiv_rate_limiter = AsyncTokenBucket(
+            rate=self.settings.api_arxiv_requests_per_second,
+            burst=self.settings.arxiv_burst,
+        )
+
         # Initialize ArXiv source explorer
         base_url = arxiv_base_url or self.settings.arxiv_api_base_url
-        self.arxiv_explorer = ArxivSourceExplorer(
-            api_base_url=base_url,
-            delay_seconds=self.settings.arxiv_delay_seconds,
-            max_results_per_request=self.settings.arxiv_max_results_per_request,
+        self.arxiv_explorer = create_arxiv_explorer(
+            self.settings, self.http_client, self.arxiv_rate_limiter, base_url
         )
 
-        # Initialize historical crawl manager only if enabled
-        if self.settings.historical_crawl_enabled:
-            self.historical_crawl_manager = HistoricalCrawlManager(
-                categories=self.settings.historical_crawl_categories,
-                rate_limit_delay=self.settings.historical_crawl_rate_limit_delay,
-                batch_size=self.settings.historical_crawl_batch_size,
+        if self.settings.crawler_worker_enabled:
+            # Crawling runs in the theark-crawler worker, controlled via its lease
+            logger.info("Crawling is delegated to the crawler worker process")
+            self.crawl_service = WorkerCrawlService(
+                CrawlerLeaseManager(
+                    self.engine, ttl_seconds=self.settings.crawler_lease_ttl
+                ),
+                categories=",".join(self.settings.historical_crawl_categories),
             )
         else:
-            logger.warning("Historical crawling is disabled")
-            self.historical_crawl_manager = None
-
-        # Initialize crawl service
-        self.crawl_service = (
-            CrawlService(self.historical_crawl_manager)
-            if self.historical_crawl_manager
-            else None
-        )
+            # Initialize historical crawl manager only if enabled
+            if self.settings.historical_crawl_enabled:
+                self.historical_crawl_manager = create_historical_crawl_manager(
+                    self.settings
+                )
+            else:
+                logger.warning("Historical crawling is disabled")
+                self.historical_crawl_manager = None
+
+            self.daily_crawl_manager = create_daily_crawl_manager(self.settings)
+            self.crawl_retry_manager = create_crawl_retry_manager(
+                self.settings, self.historical_crawl_manager
+            )
+
+            # Initialize crawl service
+            self.crawl_service = (
+                CrawlService(self.historical_crawl_manager)
+                if self.historical_crawl_manager
+                else None
+            )
 
         # Register ArXiv extractor
-        arxiv_extractor = ArxivExtractor(api_base_url=base_url)
+        arxiv_extractor = ArxivExtractor(
+            api_base_url=base_url,
+            http_client=self.http_client,
+            rate_limiter=self.arxiv_rate_limiter,
+        )
         register_extractor("arxiv", arxiv_extractor)
+        register_source_explorer("arxiv", self.arxiv_explorer)
 
     async def initialize_llm_services(
         self, llm_base_url: str | None = None, llm_api_key: str | None = None
@@ -160,6 +219,14 @@ class AppServiceInitializer:
         if self.historical_crawl_manager and self.arxiv_explorer:
             await self.historical_crawl_manager.start(self.arxiv_explorer, self.engine)
 
+        # Start daily crawl manager if available
+        if self.daily_crawl_manager and self.arxiv_explorer:
+            await self.daily_crawl_manager.start(self.arxiv_explorer, self.engine)
+
+        # Start crawl retry manager if available
+        if self.crawl_retry_manager and self.arxiv_explorer:
+            await self.crawl_retry_manager.start(self.arxiv_explorer, self.engine)
+
         # Start background batch manager if available
         if self.background_batch_manager:
             await self.background_batch_manager.start(
@@ -177,18 +244,37 @@ class AppServiceInitializer:
         if self.historical_crawl_manager:
             await self.historical_crawl_manager.stop()
 
+        # Stop daily crawl manager if available
+        if self.daily_crawl_manager:
+            await self.daily_crawl_manager.stop()
+
+        # Stop crawl retry manager if available
+        if self.crawl_retry_manager:
+            await self.crawl_retry_manager.stop()
+
         # Stop background batch manager if available
         if self.background_batch_manager:
             await self.background_batch_manager.stop()
 
+        # Close the shared HTTP connection pool
+        if self.http_client:
+            await self.http_client.aclose()
+            self.http_client = None
+
         logger.info("All background services stopped successfully")
 
     def _setup_app_state(self, app: FastAPI) -> None:
         """Configure app.state with initialized services."""
         # Store services in app.state for dependency injection
+        app.state.settings = self.settings
         app.state.engine = self.engine
+        app.state.paper_service = self.paper_service
+        app.state.star_service = self.star_service
+        app.state.default_user = self.default_user
         app.state.arxiv_explorer = self.arxiv_explorer
         app.state.historical_crawl_manager = self.historical_crawl_manager
+        app.state.daily_crawl_manager = self.daily_crawl_manager
+        app.state.crawl_retry_manager = self.crawl_retry_manager
         app.state.crawl_service = self.crawl_service
         app.state.summary_client = self.openai_client
         app.state.background_batch_manager = self.background_batch_manager
@@ -0,0 +1,19 @@
+"""Direct JSON encoding for already-validated response models."""
+
+from fastapi import Response, status
+from pydantic import BaseModel
+
+
+def model_json_response(
+    model: BaseModel, status_code: int = status.HTTP_200_OK
+) -> Response:
+    """Encode a response model straight to JSON bytes.
+
+    Returning a Response skips FastAPI's second validation pass against
+    ``response_model``; the model is serialized once by pydantic-core.
+    """
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -28,6 +28,14 @@ class Settings(BaseModel):
         default=["*"], description="Allowed CORS origins"
     )
 
+    # Response Compression Settings
+    gzip_minimum_size: int = Field(
+        default=1000, description="Minimum response size in bytes to gzip"
+    )
+    gzip_compress_level: int = Field(
+        default=6, ge=1, le=9, description="Gzip compression level (1-9)"
+    )
+
     # Auth Settings
     auth_required: bool = Field(
         default=False, description="Whether authentication is required"
@@ -64,6 +72,51 @@ class Settings(BaseModel):
     arxiv_max_results_per_request: int = Field(
         default=100, description="Maximum results per ArXiv API request"
     )
+    arxiv_requests_per_second: float = Field(
+        default=1 / 3,
+        gt=0,
+        description="Sustained request rate shared by all ArXiv traffic, "
+        "split between the API and the crawler worker when the worker is enabled",
+    )
+    arxiv_burst: int = Field(
+        default=1,
+        ge=1,
+        description="Requests that may start back to back, per process",
+    )
+    arxiv_http_max_connections: int = Field(
+        default=10, ge=1, description="Connection pool size for ArXiv HTTP requests"
+    )
+    arxiv_http_max_keepalive_connections: int = Field(
+        default=5, ge=0, description="Idle keep-alive connections kept in the pool"
+    )
+    arxiv_http_keepalive_expiry: float = Field(
+        default=30.0, description="Seconds an idle keep-alive connection is kept"
+    )
+    arxiv_http_connect_timeout: float = Field(
+        default=10.0, description="Connect timeout for ArXiv HTTP requests in seconds"
+    )
+    arxiv_http_read_timeout: float = Field(
+        default=30.0, description="Read timeout for ArXiv HTTP requests in seconds"
+    )
+    arxiv_http2: bool = Field(
+        default=False, description="Use HTTP/2 for ArXiv requests when available"
+    )
+    arxiv_cache_enabled: bool = Field(
+        default=False, description="Cache raw ArXiv feed pages on disk"
+    )
+    arxiv_cache_dir: str = Field(
+        default="db/arxiv_cache", description="Directory of the ArXiv response cache"
+    )
+    arxiv_cache_recent_ttl_seconds: float = Field(
+        default=3600.0,
+        ge=0,
+        description="Freshness in seconds of cached pages for recent dates",
+    )
+    arxiv_cache_immutable_after_days: int = Field(
+        default=7,
+        ge=0,
+        description="Days after which cached pages of a date range never expire",
+    )
 
     # Historical Crawl Settings
     historical_crawl_enabled: bool = Field(
@@ -77,11 +130,72 @@ class Settings(BaseModel):
         default=None, description="Start date for historical crawling (YYYY-MM-DD)"
     )
     historical_crawl_rate_limit_delay: float = Field(
-        default=10.0, description="Delay between historical crawl requests in seconds"
+        default=10.0, description="Backoff after a failed historical crawl in seconds"
     )
     historical_crawl_batch_size: int = Field(
         default=100, description="Number of papers per historical crawl request"
     )
+    historical_crawl_max_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Date/category work units crawled concurrently",
+    )
+    historical_crawl_max_window_days: int = Field(
+        default=7,
+        ge=1,
+        description="Maximum days one adaptive historical crawl query may cover",
+    )
+    historical_crawl_combine_categories: bool = Field(
+        default=True,
+        description="Query all historical crawl categories of a day with one OR query",
+    )
+
+    # Daily Crawl Settings
+    daily_crawl_enabled: bool = Field(
+        default=False, description="Whether polling for new submissions is enabled"
+    )
+    daily_crawl_interval: float = Field(
+        default=3600.0, gt=0, description="Seconds between new-submission polls"
+    )
+    daily_crawl_lookback_days: int = Field(
+        default=2,
+        ge=1,
+        description="Days polled for a category without stored papers",
+    )
+
+    # Crawl Retry Settings
+    crawl_retry_enabled: bool = Field(
+        default=False, description="Whether failed papers and units are retried"
+    )
+    crawl_retry_interval: float = Field(
+        default=300.0, gt=0, description="Seconds between crawl retry cycles"
+    )
+    crawl_retry_base_delay: float = Field(
+        default=600.0,
+        gt=0,
+        description="Backoff before the first retry, doubled on each failed retry",
+    )
+    crawl_retry_max_retries: int = Field(
+        default=5, ge=0, description="Retries before a crawl failure is given up"
+    )
+
+    # Crawler Worker Settings
+    crawler_worker_enabled: bool = Field(
+        default=False,
+        description="Whether crawling runs in the theark-crawler worker process",
+    )
+    crawler_lease_ttl: float = Field(
+        default=60.0, gt=0, description="Seconds a crawler lease lasts unrenewed"
+    )
+    crawler_poll_interval: float = Field(
+        default=5.0, gt=0, description="Seconds between crawler lease renewals"
+    )
+    crawler_worker_rate_share: float = Field(
+        default=0.75,
+        gt=0,
+        lt=1,
+        description="Share of the ArXiv request rate given to the crawler worker",
+    )
 
     # LLM Settings
     llm_api_key: str = Field(
@@ -163,6 +277,22 @@ class Settings(BaseModel):
         """
         return self.arxiv_api_base_url
 
+    @property
+    def api_arxiv_requests_per_second(self) -> float:
+        """Get the ArXiv request rate of the API process.
+
+        The API and the crawler worker pace requests with separate limiters,
+        so with the worker enabled each takes its share of the one budget.
+        """
+        if not self.crawler_worker_enabled:
+            return self.arxiv_requests_per_second
+        return self.arxiv_requests_per_second * (1 - self.crawler_worker_rate_share)
+
+    @property
+    def worker_arxiv_requests_per_second(self) -> float:
+        """Get the ArXiv request rate of the crawler worker process."""
+        return self.arxiv_requests_per_second * self.crawler_worker_rate_share
+
     @property
     def default_interests_list(self) -> list[str]:
         """Get default interests as a list."""
@@ -206,6 +336,20 @@ def load_settings() -> Settings:
     # Use the same categories as preset_categories for consistency
     arxiv_categories = preset_categories
 
+    arxiv_http2 = os.getenv("THEARK_ARXIV_HTTP2", "false").lower() in [
+        "true",
+        "1",
+        "yes",
+        "on",
+    ]
+
+    arxiv_cache_enabled = os.getenv("THEARK_ARXIV_CACHE_ENABLED", "false").lower() in [
+        "true",
+        "1",
+        "yes",
+        "on",
+    ]
+
     # Parse Historical Crawl settings
     historical_crawl_enabled = os.getenv(
         "THEARK_HISTORICAL_CRAWL_ENABLED", "false"
@@ -219,12 +363,44 @@ def load_settings() -> Settings:
     historical_crawl_batch_size = int(
         os.getenv("THEARK_HISTORICAL_CRAWL_BATCH_SIZE", "100")
     )
+    historical_crawl_max_concurrency = int(
+        os.getenv("THEARK_HISTORICAL_CRAWL_MAX_CONCURRENCY", "4")
+    )
+    historical_crawl_max_window_days = int(
+        os.getenv("THEARK_HISTORICAL_CRAWL_MAX_WINDOW_DAYS", "7")
+    )
+    historical_crawl_combine_categories = os.getenv(
+        "THEARK_HISTORICAL_CRAWL_COMBINE_CATEGORIES", "true"
+    ).lower() in ["true", "1", "yes", "on"]
+
+    # Parse Daily Crawl settings
+    daily_crawl_enabled = os.getenv("THEARK_DAILY_CRAWL_ENABLED", "false").lower() in [
+        "true",
+        "1",
+        "yes",
+        "on",
+    ]
+
+    # Parse Crawl Retry settings
+    crawl_retry_enabled = os.getenv("THEARK_CRAWL_RETRY_ENABLED", "false").lower() in [
+        "true",
+        "1",
+        "yes",
+        "on",
+    ]
+
+    # Parse Crawler Worker settings
+    crawler_worker_enabled = os.getenv(
+        "THEARK_CRAWLER_WORKER_ENABLED", "false"
+    ).lower() in ["true", "1", "yes", "on"]
 
     return Settings(
         environment=Environment(os.getenv("THEARK_ENV", "development")),
         api_title=os.getenv("THEARK_API_TITLE", "TheArk API"),
         api_version=os.getenv("THEARK_API_VERSION", "1.0.0"),
         cors_allow_origins=cors_origins,
+        gzip_minimum_size=int(os.getenv("THEARK_GZIP_MINIMUM_SIZE", "1000")),
+        gzip_compress_level=int(os.getenv("THEARK_GZIP_COMPRESS_LEVEL", "6")),
         auth_required=auth_required,
         auth_header_name=os.getenv("THEARK_AUTH_HEADER", "Authorization"),
         log_level=os.getenv("THEARK_LOG_LEVEL", "INFO").upper(),
@@ -236,6 +412,34 @@ def load_settings() -> Settings:
         arxiv_api_base_url=os.getenv(
             "THEARK_ARXIV_API_BASE_URL", "https://export.arxiv.org/api/query"
         ),
+        arxiv_requests_per_second=float(
+            os.getenv("THEARK_ARXIV_REQUESTS_PER_SECOND", str(1 / 3))
+        ),
+        arxiv_burst=int(os.getenv("THEARK_ARXIV_BURST", "1")),
+        arxiv_http_max_connections=int(
+            os.getenv("THEARK_ARXIV_HTTP_MAX_CONNECTIONS", "10")
+        ),
+        arxiv_http_max_keepalive_connections=int(
+            os.getenv("THEARK_ARXIV_HTTP_MAX_KEEPALIVE_CONNECTIONS", "5")
+        ),
+        arxiv_http_keepalive_expiry=float(
+            os.getenv("THEARK_ARXIV_HTTP_KEEPALIVE_EXPIRY", "30.0")
+        ),
+        arxiv_http_connect_timeout=float(
+            os.getenv("THEARK_ARXIV_HTTP_CONNECT_TIMEOUT", "10.0")
+        ),
+        arxiv_http_read_timeout=float(
+            os.getenv("THEARK_ARXIV_HTTP_READ_TIMEOUT", "30.0")
+        ),
+        arxiv_http2=arxiv_http2,
+        arxiv_cache_enabled=arxiv_cache_enabled,
+        arxiv_cache_dir=os.getenv("THEARK_ARXIV_CACHE_DIR", "db/arxiv_cache"),
+        arxiv_cache_recent_ttl_seconds=float(
+            os.getenv("THEARK_ARXIV_CACHE_RECENT_TTL_SECONDS", "3600.0")
+        ),
+        arxiv_cache_immutable_after_days=int(
+            os.getenv("THEARK_ARXIV_CACHE_IMMUTABLE_AFTER_DAYS", "7")
+        ),
         llm_api_key=os.getenv("OPENAI_API_KEY", "*"),
         llm_model=os.getenv("THEARK_LLM_MODEL", "gpt-4o-mini"),
         llm_api_base_url=os.getenv(
@@ -255,6 +459,26 @@ def load_settings() -> Settings:
         historical_crawl_start_date=historical_crawl_start_date,
         historical_crawl_rate_limit_delay=historical_crawl_rate_limit_delay,
         historical_crawl_batch_size=historical_crawl_batch_size,
+        historical_crawl_max_concurrency=historical_crawl_max_concurrency,
+        historical_crawl_max_window_days=historical_crawl_max_window_days,
+        daily_crawl_enabled=daily_crawl_enabled,
+        daily_crawl_interval=float(os.getenv("THEARK_DAILY_CRAWL_INTERVAL", "3600.0")),
+        daily_crawl_lookback_days=int(
+            os.getenv("THEARK_DAILY_CRAWL_LOOKBACK_DAYS", "2")
+        ),
+        historical_crawl_combine_categories=historical_crawl_combine_categories,
+        crawl_retry_enabled=crawl_retry_enabled,
+        crawl_retry_interval=float(os.getenv("THEARK_CRAWL_RETRY_INTERVAL", "300.0")),
+        crawl_retry_base_delay=float(
+            os.getenv("THEARK_CRAWL_RETRY_BASE_DELAY", "600.0")
+        ),
+        crawl_retry_max_retries=int(os.getenv("THEARK_CRAWL_RETRY_MAX_RETRIES", "5")),
+        crawler_worker_enabled=crawler_worker_enabled,
+        crawler_lease_ttl=float(os.getenv("THEARK_CRAWLER_LEASE_TTL", "60.0")),
+        crawler_poll_interval=float(os.getenv("THEARK_CRAWLER_POLL_INTERVAL", "5.0")),
+        crawler_worker_rate_share=float(
+            os.getenv("THEARK_CRAWLER_WORKER_RATE_SHARE", "0.75")
+        ),
     )
 
 
@@ -1,13 +1,19 @@
 """Database engine factory for SQLModel."""
 
 from pathlib import Path
+from typing import Any
 
+from sqlalchemy import text
 from sqlalchemy.engine import Engine
-from sqlmodel import SQLModel, create_engine
+from sqlmodel import Session, SQLModel, col, create_engine, select
 
 from core.log import get_logger
 from core.models.rows import (
     ArxivFailedPaper,
+    CrawlCheckpoint,
+    CrawlCompletion,
+    CrawlerLease,
+    CrawlFailedUnit,
     LLMBatchRequest,
     LLMRequest,
     Paper,
@@ -18,9 +24,16 @@ from core.models.rows import (
     UserStar,
 )
 from core.types import Environment
+from core.utils import split_arxiv_version
 
 logger = get_logger(__name__)
 
+# Data migrations applied so far, stored in SQLite's ``PRAGMA user_version``.
+# 1: arXiv IDs without version suffix
+# 2: index on crawl completion categories
+# 3: index on paper submission times
+SCHEMA_VERSION = 3
+
 
 def setup_database_url(environment: Environment, db_path: Path | None = None) -> str:
     """Construct database URL based on environment configuration.
@@ -106,10 +119,99 @@ def create_database_tables(engine: Engine) -> None:
         UserStar,
         LLMRequest,
         LLMBatchRequest,
+        CrawlFailedUnit,
+        CrawlCompletion,
+        CrawlCheckpoint,
+        CrawlerLease,
     ]
     for model in row_models:
         logger.info(f"> Created table for {model.__tablename__}")
 
+    migrate_database(engine)
+
+
+def migrate_database(engine: Engine) -> int:
+    """Apply the data migrations newer than the stored schema version.
+
+    The version is kept in ``PRAGMA user_version``, so a database that is up
+    to date is not scanned again on startup.
+
+    Args:
+        engine: Database engine
+
+    Returns:
+        Schema version before the migration
+    """
+    with engine.begin() as connection:
+        stored_version = connection.execute(text("PRAGMA user_version")).scalar_one()
+    if stored_version >= SCHEMA_VERSION:
+        return int(stored_version)
+
+    if stored_version < 1:
+        normalize_arxiv_ids(engine)
+
+    with engine.begin() as connection:
+        if stored_version < 2:
+            # create_all only indexes tables it creates
+            for index in CrawlCompletion.__table__.indexes:  # type: ignore
+                index.create(connection, checkfirst=True)
+        if stored_version < 3:
+            for index in Paper.__table__.indexes:  # type: ignore
+                index.create(connection, checkfirst=True)
+        connection.execute(text(f"PRAGMA user_version = {SCHEMA_VERSION}"))
+    logger.info(f"Migrated database from version {stored_version} to {SCHEMA_VERSION}")
+    return int(stored_version)
+
+
+def normalize_arxiv_ids(engine: Engine) -> int:
+    """Strip version suffixes from arXiv IDs of rows stored before versioning.
+
+    Such rows keep an ID like "2501.00001v1", which the version-aware upsert
+    would not match, so the paper would be stored twice. They are renamed to
+    the bare ID with the suffix moved to ``latest_version``. A row whose bare
+    ID is taken already is left alone and logged.
+
+    Args:
+        engine: Database engine
+
+    Returns:
+        Number of renamed rows
+    """
+    with Session(engine) as session:
+        legacy: dict[str, tuple[int, int]] = {}
+        for paper_id, arxiv_id, latest_version in session.exec(
+            select(Paper.paper_id, Paper.arxiv_id, Paper.latest_version).where(
+                col(Paper.arxiv_id).like("%v%")
+            )
+        ).all():
+            bare_id, version = split_arxiv_version(arxiv_id)
+            if paper_id is None or bare_id == arxiv_id:
+                continue
+            version = max(version, latest_version)
+            if bare_id not in legacy or version > legacy[bare_id][1]:
+                legacy[bare_id] = (paper_id, version)
+        if not legacy:
+            return 0
+
+        taken = set(
+            session.exec(
+                select(Paper.arxiv_id).where(col(Paper.arxiv_id).in_(list(legacy)))
+            ).all()
+        )
+        for bare_id in sorted(taken):
+            logger.warning(f"Keeping versioned row of {bare_id}, bare ID is stored")
+        renames: list[dict[str, Any]] = [
+            {"paper_id": paper_id, "arxiv_id": bare_id, "latest_version": version}
+            for bare_id, (paper_id, version) in legacy.items()
+            if bare_id not in taken
+        ]
+        if renames:
+            session.bulk_update_mappings(Paper, renames)
+            session.commit()
+
+    logger.info(f"Normalized {len(renames)} versioned arXiv IDs")
+    return len(renames)
+
 
 def drop_database_tables(engine: Engine) -> None:
     """Drop all database tables (use with caution)."""
@@ -31,6 +31,23 @@ class BaseRepository(Generic[T]):
 
         return obj
 
+    def create_many(self, objs: list[T]) -> list[T]:
+        """Insert several objects in one transaction."""
+        if not objs:
+            return []
+        try:
+            self.db.add_all(objs)
+            self.db.commit()
+            for obj in objs:
+                self.db.refresh(obj)
+            logger.debug(f"Created {len(objs)} {self.model.__name__} rows")
+        except Exception as exc:
+            self.db.rollback()
+            logger.error(f"Failed to create {len(objs)} rows: {exc}")
+            raise
+
+        return objs
+
     def get_by_id(self, obj_id: int) -> T | None:
         # Get the primary key field name
         pk_field = None
@@ -1,8 +1,11 @@
 """Paper repository using SQLModel with dependency injection."""
 
+from collections.abc import Iterator
 from typing import Any
 
-from sqlmodel import Session, desc, func, select
+from sqlalchemy import and_, case, exists
+from sqlalchemy.orm import aliased
+from sqlmodel import Session, col, desc, func, select
 
 from core.database.repository.base import BaseRepository
 from core.database.repository.summary import SummaryRepository
@@ -36,6 +39,21 @@ class PaperRepository(BaseRepository[Paper]):
         result = self.db.exec(statement)
         return result.first()
 
+    def get_by_arxiv_ids(self, arxiv_ids: list[str]) -> list[Paper]:
+        """Get papers by arXiv IDs (batch operation).
+
+        Args:
+            arxiv_ids: arXiv IDs to look up
+
+        Returns:
+            Papers found, in no particular order
+        """
+        if not arxiv_ids:
+            return []
+
+        statement = select(Paper).where(Paper.arxiv_id.in_(arxiv_ids))  # type: ignore
+        return list(self.db.exec(statement).all())
+
     def get_papers_with_summaries(
         self,
         skip: int = 0,
@@ -419,6 +437,187 @@ class PaperRepository(BaseRepository[Paper]):
         # Use optimized version
         return self.get_papers_with_overview_optimized(skip, limit, language)
 
+    def iter_papers_with_overview(
+        self,
+        user_id: int | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        language: str = "Korean",
+        yield_per: int = 20,
+    ) -> Iterator[PaperListItemResponse]:
+        """Yield list items as the database cursor produces them.
+
+        Summary overview (requested language, else English) and user flags are
+        resolved in the same statement, so rows can be emitted one by one.
+
+        Args:
+            user_id: User ID for star/read status
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            language: Preferred summary language
+            yield_per: Number of rows fetched from the cursor at a time
+
+        Yields:
+            PaperListItemResponse for each paper in page order
+        """
+        # Page first, so offset and limit count papers, not joined rows
+        page_ids = (
+            select(Paper.paper_id)
+            .order_by(desc(Paper.updated_at), desc(Paper.paper_id))
+            .offset(skip)
+            .limit(limit)
+        )
+        # One summary per paper: the newest in ``language``, else in English
+        ranked = (
+            select(
+                Summary,
+                func.row_number()
+                .over(
+                    partition_by=col(Summary.paper_id),
+                    order_by=(
+                        case((col(Summary.language) == language, 0), else_=1),
+                        desc(Summary.summary_id),
+                    ),
+                )
+                .label("rank"),
+            )
+            .where(
+                col(Summary.paper_id).in_(page_ids),
+                col(Summary.language).in_([language, "English"]),
+            )
+            .subquery()
+        )
+        best = aliased(Summary, ranked)
+        is_starred = exists().where(
+            (col(UserStar.user_id) == user_id)
+            & (col(UserStar.paper_id) == Paper.paper_id)
+        )
+        is_read = exists().where(
+            (col(SummaryRead.user_id) == user_id)
+            & (col(SummaryRead.summary_id) == best.summary_id)
+        )
+        # sqlmodel's select() is only typed for up to four columns
+        statement = (
+            select(  # type: ignore
+                Paper,
+                best.overview,
+                best.relevance,
+                best.summary_id,
+                is_starred,
+                is_read,
+            )
+            .outerjoin(
+                best,
+                and_(col(best.paper_id) == Paper.paper_id, ranked.c.rank == 1),
+            )
+            .where(col(Paper.paper_id).in_(page_ids))
+            .order_by(desc(Paper.updated_at), desc(Paper.paper_id))
+            .execution_options(yield_per=yield_per)
+        )
+
+        for paper, overview, relevance, found_id, starred, read in self.db.exec(
+            statement
+        ):
+            yield PaperListItemResponse.from_paper_with_overview(
+                paper=paper,
+                overview=overview,
+                has_summary=found_id is not None,
+                relevance=relevance,
+                is_starred=bool(starred),
+                is_read=bool(read),
+            )
+
+    def get_paper_detail(
+        self,
+        paper_id: int | None = None,
+        arxiv_id: str | None = None,
+        user_id: int | None = None,
+        language: str = "Korean",
+    ) -> tuple[Paper, Summary | None, bool, bool] | None:
+        """Get a paper with its best summary and user flags in one statement.
+
+        Summaries of the paper are ranked with ROW_NUMBER, preferring the
+        requested language over English and newer summaries over older ones;
+        only the top-ranked one is joined.
+
+        Args:
+            paper_id: Paper ID to look up
+            arxiv_id: arXiv ID to look up when paper_id is not given
+            user_id: User ID for star/read status
+            language: Preferred summary language
+
+        Returns:
+            Tuple of (paper, summary, is_starred, is_read), or None if not found
+        """
+        if paper_id is not None:
+            paper_filter = Paper.paper_id == paper_id
+        elif arxiv_id is not None:
+            paper_filter = Paper.arxiv_id == arxiv_id
+        else:
+            raise ValueError("Either paper_id or arxiv_id is required")
+
+        ranked = (
+            select(
+                Summary,
+                func.row_number()
+                .over(
+                    partition_by=col(Summary.paper_id),
+                    order_by=(
+                        case((col(Summary.language) == language, 0), else_=1),
+                        desc(Summary.summary_id),
+                    ),
+                )
+                .label("rank"),
+            )
+            .where(
+                Summary.paper_id.in_(  # type: ignore
+                    select(Paper.paper_id).where(paper_filter)
+                ),
+                Summary.language.in_([language, "English"]),  # type: ignore
+            )
+            .subquery()
+        )
+        best = aliased(Summary, ranked)
+        is_starred = exists().where(
+            (col(UserStar.user_id) == user_id)
+            & (col(UserStar.paper_id) == Paper.paper_id)
+        )
+        is_read = exists().where(
+            (col(SummaryRead.user_id) == user_id)
+            & (col(SummaryRead.summary_id) == best.summary_id)
+        )
+        statement = (
+            select(Paper, best, is_starred, is_read)
+            .outerjoin(
+                best,
+                and_(col(best.paper_id) == Paper.paper_id, ranked.c.rank == 1),
+            )
+            .where(paper_filter)
+        )
+
+        row = self.db.exec(statement).first()
+        if row is None:
+            return None
+        paper, summary, starred, read = row
+        return paper, summary, bool(starred), bool(read)
+
+    def get_existing_paper_ids(self, paper_ids: list[int]) -> set[int]:
+        """Get the subset of paper IDs that exist (batch operation).
+
+        Args:
+            paper_ids: Paper IDs to check
+
+        Returns:
+            Set of paper IDs present in the database
+        """
+        if not paper_ids:
+            return set()
+
+        statement = select(Paper.paper_id).where(
+            Paper.paper_id.in_(paper_ids)  # type: ignore
+        )
+        return set(self.db.exec(statement).all())  # type: ignore[arg-type]
+
     def get_papers_by_status(
         self, status: str, skip: int = 0, limit: int = 100
     ) -> list[Paper]:
@@ -1,10 +1,11 @@
 """Summary repository using SQLModel with dependency injection."""
 
-from sqlmodel import Session, select
+from sqlmodel import Session, col, func, select
 
 from core.database.repository.base import BaseRepository
 from core.log import get_logger
 from core.models.rows import Summary
+from core.utils import get_current_timestamp
 
 logger = get_logger(__name__)
 
@@ -109,29 +110,88 @@ class SummaryRepository(BaseRepository[Summary]):
             if summary.paper_id is not None
         }
 
+    def get_summary_ids_by_paper_ids(
+        self, paper_ids: list[int], language: str
+    ) -> dict[int, int]:
+        """Get the latest summary ID per paper for a language (batch operation).
+
+        Args:
+            paper_ids: List of paper IDs
+            language: Summary language
+
+        Returns:
+            Dictionary mapping paper_id to summary_id
+        """
+        if not paper_ids:
+            return {}
+
+        statement = (
+            select(Summary.paper_id, func.max(Summary.summary_id))
+            .where(
+                (col(Summary.paper_id).in_(paper_ids)) & (Summary.language == language)
+            )
+            .group_by(col(Summary.paper_id))
+        )
+        return {
+            paper_id: summary_id
+            for paper_id, summary_id in self.db.exec(statement).all()
+            if paper_id is not None and summary_id is not None
+        }
+
     def create_summaries_bulk(self, summaries: list[Summary]) -> list[Summary]:
         """Create multiple summaries in a single operation.
 
+        A paper that already has a summary in the same language (e.g. one
+        re-queued after a version bump) gets that row overwritten in place
+        instead of a second summary, so each paper keeps one per language.
+
         Args:
             summaries: List of Summary objects to create
 
         Returns:
-            List of created Summary objects with IDs
+            List of created or updated Summary objects with IDs
         """
         if not summaries:
             return []
 
         try:
-            # Bulk insert all summaries
-            self.db.add_all(summaries)
+            paper_ids = [s.paper_id for s in summaries if s.paper_id is not None]
+            languages = {s.language for s in summaries}
+            stored: dict[tuple[int | None, str], Summary] = {}
+            for row in self.db.exec(
+                select(Summary)
+                .where(
+                    col(Summary.paper_id).in_(paper_ids),
+                    col(Summary.language).in_(languages),
+                )
+                .order_by(col(Summary.summary_id))
+            ).all():
+                # The newest row wins if duplicates were stored earlier
+                stored[(row.paper_id, row.language)] = row
+
+            saved: list[Summary] = []
+            for summary in summaries:
+                existing = stored.get((summary.paper_id, summary.language))
+                if existing is None:
+                    stored[(summary.paper_id, summary.language)] = summary
+                    self.db.add(summary)
+                    saved.append(summary)
+                    continue
+                existing.sqlmodel_update(
+                    summary.model_dump(exclude={"summary_id", "updated_at"})
+                )
+                existing.updated_at = get_current_timestamp()
+                self.db.add(existing)
+                if existing not in saved:
+                    saved.append(existing)
             self.db.commit()
 
             # Refresh all summaries to get generated IDs
-            for summary in summaries:
+            for summary in saved:
                 self.db.refresh(summary)
 
-            logger.info(f"Created {len(summaries)} summaries in bulk operation")
-            return summaries
+            logger.info(f"Saved {len(saved)} summaries in bulk operation")
+            return saved
 
         except Exception as e:
             logger.error(f"Error creating summaries in bulk: {e}")
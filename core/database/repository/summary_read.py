@@ -62,6 +62,33 @@ class SummaryReadRepository(BaseRepository[SummaryRead]):
         result = self.db.exec(statement)
         return list(result.all())
 
+    def mark_many_as_read(self, user_id: int, summary_ids: list[int]) -> None:
+        """Mark several summaries as read in a single transaction.
+
+        Summaries that are already read are left untouched.
+
+        Args:
+            user_id: User ID
+            summary_ids: Summary IDs to mark as read
+        """
+        already_read = set(self.get_read_summary_ids(user_id, summary_ids))
+        read_at = datetime.now(UTC).isoformat()
+        new_records = [
+            SummaryRead(user_id=user_id, summary_id=summary_id, read_at=read_at)
+            for summary_id in dict.fromkeys(summary_ids)
+            if summary_id not in already_read
+        ]
+        if not new_records:
+            return
+
+        try:
+            self.db.add_all(new_records)
+            self.db.commit()
+        except Exception as exc:
+            self.db.rollback()
+            logger.error(f"Failed to mark summaries as read for user {user_id}: {exc}")
+            raise
+
     def get_read_summary_ids(self, user_id: int, summary_ids: list[int]) -> list[int]:
         """Get list of summary IDs that are read by user (batch operation).
 
@@ -1,6 +1,6 @@
 """User repository using SQLModel with dependency injection."""
 
-from sqlmodel import Session, func, select
+from sqlmodel import Session, col, delete, func, select
 
 from core.database.repository.base import BaseRepository
 from core.log import get_logger
@@ -29,6 +29,26 @@ class UserRepository(BaseRepository[User]):
         result = self.db.exec(statement)
         return result.first()
 
+    def get_or_create(
+        self, user_id: int, email: str, display_name: str | None = None
+    ) -> User:
+        """Get user by ID, creating it if missing.
+
+        Args:
+            user_id: User ID
+            email: Email used when the user has to be created
+            display_name: Display name used when the user has to be created
+
+        Returns:
+            Existing or newly created user
+        """
+        user = self.get_by_id(user_id)
+        if user:
+            return user
+        return self.create(
+            User(user_id=user_id, email=email, display_name=display_name)
+        )
+
 
 class UserInterestRepository(BaseRepository[UserInterest]):
     """User interest repository using SQLModel with dependency injection."""
@@ -191,6 +211,42 @@ class UserStarRepository(BaseRepository[UserStar]):
         result = self.db.exec(statement)
         return result.first()
 
+    def apply_star_changes(
+        self,
+        user_id: int,
+        to_star: dict[int, str | None],
+        to_unstar: set[int],
+    ) -> None:
+        """Insert and delete user stars in a single transaction.
+
+        Deletes run before inserts so a paper can be re-starred with a new note.
+
+        Args:
+            user_id: User ID
+            to_star: Mapping of paper ID to note for stars to insert
+            to_unstar: Paper IDs whose stars should be removed
+        """
+        try:
+            if to_unstar:
+                self.db.exec(
+                    delete(UserStar).where(
+                        (col(UserStar.user_id) == user_id)
+                        & (col(UserStar.paper_id).in_(to_unstar))
+                    )
+                )
+            if to_star:
+                self.db.add_all(
+                    [
+                        UserStar(user_id=user_id, paper_id=paper_id, note=note)
+                        for paper_id, note in to_star.items()
+                    ]
+                )
+            self.db.commit()
+        except Exception as exc:
+            self.db.rollback()
+            logger.error(f"Failed to apply star changes for user {user_id}: {exc}")
+            raise
+
     def get_starred_papers_count(self, user_id: int) -> int:
         stmt = (
             select(func.count())
@@ -10,7 +10,12 @@ from core.extractors.exceptions import (
     ParsingError,
     UnsupportedURLError,
 )
-from core.models.domain.paper_extraction import PaperMetadata
+from core.extractors.source_crawl_scheduler import SourceCrawlScheduler
+from core.models.domain.paper_extraction import (
+    PaperMetadata,
+    SourceCrawlConfig,
+    SourceCrawlResult,
+)
 
 __all__ = [
     # Base classes
@@ -23,7 +28,11 @@ __all__ = [
     "NetworkError",
     "ParsingError",
     "UnsupportedURLError",
+    # Scheduling
+    "SourceCrawlScheduler",
     # Models
     "PaperMetadata",
+    "SourceCrawlConfig",
+    "SourceCrawlResult",
     "ArxivExtractor",
 ]
@@ -1,13 +1,22 @@
 """Base classes for paper extractors."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
+from core.extractors.exceptions import ExtractorError
+from core.log import get_logger
 from core.models.domain.paper_extraction import PaperMetadata
 
+logger = get_logger(__name__)
+
 
 class BaseExtractor(ABC):
     """Base class for all paper extractors."""
 
+    # URL hosts (including their subdomains) the factory routes to this
+    # extractor; extractors without hosts are found by ``can_extract``
+    hosts: tuple[str, ...] = ()
+
     @abstractmethod
     def can_extract(self, url: str) -> bool:
         """Check if this extractor can handle the given URL.
@@ -35,6 +44,26 @@ class BaseExtractor(ABC):
         """
         pass
 
+    def extract_identifiers(self, urls: Sequence[str]) -> dict[str, str]:
+        """Extract identifiers from several URLs.
+
+        The default implementation calls ``extract_identifier`` once per
+        URL; extractors override it with a cheaper batch pass.
+
+        Args:
+            urls: URLs to extract identifiers from
+
+        Returns:
+            Identifier keyed by URL; URLs with an invalid format are absent
+        """
+        identifiers: dict[str, str] = {}
+        for url in urls:
+            try:
+                identifiers[url] = self.extract_identifier(url)
+            except (ExtractorError, ValueError):
+                continue
+        return identifiers
+
     @abstractmethod
     async def extract_metadata_async(self, url: str) -> PaperMetadata:
         """Extract paper metadata from URL asynchronously.
@@ -50,6 +79,28 @@ class BaseExtractor(ABC):
         """
         pass
 
+    async def extract_metadata_many(
+        self, urls: Sequence[str]
+    ) -> dict[str, PaperMetadata]:
+        """Extract metadata for several URLs.
+
+        The default implementation calls ``extract_metadata_async`` once per
+        URL; extractors whose source supports batch lookups override it.
+
+        Args:
+            urls: URLs to extract metadata from
+
+        Returns:
+            Metadata keyed by URL; URLs that could not be extracted are absent
+        """
+        results: dict[str, PaperMetadata] = {}
+        for url in dict.fromkeys(urls):
+            try:
+                results[url] = await self.extract_metadata_async(url)
+            except (ExtractorError, ValueError) as e:
+                logger.warning(f"Failed to extract metadata from {url}: {e}")
+        return results
+
     def get_source_name(self) -> str:
         """Get the name of the source this extractor handles.
 
@@ -62,7 +113,8 @@ class BaseExtractor(ABC):
 class BaseSourceExplorer(ABC):
     """Base class for paper source exploration.
 
-    This is for future implementation of bulk paper discovery.
+    Explorers registered with ``register_source_explorer`` are crawled by
+    the ``SourceCrawlScheduler``.
     """
 
     @abstractmethod
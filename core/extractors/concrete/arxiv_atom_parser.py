@@ -0,0 +1,168 @@
+"""Streaming parser for arXiv Atom feeds."""
+
+import re
+import xml.etree.ElementTree as ElementTree
+from collections.abc import Iterator
+from datetime import datetime
+
+from core.extractors.exceptions import ParsingError
+from core.log import get_logger
+from core.models.domain.arxiv import ArxivPaper
+from core.utils import split_arxiv_version
+
+logger = get_logger(__name__)
+
+ARXIV_NAMESPACE = "http://arxiv.org/schemas/atom"
+
+# Entry id prefix; what follows may contain a slash (abs/cs/0112017v1)
+_ENTRY_ID_PREFIX = re.compile(r"^https?://(?:export\.)?arxiv\.org/abs/")
+
+# Characters fed to the pull parser at a time; the document is never copied
+FEED_CHUNK_SIZE = 64 * 1024
+
+
+class _AtomTags:
+    """Fully qualified tag names, resolved once per feed."""
+
+    def __init__(self, atom_prefix: str) -> None:
+        self.entry = f"{atom_prefix}entry"
+        self.id = f"{atom_prefix}id"
+        self.title = f"{atom_prefix}title"
+        self.summary = f"{atom_prefix}summary"
+        self.author = f"{atom_prefix}author"
+        self.name = f"{atom_prefix}name"
+        self.category = f"{atom_prefix}category"
+        self.published = f"{atom_prefix}published"
+        self.updated = f"{atom_prefix}updated"
+        self.primary_category = f"{{{ARXIV_NAMESPACE}}}primary_category"
+
+
+def iter_atom_papers(xml_content: str) -> Iterator[ArxivPaper]:
+    """Yield papers from an arXiv Atom feed one entry at a time.
+
+    The feed is fed to a pull parser in chunks. Each finished ``entry`` is
+    converted in a single pass over its children and then cleared, so
+    memory stays at one entry plus the papers the caller keeps. The Atom
+    namespace is taken from the root element, so feeds with and without a
+    default namespace parse alike.
+
+    Args:
+        xml_content: Raw Atom XML
+
+    Yields:
+        ArxivPaper for each entry that could be parsed
+
+    Raises:
+        ParsingError: If the content is empty or is not well-formed XML
+    """
+    if not xml_content or not xml_content.strip():
+        raise ParsingError("Empty XML content provided")
+
+    parser: ElementTree.XMLPullParser[ElementTree.Element] = ElementTree.XMLPullParser(
+        events=("start", "end")
+    )
+    root: ElementTree.Element | None = None
+    tags = _AtomTags("")
+
+    try:
+        for offset in range(0, len(xml_content), FEED_CHUNK_SIZE):
+            parser.feed(xml_content[offset : offset + FEED_CHUNK_SIZE])
+            for parser_event in parser.read_events():
+                # Only start and end events are requested, which carry elements
+                event, element = parser_event[0], parser_event[-1]
+                if not isinstance(element, ElementTree.Element):
+                    continue
+                if root is None:
+                    root = element
+                    tags = _AtomTags(_namespace_prefix(element.tag))
+                elif event == "end" and element.tag == tags.entry:
+                    try:
+                        yield _entry_to_paper(element, tags)
+                    except Exception as e:
+                        logger.warning(f"Failed to parse entry: {e}")
+                    # Drop the finished entry from the tree
+                    root.clear()
+        parser.close()
+    except ElementTree.ParseError as e:
+        raise ParsingError(f"Failed to parse XML: {e}") from e
+
+
+def _namespace_prefix(tag: str) -> str:
+    """Return the ``{uri}`` prefix of a qualified tag, or "" if unqualified."""
+    if tag.startswith("{"):
+        return tag[: tag.index("}") + 1]
+    return ""
+
+
+def _text(element: ElementTree.Element) -> str:
+    return element.text.strip() if element.text else ""
+
+
+def _iso_date(text: str) -> str:
+    if not text:
+        return ""
+    try:
+        return datetime.fromisoformat(text.replace("Z", "+00:00")).isoformat()
+    except ValueError:
+        logger.warning(f"Could not parse date: {text}")
+        return ""
+
+
+def _entry_to_paper(entry: ElementTree.Element, tags: _AtomTags) -> ArxivPaper:
+    """Convert one ``entry`` element with a single pass over its children."""
+    entry_id = title = abstract = published = updated = ""
+    primary_category = ""
+    authors: list[str] = []
+    secondary_categories: list[str] = []
+
+    for child in entry:
+        tag = child.tag
+        if tag == tags.id:
+            entry_id = _text(child)
+        elif tag == tags.title:
+            title = _text(child)
+        elif tag == tags.summary:
+            abstract = _text(child)
+        elif tag == tags.author:
+            for name in child.findall(tags.name):
+                if name.text:
+                    authors.append(name.text.strip())
+        elif tag == tags.category:
+            term = child.get("term")
+            if term:
+                secondary_categories.append(term)
+        elif tag == tags.primary_category:
+            primary_category = child.get("term") or primary_category
+        elif tag == tags.published:
+            published = _iso_date(_text(child))
+        elif tag == tags.updated:
+            updated = _iso_date(_text(child))
+
+    # Primary category first, then cross-lists without duplicates
+    categories = [primary_category] if primary_category else []
+    for category in secondary_categories:
+        if category not in categories:
+            categories.append(category)
+
+    # Entry ids carry the version (abs/2501.00001v2); papers keep the bare id
+    versioned_id = _ENTRY_ID_PREFIX.sub("", entry_id) if entry_id else ""
+    arxiv_id, version = split_arxiv_version(versioned_id)
+    return ArxivPaper(
+        arxiv_id=arxiv_id,
+        version=version,
+        title=title,
+        abstract=abstract,
+        authors=authors,
+        categories=categories,
+        primary_category=categories[0] if categories else "",
+        published_date=published,
+        updated_date=updated,
+        url_pdf=f"https://arxiv.org/pdf/{versioned_id}",
+        url_abs=f"https://arxiv.org/abs/{versioned_id}",
+        doi=None,
+        journal=None,
+        volume=None,
+        pages=None,
+        keywords=[],
+        raw_metadata={},
+    )
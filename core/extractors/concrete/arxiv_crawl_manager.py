@@ -1,12 +1,18 @@
 """ArXiv crawl manager for coordinating paper discovery and storage."""
 
 import asyncio
+import time
+from collections.abc import Sequence
+from contextlib import aclosing
 from typing import Any
 
+from core.extractors.exceptions import NetworkError, ParsingError
 from core.log import get_logger
+from core.models.domain.arxiv import ArxivPaper, CrawlPipelineMetrics
 
 from .arxiv_source_explorer import ArxivSourceExplorer
 from .arxiv_storage_manager import ArxivStorageManager
+from .oai_pmh_source_explorer import OaiPmhSourceExplorer
 
 logger = get_logger(__name__)
 
@@ -18,21 +24,33 @@ class ArxivCrawlManager:
         self,
         engine: Any,
         categories: list[str],
-        delay_seconds: float = 2.0,
         max_results_per_request: int = 100,
+        queue_size: int = 2,
+        store_batch_size: int = 200,
+        checkpoint_pages: bool = False,
     ) -> None:
         """Initialize the crawl manager.
 
+        Request pacing is left to the explorer's rate limiter.
+
         Args:
             engine: Database engine
             categories: List of ArXiv categories to crawl
-            delay_seconds: Delay between requests in seconds
             max_results_per_request: Maximum results per API request
+            queue_size: Pages buffered between pipeline stages; a full queue
+                pauses the upstream stage
+            store_batch_size: Papers accumulated before one bulk insert
+            checkpoint_pages: Store every page as soon as it is parsed and
+                persist the query's page cursor after it, so an interrupted
+                crawl resumes at the first page not stored yet
         """
         self.engine = engine
         self.categories = categories
-        self.delay_seconds = delay_seconds
         self.max_results_per_request = max_results_per_request
+        self.queue_size = queue_size
+        self.store_batch_size = store_batch_size
+        self.checkpoint_pages = checkpoint_pages
+        self.last_metrics = CrawlPipelineMetrics()
 
         # Initialize storage manager only
         self.storage_manager = ArxivStorageManager(engine)
@@ -57,55 +75,298 @@ class ArxivCrawlManager:
         Returns:
             Tuple of (papers_found, papers_stored)
         """
-        try:
-            all_papers = []
-            current_start = start_index
-            batch_size = limit
+        return await self._crawl_and_store_query(
+            explorer,
+            explorer.historical_query(category, date),
+            [category],
+            date,
+            date,
+            f"{category} on {date}",
+            start_index,
+            limit,
+        )
+
+    async def crawl_and_store_window(
+        self,
+        explorer: ArxivSourceExplorer,
+        categories: Sequence[str],
+        start_date: str,
+        end_date: str,
+        limit: int = 100,
+    ) -> tuple[int, int]:
+        """Crawl papers for categories over one or more days with one query.
 
-            # Fetch all papers using pagination
-            while True:
-                batch = await explorer.explore_historical_papers_by_category(
-                    category=category,
-                    date=date,
-                    start_index=current_start,
-                    limit=batch_size,
-                )
+        Several categories are OR-combined, so a cross-listed paper is
+        fetched and parsed once. Papers are attributed back to the queried
+        categories client-side; per-category, per-day counts are kept in
+        ``last_metrics`` so completion can still be recorded per unit.
 
-                if not batch:
-                    break
+        Args:
+            explorer: ArxivSourceExplorer instance for fetching papers
+            categories: ArXiv categories (e.g., ["cs.AI", "cs.LG"])
+            start_date: First day in YYYY-MM-DD format
+            end_date: Last day (inclusive) in YYYY-MM-DD format
+            limit: Maximum number of papers per request (default: 100)
 
-                all_papers.extend(batch)
+        Returns:
+            Tuple of (papers_found, papers_stored) counting each paper once
+        """
+        return await self._crawl_and_store_query(
+            explorer,
+            explorer.date_range_query(categories, start_date, end_date),
+            categories,
+            start_date,
+            end_date,
+            f"{','.join(categories)} from {start_date} to {end_date}",
+            0,
+            limit,
+        )
+
+    async def _crawl_and_store_query(
+        self,
+        explorer: ArxivSourceExplorer,
+        query: str,
+        categories: Sequence[str],
+        start_date: str,
+        end_date: str,
+        label: str,
+        start_index: int,
+        limit: int,
+    ) -> tuple[int, int]:
+        """Crawl every page of a query and store the papers.
+
+        Runs a three-stage pipeline connected by bounded queues: pages are
+        fetched, parsed in a worker thread and bulk-stored while the next page
+        is in flight. Stage timings are kept in ``last_metrics``.
+
+        A stage sends its end marker only when it finishes normally. If a
+        stage raises or the crawl is cancelled, the task group cancels the
+        other stages instead, so none of them blocks on a full queue.
+
+        With ``checkpoint_pages`` a crawl starting at index 0 resumes from a
+        saved cursor, and the cursor is deleted once the last page is stored.
 
-                # If we got fewer papers than requested, we've reached the end
-                if len(batch) < batch_size:
+        Args:
+            explorer: ArxivSourceExplorer instance for fetching papers
+            query: ArXiv search query
+            categories: Categories the query matches, used to attribute papers
+            start_date: First day the query covers, part of the cursor key
+            end_date: Last day the query covers, part of the cursor key
+            label: Human-readable description of the query for logs
+            start_index: Index to start fetching from
+            limit: Maximum number of papers per request
+
+        Returns:
+            Tuple of (papers_found, papers_stored)
+        """
+        metrics = CrawlPipelineMetrics()
+        self.last_metrics = metrics
+        # Pages travel with the start index of the page after them
+        raw_pages: asyncio.Queue[tuple[int, str] | None] = asyncio.Queue(
+            self.queue_size
+        )
+        parsed_pages: asyncio.Queue[tuple[int, list[ArxivPaper]] | None] = (
+            asyncio.Queue(self.queue_size)
+        )
+        started_at = time.perf_counter()
+        reached_last_page = False
+
+        if self.checkpoint_pages and start_index == 0:
+            checkpoint = await asyncio.to_thread(
+                self.storage_manager.load_checkpoint,
+                categories,
+                start_date,
+                end_date,
+            )
+            if checkpoint is not None:
+                start_index = checkpoint.next_index
+                metrics.papers_found = checkpoint.papers_found
+                metrics.papers_stored = checkpoint.papers_stored
+                logger.info(f"Resuming {label} at index {start_index}")
+        resumed_papers_found = metrics.papers_found
+
+        async def fetch_stage() -> None:
+            nonlocal reached_last_page
+            current_start = start_index
+            while True:
+                stage_start = time.perf_counter()
+                try:
+                    xml_content = await explorer.fetch_page_xml(
+                        query, current_start, limit
+                    )
+                except NetworkError as e:
+                    logger.error(f"Error fetching {label}: {e}")
+                    break
+                metrics.fetch_seconds += time.perf_counter() - stage_start
+                metrics.pages_fetched += 1
+                current_start += limit
+                await raw_pages.put((current_start, xml_content))
+
+                # Counting entries is enough to decide whether to paginate,
+                # so the next request does not wait for the parser.
+                if explorer.count_entries(xml_content) < limit:
+                    reached_last_page = True
                     break
+            await raw_pages.put(None)
+
+        async def parse_stage() -> None:
+            while (page := await raw_pages.get()) is not None:
+                next_index, xml_content = page
+                stage_start = time.perf_counter()
+                papers = await asyncio.to_thread(explorer.parse_papers_xml, xml_content)
+                metrics.parse_seconds += time.perf_counter() - stage_start
+                metrics.papers_found += len(papers)
+                for paper in papers:
+                    metrics.count_found(
+                        explorer.attribute_categories(paper, categories),
+                        paper.published_date[:10],
+                    )
+                if papers or self.checkpoint_pages:
+                    await parsed_pages.put((next_index, papers))
+            await parsed_pages.put(None)
+
+        async def store_stage() -> None:
+            pending: list[ArxivPaper] = []
+            papers_found = resumed_papers_found
+            while (page := await parsed_pages.get()) is not None:
+                next_index, papers = page
+                pending.extend(papers)
+                papers_found += len(papers)
+                if self.checkpoint_pages:
+                    # Store page by page, so the cursor never skips unstored papers
+                    await self._store(pending, categories, metrics)
+                    pending = []
+                    await asyncio.to_thread(
+                        self.storage_manager.save_checkpoint,
+                        categories,
+                        start_date,
+                        end_date,
+                        next_index,
+                        papers_found,
+                        metrics.papers_stored,
+                    )
+                elif len(pending) >= self.store_batch_size:
+                    await self._store(pending, categories, metrics)
+                    pending = []
+            if pending:
+                await self._store(pending, categories, metrics)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(fetch_stage())
+                group.create_task(parse_stage())
+                group.create_task(store_stage())
+            metrics.completed = reached_last_page
+        except Exception as e:
+            logger.error(f"Error crawling {label}: {e}")
+
+        if self.checkpoint_pages and metrics.completed:
+            await asyncio.to_thread(
+                self.storage_manager.clear_checkpoint, categories, start_date, end_date
+            )
+
+        metrics.wall_seconds = time.perf_counter() - started_at
+        if metrics.papers_found > 0:
+            logger.info(
+                f"Found {metrics.papers_found} papers, "
+                f"stored {metrics.papers_stored}/{metrics.papers_found} "
+                f"for {label} "
+                f"(fetch {metrics.fetch_seconds:.2f}s, "
+                f"parse {metrics.parse_seconds:.2f}s, "
+                f"store {metrics.store_seconds:.2f}s, "
+                f"wall {metrics.wall_seconds:.2f}s)"
+            )
+        else:
+            logger.warning(f"No papers found for {label}")
 
-                # Move to next batch
-                current_start += batch_size
+        return metrics.papers_found, metrics.papers_stored
 
-                # Rate limiting between batches
-                if len(batch) == batch_size:  # Only if we expect more
-                    await asyncio.sleep(self.delay_seconds)
+    async def _store(
+        self,
+        papers: list[ArxivPaper],
+        categories: Sequence[str],
+        metrics: CrawlPipelineMetrics,
+    ) -> None:
+        """Bulk-store papers per unit, falling back to per-paper storage.
 
-            # Store all papers
-            storage_manager = ArxivStorageManager(self.engine)
-            papers_stored = await storage_manager.store_papers_batch(all_papers)
+        Papers are grouped by submission day and matched categories, and each
+        group is one transaction, so per-unit stored counts stay exact.
+        """
+        stage_start = time.perf_counter()
+        groups: dict[tuple[str, tuple[str, ...]], list[ArxivPaper]] = {}
+        for paper in papers:
+            key = (
+                paper.published_date[:10],
+                tuple(ArxivSourceExplorer.attribute_categories(paper, categories)),
+            )
+            groups.setdefault(key, []).append(paper)
 
-            # Log final result only
-            if len(all_papers) > 0:
-                logger.info(
-                    f"Found {len(all_papers)} papers, "
-                    f"stored {papers_stored}/{len(all_papers)} "
-                    f"for {category} on {date}"
+        for (day, matched), group in groups.items():
+            try:
+                stored = await asyncio.to_thread(
+                    self.storage_manager.store_papers_bulk, group
                 )
-            else:
-                logger.warning(f"No papers found for {category} on {date}")
+            except Exception as e:
+                logger.warning(f"Bulk insert failed, storing papers one by one: {e}")
+                stored = await self.storage_manager.store_papers_batch(group)
+            metrics.papers_stored += stored
+            metrics.store_batches += 1
+            metrics.count_stored(matched, day, stored)
+        metrics.store_seconds += time.perf_counter() - stage_start
+
+    async def harvest_and_store(
+        self,
+        harvester: OaiPmhSourceExplorer,
+        set_spec: str | None = None,
+        from_date: str | None = None,
+        until_date: str | None = None,
+    ) -> tuple[int, int]:
+        """Harvest records over OAI-PMH and bulk-store each page.
 
-            return len(all_papers), papers_stored
+        Only papers listing one of ``categories`` are stored, since OAI-PMH
+        sets are whole archives.
 
-        except Exception as e:
-            logger.error(f"Error crawling {category} on {date}: {e}")
-            return 0, 0
+        Args:
+            harvester: OaiPmhSourceExplorer instance for fetching records
+            set_spec: OAI-PMH set (e.g., "cs"); all sets when None
+            from_date: First datestamp in YYYY-MM-DD format
+            until_date: Last datestamp (inclusive) in YYYY-MM-DD format
+
+        Returns:
+            Tuple of (papers_found, papers_stored)
+        """
+        label = f"set {set_spec or '*'} from {from_date} to {until_date}"
+        metrics = CrawlPipelineMetrics()
+        self.last_metrics = metrics
+        started_at = time.perf_counter()
+
+        try:
+            async with aclosing(
+                harvester.harvest(set_spec, from_date, until_date)
+            ) as pages:
+                async for page in pages:
+                    metrics.pages_fetched += 1
+                    papers = []
+                    for paper in page.papers:
+                        matched = ArxivSourceExplorer.attribute_categories(
+                            paper, self.categories
+                        )
+                        if matched:
+                            papers.append(paper)
+                            metrics.count_found(matched, paper.published_date[:10])
+                    metrics.papers_found += len(papers)
+                    await self._store(papers, self.categories, metrics)
+            metrics.completed = True
+        except (NetworkError, ParsingError) as e:
+            logger.error(f"Error harvesting {label}: {e}")
+
+        metrics.wall_seconds = time.perf_counter() - started_at
+        logger.info(
+            f"Harvested {metrics.pages_fetched} pages, "
+            f"stored {metrics.papers_stored}/{metrics.papers_found} papers "
+            f"for {label}"
+        )
+        return metrics.papers_found, metrics.papers_stored
 
     async def crawl_category_range(
         self,
@@ -157,29 +418,33 @@ class ArxivCrawlManager:
         categories: list[str],
         date: str,
         papers_per_category: int = 100,
+        max_concurrency: int = 4,
     ) -> dict[str, tuple[int, int]]:
-        """Crawl papers for multiple categories on a specific date.
+        """Crawl papers for multiple categories on a specific date concurrently.
 
         Args:
             explorer: ArxivSourceExplorer instance for fetching papers
             categories: List of ArXiv categories to crawl
             date: Date in YYYY-MM-DD format
             papers_per_category: Maximum papers to fetch per category
+            max_concurrency: Categories crawled at the same time
 
         Returns:
             Dictionary mapping categories to (papers_found, papers_stored) tuples
         """
-        results = {}
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
 
-        for category in categories:
-            papers_found, papers_stored = await self.crawl_and_store_papers(
-                explorer=explorer,
-                category=category,
-                date=date,
-                start_index=0,
-                limit=papers_per_category,
-            )
-
-            results[category] = (papers_found, papers_stored)
+        async def crawl_category(category: str) -> tuple[int, int]:
+            async with semaphore:
+                return await self.crawl_and_store_papers(
+                    explorer=explorer,
+                    category=category,
+                    date=date,
+                    start_index=0,
+                    limit=papers_per_category,
+                )
 
-        return results
+        counts = await asyncio.gather(
+            *(crawl_category(category) for category in categories)
+        )
+        return dict(zip(categories, counts, strict=True))
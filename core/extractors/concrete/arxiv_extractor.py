@@ -1,6 +1,8 @@
 """ArXiv-specific paper extractor."""
 
+import asyncio
 import re
+from collections.abc import Sequence
 from urllib.parse import urljoin
 from xml.etree import ElementTree
 
@@ -13,6 +15,8 @@ from core.extractors.exceptions import (
     NetworkError,
     ParsingError,
 )
+from core.extractors.http_client import http_get
+from core.extractors.rate_limiter import AsyncTokenBucket
 from core.log import get_logger
 from core.models.domain.paper_extraction import PaperMetadata
 from core.utils import (
@@ -22,8 +26,20 @@ from core.utils import (
     extract_xml_text,
 )
 
+from .arxiv_atom_parser import iter_atom_papers
+
 logger = get_logger(__name__)
 
+# Identifiers per id_list request; keeps the GET URL well below server limits
+MAX_IDS_PER_REQUEST = 100
+
+# New-style (1706.03762) and old-style (cs/0112017, math.GT/0309136) IDs
+_ARXIV_ID = r"(?:\d{4}\.\d{4,5}|[a-z-]+(?:\.[A-Z]{2})?/\d{7})"
+_BARE_ID_PATTERN = re.compile(rf"(?P<identifier>{_ARXIV_ID})(?:v\d+)?")
+_URL_ID_PATTERN = re.compile(
+    rf"arxiv\.org/(?:abs|pdf)/(?P<identifier>{_ARXIV_ID})(?:v\d+)?"
+)
+
 
 class ArxivExtractor(BaseExtractor):
     """ArXiv-specific paper extractor."""
@@ -33,6 +49,9 @@ class ArxivExtractor(BaseExtractor):
         api_base_url: str = "https://export.arxiv.org/api/query",
         abs_base_url: str = "https://arxiv.org/abs",
         pdf_base_url: str = "https://arxiv.org/pdf",
+        http_client: httpx.AsyncClient | None = None,
+        rate_limiter: AsyncTokenBucket | None = None,
+        max_ids_per_request: int = MAX_IDS_PER_REQUEST,
     ) -> None:
         """Initialize ArXiv extractor.
 
@@ -40,15 +59,25 @@ class ArxivExtractor(BaseExtractor):
             api_base_url: Base URL for arXiv API
             abs_base_url: Base URL for arXiv abstract pages
             pdf_base_url: Base URL for arXiv PDF pages
+            http_client: Shared pooled client; a short-lived client is opened
+                per request when omitted
+            rate_limiter: Limiter shared with other arXiv callers; requests are
+                not paced when omitted
+            max_ids_per_request: Identifiers batched into one id_list request
         """
         self.base_url = api_base_url
+        self.http_client = http_client
+        self.rate_limiter = rate_limiter
         self.abs_base_url = abs_base_url
         self.pdf_base_url = pdf_base_url
+        self.max_ids_per_request = max_ids_per_request
         self.namespace = {
             "atom": "http://www.w3.org/2005/Atom",
             "arxiv": "http://arxiv.org/schemas/atom",
         }
 
+    hosts = ("arxiv.org",)
+
     def can_extract(self, url: str) -> bool:
         """Check if this extractor can handle the given URL.
 
@@ -64,35 +93,36 @@ class ArxivExtractor(BaseExtractor):
         """Extract arXiv identifier from URL.
 
         Args:
-            url: URL to extract identifier from
+            url: URL or bare arXiv ID, with or without version suffix
 
         Returns:
-            arXiv identifier (e.g., "1706.03762")
+            Unversioned arXiv identifier (e.g., "1706.03762" or "cs/0112017")
 
         Raises:
             InvalidIdentifierError: If URL format is invalid
         """
-        # Direct arXiv ID (with or without version)
-        if re.match(r"^\d{4}\.\d{4,5}(v\d+)?$", url):
-            # Remove version suffix if present
-            return re.sub(r"v\d+$", "", url)
+        match = _BARE_ID_PATTERN.fullmatch(url) or _URL_ID_PATTERN.search(url)
+        if match is None:
+            raise InvalidIdentifierError(f"Could not extract arXiv ID from: {url}")
+        return match["identifier"]
 
-        # Abstract URL
-        abs_match = re.search(r"arxiv\.org/abs/(\d{4}\.\d{4,5})", url)
-        if abs_match:
-            return abs_match.group(1)
+    def extract_identifiers(self, urls: Sequence[str]) -> dict[str, str]:
+        """Extract arXiv identifiers from several URLs in one pass.
 
-        # PDF URL
-        pdf_match = re.search(r"arxiv\.org/pdf/(\d{4}\.\d{4,5})", url)
-        if pdf_match:
-            return pdf_match.group(1)
-
-        # Versioned URL
-        version_match = re.search(r"arxiv\.org/abs/(\d{4}\.\d{4,5})v\d+", url)
-        if version_match:
-            return version_match.group(1)
+        Args:
+            urls: URLs or bare arXiv IDs
 
-        raise InvalidIdentifierError(f"Could not extract arXiv ID from: {url}")
+        Returns:
+            Unversioned identifier keyed by URL; invalid URLs are absent
+        """
+        bare_match = _BARE_ID_PATTERN.fullmatch
+        url_search = _URL_ID_PATTERN.search
+        identifiers: dict[str, str] = {}
+        for url in urls:
+            match = bare_match(url) or url_search(url)
+            if match is not None:
+                identifiers[url] = match["identifier"]
+        return identifiers
 
     async def extract_metadata_async(self, url: str) -> PaperMetadata:
         """Extract paper metadata from arXiv URL asynchronously.
@@ -113,6 +143,105 @@ class ArxivExtractor(BaseExtractor):
         except (InvalidIdentifierError, NetworkError, ParsingError) as e:
             raise ExtractionError(f"Failed to extract metadata from {url}: {e}") from e
 
+    async def extract_metadata_many(
+        self, urls: Sequence[str]
+    ) -> dict[str, PaperMetadata]:
+        """Extract metadata for several arXiv URLs with batched id_list requests.
+
+        Identifiers are deduplicated and sent as comma-separated ``id_list``
+        chunks of up to ``max_ids_per_request``; each response is parsed in
+        one streaming pass.
+
+        Args:
+            urls: URLs or bare arXiv identifiers
+
+        Returns:
+            Metadata keyed by URL; URLs with invalid identifiers, missing from
+            arXiv, or in a failed chunk are absent
+        """
+        identifiers_by_url = self.extract_identifiers(urls)
+        urls_by_identifier: dict[str, list[str]] = {}
+        for url in urls:
+            if url not in identifiers_by_url:
+                logger.warning(f"Skipping {url}: Could not extract arXiv ID")
+                continue
+            urls_by_identifier.setdefault(identifiers_by_url[url], []).append(url)
+
+        identifiers = list(urls_by_identifier)
+        chunks = [
+            identifiers[i : i + self.max_ids_per_request]
+            for i in range(0, len(identifiers), self.max_ids_per_request)
+        ]
+        # Chunks run concurrently; the shared rate limiter paces them
+        chunk_results = await asyncio.gather(
+            *(self._fetch_metadata_chunk(chunk) for chunk in chunks)
+        )
+
+        results: dict[str, PaperMetadata] = {}
+        for metadata_by_identifier in chunk_results:
+            for identifier, metadata in metadata_by_identifier.items():
+                for url in urls_by_identifier.get(identifier, []):
+                    results[url] = metadata
+        return results
+
+    async def _fetch_metadata_chunk(
+        self, identifiers: list[str]
+    ) -> dict[str, PaperMetadata]:
+        """Fetch and parse one id_list request.
+
+        Args:
+            identifiers: Unversioned arXiv identifiers
+
+        Returns:
+            Metadata keyed by identifier; empty if the request fails
+        """
+        params = {
+            "id_list": ",".join(identifiers),
+            "start": "0",
+            "max_results": str(len(identifiers)),
+        }
+        try:
+            response = await http_get(
+                self.base_url, params, self.http_client, self.rate_limiter
+            )
+        except (httpx.RequestError, httpx.HTTPStatusError) as e:
+            logger.error(f"Failed to fetch {len(identifiers)} papers: {e}")
+            return {}
+
+        requested = set(identifiers)
+        results: dict[str, PaperMetadata] = {}
+        try:
+            for paper in iter_atom_papers(response.text):
+                # arXiv reports unknown ids as error entries; skip those
+                if paper.arxiv_id in requested:
+                    results[paper.arxiv_id] = self._paper_to_metadata(
+                        paper, paper.arxiv_id
+                    )
+        except ParsingError as e:
+            logger.error(f"Failed to parse batch response: {e}")
+        return results
+
+    def _paper_to_metadata(
+        self, paper: PaperMetadata, identifier: str
+    ) -> PaperMetadata:
+        """Build the same metadata ``extract_metadata_async`` returns."""
+        return PaperMetadata(
+            title=paper.title,
+            abstract=paper.abstract,
+            authors=paper.authors,
+            published_date=paper.published_date,
+            updated_date=paper.updated_date,
+            url_abs=urljoin(self.abs_base_url, f"abs/{identifier}"),
+            url_pdf=urljoin(self.pdf_base_url, f"pdf/{identifier}"),
+            categories=paper.categories,
+            keywords=[],
+            doi=None,
+            journal=None,
+            volume=None,
+            pages=None,
+            raw_metadata={"arxiv_id": identifier},
+        )
+
     async def _fetch_paper_xml(self, identifier: str) -> str:
         """Fetch paper XML from arXiv API.
 
@@ -132,10 +261,10 @@ class ArxivExtractor(BaseExtractor):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(self.base_url, params=params)
-                response.raise_for_status()
-                return response.text
+            response = await http_get(
+                self.base_url, params, self.http_client, self.rate_limiter
+            )
+            return response.text
         except httpx.RequestError as e:
             raise NetworkError(f"Network error fetching paper {identifier}: {e}") from e
         except httpx.HTTPStatusError as e:
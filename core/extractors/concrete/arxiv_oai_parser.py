@@ -0,0 +1,156 @@
+"""Streaming parser for arXiv OAI-PMH ListRecords responses."""
+
+import xml.etree.ElementTree as ElementTree
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from core.extractors.exceptions import ParsingError
+from core.log import get_logger
+from core.models.domain.arxiv import ArxivPaper
+
+from .arxiv_atom_parser import FEED_CHUNK_SIZE
+
+logger = get_logger(__name__)
+
+OAI_NAMESPACE = "{http://www.openarchives.org/OAI/2.0/}"
+ARXIV_OAI_NAMESPACE = "{http://arxiv.org/OAI/arXiv/}"
+
+# OAI-PMH error code for a harvest that simply matches nothing
+NO_RECORDS_MATCH = "noRecordsMatch"
+
+
+@dataclass
+class OaiPmhPage:
+    """Papers of one ListRecords response and the token for the next one."""
+
+    papers: list[ArxivPaper] = field(default_factory=list)
+    resumption_token: str | None = None
+    complete_list_size: int | None = None
+
+
+def parse_list_records(xml_content: str) -> OaiPmhPage:
+    """Parse a ListRecords response in the ``arXiv`` metadata format.
+
+    Records are converted as soon as they are complete and then dropped
+    from the tree, like the Atom parser does with entries. Deleted records
+    carry no metadata and are skipped.
+
+    Args:
+        xml_content: Raw OAI-PMH XML
+
+    Returns:
+        Parsed page; ``resumption_token`` is None on the last page
+
+    Raises:
+        ParsingError: If the content is not well-formed XML or the response
+            is an OAI-PMH error other than ``noRecordsMatch``
+    """
+    if not xml_content or not xml_content.strip():
+        raise ParsingError("Empty XML content provided")
+
+    page = OaiPmhPage()
+    parser: ElementTree.XMLPullParser[ElementTree.Element] = ElementTree.XMLPullParser(
+        events=("start", "end")
+    )
+    root: ElementTree.Element | None = None
+    list_records: ElementTree.Element | None = None
+
+    try:
+        for offset in range(0, len(xml_content), FEED_CHUNK_SIZE):
+            parser.feed(xml_content[offset : offset + FEED_CHUNK_SIZE])
+            for parser_event in parser.read_events():
+                # Only start and end events are requested, which carry elements
+                event, element = parser_event[0], parser_event[-1]
+                if not isinstance(element, ElementTree.Element):
+                    continue
+                if root is None:
+                    root = element
+                elif event == "start":
+                    if element.tag == f"{OAI_NAMESPACE}ListRecords":
+                        list_records = element
+                elif element.tag == f"{OAI_NAMESPACE}record":
+                    metadata = element.find(
+                        f"{OAI_NAMESPACE}metadata/{ARXIV_OAI_NAMESPACE}arXiv"
+                    )
+                    if metadata is not None:
+                        try:
+                            page.papers.append(_record_to_paper(metadata))
+                        except Exception as e:
+                            logger.warning(f"Failed to parse record: {e}")
+                    # Drop finished records from the tree
+                    if list_records is not None:
+                        list_records.clear()
+                elif element.tag == f"{OAI_NAMESPACE}resumptionToken":
+                    page.resumption_token = (element.text or "").strip() or None
+                    size = element.get("completeListSize")
+                    page.complete_list_size = int(size) if size else None
+                elif element.tag == f"{OAI_NAMESPACE}error":
+                    code = element.get("code", "")
+                    if code != NO_RECORDS_MATCH:
+                        raise ParsingError(
+                            f"OAI-PMH error {code}: {(element.text or '').strip()}"
+                        )
+        parser.close()
+    except ElementTree.ParseError as e:
+        raise ParsingError(f"Failed to parse XML: {e}") from e
+
+    return page
+
+
+def _text(element: ElementTree.Element, tag: str) -> str:
+    child = element.find(f"{ARXIV_OAI_NAMESPACE}{tag}")
+    if child is None or not child.text:
+        return ""
+    # Titles and abstracts are hard-wrapped in the arXiv format
+    return " ".join(child.text.split())
+
+
+def _iso_date(text: str) -> str:
+    if not text:
+        return ""
+    try:
+        return datetime.fromisoformat(text).replace(tzinfo=UTC).isoformat()
+    except ValueError:
+        logger.warning(f"Could not parse date: {text}")
+        return ""
+
+
+def _record_to_paper(metadata: ElementTree.Element) -> ArxivPaper:
+    """Convert the ``arXiv`` metadata element of one record."""
+    arxiv_id = _text(metadata, "id")
+    if not arxiv_id:
+        raise ParsingError("Record has no arXiv id")
+
+    authors = []
+    for author in metadata.iter(f"{ARXIV_OAI_NAMESPACE}author"):
+        name = " ".join(
+            part
+            for part in (
+                _text(author, "forenames"),
+                _text(author, "keyname"),
+                _text(author, "suffix"),
+            )
+            if part
+        )
+        if name:
+            authors.append(name)
+
+    categories = _text(metadata, "categories").split()
+    return ArxivPaper(
+        arxiv_id=arxiv_id,
+        title=_text(metadata, "title"),
+        abstract=_text(metadata, "abstract"),
+        authors=authors,
+        categories=categories,
+        primary_category=categories[0] if categories else "",
+        published_date=_iso_date(_text(metadata, "created")),
+        updated_date=_iso_date(_text(metadata, "updated")),
+        url_pdf=f"https://arxiv.org/pdf/{arxiv_id}",
+        url_abs=f"https://arxiv.org/abs/{arxiv_id}",
+        doi=_text(metadata, "doi") or None,
+        journal=_text(metadata, "journal-ref") or None,
+        volume=None,
+        pages=None,
+        keywords=[],
+        raw_metadata={},
+    )
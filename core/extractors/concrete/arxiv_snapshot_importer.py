@@ -0,0 +1,375 @@
+"""Offline bulk import of papers from an arXiv metadata snapshot."""
+
+import argparse
+import json
+import os
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from datetime import UTC
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy.engine import Engine
+from tqdm import tqdm
+
+from core.config import load_settings
+from core.database.engine import create_database_engine, create_database_tables
+from core.log import get_logger
+from core.models.domain.arxiv import ArxivPaper, SnapshotImportProgress
+from core.utils import split_arxiv_version
+
+from .arxiv_storage_manager import ArxivStorageManager
+
+logger = get_logger(__name__)
+
+# Snapshot lines parsed and stored per transaction
+SNAPSHOT_BATCH_LINES = 5000
+
+
+def snapshot_record_to_paper(record: dict[str, Any]) -> ArxivPaper:
+    """Map one record of the JSON-lines metadata snapshot to an ArxivPaper.
+
+    The snapshot carries the bare identifier and the version history; the
+    paper takes its version from the newest entry of that history.
+
+    Args:
+        record: Decoded snapshot line
+
+    Returns:
+        ArxivPaper for the record
+    """
+    versions = record.get("versions") or []
+    arxiv_id = record["id"]
+    latest_version = versions[-1].get("version", "") if versions else ""
+    _, version = split_arxiv_version(f"{arxiv_id}{latest_version}")
+    versioned_id = f"{arxiv_id}v{version}"
+
+    authors = [
+        " ".join(part for part in (forenames, keyname, *suffix) if part)
+        for keyname, forenames, *suffix in record.get("authors_parsed") or []
+    ]
+    categories = (record.get("categories") or "").split()
+
+    return ArxivPaper(
+        arxiv_id=arxiv_id,
+        version=version,
+        title=" ".join((record.get("title") or "").split()),
+        abstract=" ".join((record.get("abstract") or "").split()),
+        authors=[author for author in authors if author],
+        categories=categories,
+        primary_category=categories[0] if categories else "",
+        published_date=_version_date(versions[0]) if versions else "",
+        updated_date=_version_date(versions[-1]) if versions else "",
+        url_pdf=f"https://arxiv.org/pdf/{versioned_id}",
+        url_abs=f"https://arxiv.org/abs/{versioned_id}",
+        doi=record.get("doi"),
+        journal=record.get("journal-ref"),
+        volume=None,
+        pages=None,
+        keywords=[],
+        raw_metadata={},
+    )
+
+
+def _version_date(version: dict[str, Any]) -> str:
+    created = version.get("created")
+    if not created:
+        return ""
+    try:
+        return parsedate_to_datetime(created).astimezone(UTC).isoformat()
+    except (TypeError, ValueError):
+        logger.warning(f"Could not parse date: {created}")
+        return ""
+
+
+def parse_snapshot_lines(
+    lines: Sequence[bytes], categories: Sequence[str]
+) -> tuple[int, list[ArxivPaper]]:
+    """Parse snapshot lines and keep papers listing one of ``categories``.
+
+    Module-level so it can run in worker processes.
+
+    Args:
+        lines: Raw JSON lines
+        categories: ArXiv categories to keep
+
+    Returns:
+        Tuple of (records read, papers in the categories)
+    """
+    wanted = set(categories)
+    records = 0
+    papers = []
+    for line in lines:
+        if not line.strip():
+            continue
+        records += 1
+        try:
+            record = json.loads(line)
+            if wanted.isdisjoint((record.get("categories") or "").split()):
+                continue
+            papers.append(snapshot_record_to_paper(record))
+        except Exception as e:
+            logger.warning(f"Skipping malformed snapshot record: {e}")
+    return records, papers
+
+
+class ArxivSnapshotImporter:
+    """Streams a JSON-lines arXiv metadata snapshot into the paper table.
+
+    Lines are read in batches. Batches are parsed in worker processes and
+    stored in order, one transaction per batch. After each stored batch,
+    the byte offset is written to a state file, so an interrupted import
+    resumes after the last stored batch. The state also records the
+    snapshot's size and modification time; a replaced snapshot at the same
+    path is imported from the start. Completion is recorded per
+    category and day for every day before the newest one in the snapshot,
+    so the historical crawl only has to fill the gaps.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        categories: Sequence[str],
+        batch_lines: int = SNAPSHOT_BATCH_LINES,
+        workers: int = 1,
+        state_path: str | Path | None = None,
+    ) -> None:
+        """Initialize the importer.
+
+        Args:
+            engine: Database engine
+            categories: ArXiv categories to import
+            batch_lines: Snapshot lines per parse batch and transaction
+            workers: Parser processes; batches are parsed inline when 1
+            state_path: Resume state file, defaults to the snapshot path
+                with an ``.import-state.json`` suffix
+        """
+        self.engine = engine
+        self.categories = list(categories)
+        self.batch_lines = max(1, batch_lines)
+        self.workers = max(1, workers)
+        self.state_path = Path(state_path) if state_path else None
+        self.storage_manager = ArxivStorageManager(engine)
+
+    def _state_path_for(self, snapshot_path: Path) -> Path:
+        if self.state_path is not None:
+            return self.state_path
+        return snapshot_path.with_name(f"{snapshot_path.name}.import-state.json")
+
+    def import_snapshot(
+        self,
+        snapshot_path: str | Path,
+        progress: Callable[[SnapshotImportProgress], None] | None = None,
+    ) -> SnapshotImportProgress:
+        """Import every paper of the configured categories from a snapshot.
+
+        Synchronous and CPU/IO heavy; run it in a thread from async code.
+
+        Args:
+            snapshot_path: JSON-lines snapshot file
+            progress: Called with the running totals after each stored batch
+
+        Returns:
+            Final import totals
+        """
+        snapshot_path = Path(snapshot_path)
+        snapshot_stat = snapshot_path.stat()
+        fingerprint = [snapshot_stat.st_size, snapshot_stat.st_mtime_ns]
+        state_path = self._state_path_for(snapshot_path)
+        state = self._load_state(state_path)
+        if state and state.get("snapshot") != fingerprint:
+            logger.info(f"Snapshot {snapshot_path} changed, importing from the start")
+            state = {}
+        status = SnapshotImportProgress(
+            bytes_read=state.get("offset", 0),
+            bytes_total=snapshot_stat.st_size,
+            records_read=state.get("records_read", 0),
+            papers_found=state.get("papers_found", 0),
+            papers_stored=state.get("papers_stored", 0),
+        )
+        # category -> day -> [found, stored], kept across resumes
+        unit_counts: dict[str, dict[str, list[int]]] = state.get("unit_counts", {})
+        if status.bytes_read:
+            logger.info(f"Resuming snapshot import at byte {status.bytes_read}")
+
+        executor: Executor | None = (
+            ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        )
+        try:
+            for end_offset, (records, papers) in self._parsed_batches(
+                snapshot_path, status.bytes_read, executor
+            ):
+                stored = self._store(papers, unit_counts)
+                status.bytes_read = end_offset
+                status.records_read += records
+                status.papers_found += len(papers)
+                status.papers_stored += stored
+                self._save_state(state_path, fingerprint, status, unit_counts)
+                if progress is not None:
+                    progress(status)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        status.completed = True
+        recorded = self._record_completions(unit_counts)
+        logger.info(
+            f"Imported {status.papers_stored}/{status.papers_found} papers "
+            f"from {status.records_read} snapshot records, "
+            f"recorded {recorded} completed days"
+        )
+        return status
+
+    def _read_batches(
+        self, snapshot_path: Path, offset: int
+    ) -> Iterator[tuple[int, list[bytes]]]:
+        """Yield (end offset, lines) batches from ``offset`` on."""
+        with snapshot_path.open("rb") as snapshot:
+            snapshot.seek(offset)
+            lines: list[bytes] = []
+            for line in snapshot:
+                lines.append(line)
+                if len(lines) >= self.batch_lines:
+                    yield snapshot.tell(), lines
+                    lines = []
+            if lines:
+                yield snapshot.tell(), lines
+
+    def _parsed_batches(
+        self, snapshot_path: Path, offset: int, executor: Executor | None
+    ) -> Iterator[tuple[int, tuple[int, list[ArxivPaper]]]]:
+        """Parse batches, in worker processes when an executor is given.
+
+        Up to two batches per worker are in flight; results are yielded in
+        file order so the saved offset never skips an unstored batch.
+        """
+        batches = self._read_batches(snapshot_path, offset)
+        if executor is None:
+            for end_offset, lines in batches:
+                yield end_offset, parse_snapshot_lines(lines, self.categories)
+            return
+
+        in_flight: deque[tuple[int, Future[tuple[int, list[ArxivPaper]]]]] = deque()
+        for end_offset, lines in batches:
+            in_flight.append(
+                (
+                    end_offset,
+                    executor.submit(parse_snapshot_lines, lines, self.categories),
+                )
+            )
+            if len(in_flight) >= self.workers * 2:
+                done_offset, future = in_flight.popleft()
+                yield done_offset, future.result()
+        while in_flight:
+            done_offset, future = in_flight.popleft()
+            yield done_offset, future.result()
+
+    def _store(
+        self, papers: list[ArxivPaper], unit_counts: dict[str, dict[str, list[int]]]
+    ) -> int:
+        """Bulk-store one batch and count papers per category and day."""
+        stored_ids, _ = self.storage_manager.upsert_papers(papers)
+        wanted = set(self.categories)
+        for paper in papers:
+            is_new = paper.arxiv_id in stored_ids
+            day = paper.published_date[:10]
+            for category in wanted.intersection(paper.categories):
+                counts = unit_counts.setdefault(category, {}).setdefault(day, [0, 0])
+                counts[0] += 1
+                counts[1] += is_new
+        return len(stored_ids)
+
+    def _record_completions(self, unit_counts: dict[str, dict[str, list[int]]]) -> int:
+        """Mark every (category, day) before the newest snapshot day completed."""
+        days = {day for by_day in unit_counts.values() for day in by_day}
+        if not days:
+            return 0
+        newest_day = max(days)
+        return self.storage_manager.record_completions(
+            {
+                (category, day): (found, stored)
+                for category, by_day in unit_counts.items()
+                for day, (found, stored) in by_day.items()
+                if day < newest_day
+            }
+        )
+
+    @staticmethod
+    def _load_state(state_path: Path) -> dict[str, Any]:
+        if not state_path.exists():
+            return {}
+        try:
+            state: dict[str, Any] = json.loads(state_path.read_text(encoding="utf-8"))
+            return state
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable import state {state_path}: {e}")
+            return {}
+
+    @staticmethod
+    def _save_state(
+        state_path: Path,
+        fingerprint: list[int],
+        status: SnapshotImportProgress,
+        unit_counts: dict[str, dict[str, list[int]]],
+    ) -> None:
+        state = {
+            "snapshot": fingerprint,
+            "offset": status.bytes_read,
+            "records_read": status.records_read,
+            "papers_found": status.papers_found,
+            "papers_stored": status.papers_stored,
+            "unit_counts": unit_counts,
+        }
+        temporary_path = state_path.with_name(f"{state_path.name}.tmp")
+        temporary_path.write_text(json.dumps(state), encoding="utf-8")
+        temporary_path.replace(state_path)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Import a snapshot into the database of the configured environment."""
+    parser = argparse.ArgumentParser(
+        description="Import papers from a JSON-lines arXiv metadata snapshot"
+    )
+    parser.add_argument("snapshot", type=Path, help="Snapshot file to import")
+    parser.add_argument(
+        "--categories",
+        help="Comma-separated categories (default: THEARK_PRESET_CATEGORIES)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="Parser processes"
+    )
+    parser.add_argument(
+        "--batch-lines",
+        type=int,
+        default=SNAPSHOT_BATCH_LINES,
+        help="Snapshot lines per transaction",
+    )
+    args = parser.parse_args(argv)
+
+    settings = load_settings()
+    engine = create_database_engine(settings.environment)
+    create_database_tables(engine)
+    importer = ArxivSnapshotImporter(
+        engine,
+        categories=(
+            args.categories.split(",") if args.categories else settings.arxiv_categories
+        ),
+        batch_lines=args.batch_lines,
+        workers=args.workers,
+    )
+
+    with tqdm(
+        total=args.snapshot.stat().st_size, unit="B", unit_scale=True
+    ) as progress_bar:
+
+        def report(status: SnapshotImportProgress) -> None:
+            progress_bar.update(status.bytes_read - progress_bar.n)
+            progress_bar.set_postfix(stored=status.papers_stored)
+
+        importer.import_snapshot(args.snapshot, progress=report)
+
+
+if __name__ == "__main__":
+    main()
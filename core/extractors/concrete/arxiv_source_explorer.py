@@ -1,27 +1,30 @@
 """ArXiv source explorer for bulk paper discovery."""
 
-import asyncio
+import re
+from collections.abc import Sequence
 from datetime import datetime, timedelta
-from typing import Any
 
 import httpx
 
 from core.extractors.base import BaseSourceExplorer
 from core.extractors.exceptions import NetworkError, ParsingError
+from core.extractors.http_client import http_get
+from core.extractors.rate_limiter import AsyncTokenBucket
+from core.extractors.response_cache import ResponseCache
 from core.log import get_logger
 from core.models.domain.arxiv import ArxivPaper
 from core.models.domain.paper_extraction import PaperMetadata
-from core.utils import (
-    extract_xml_authors,
-    extract_xml_categories,
-    extract_xml_date,
-    extract_xml_text,
-)
 
+from .arxiv_atom_parser import iter_atom_papers
 from .arxiv_extractor import ArxivExtractor
 
 logger = get_logger(__name__)
 
+# Atom entry start tags, with or without a namespace prefix
+_ENTRY_TAG_PATTERN = re.compile(r"<(?:\w+:)?entry[\s>]")
+# OpenSearch hit count of the whole query, independent of paging
+_TOTAL_RESULTS_PATTERN = re.compile(r"<(?:\w+:)?totalResults[^>]*>\s*(\d+)")
+
 
 class ArxivSourceExplorer(BaseSourceExplorer):
     """ArXiv source explorer for bulk paper discovery."""
@@ -31,19 +34,37 @@ class ArxivSourceExplorer(BaseSourceExplorer):
         api_base_url: str = "https://export.arxiv.org/api/query",
         delay_seconds: float = 2.0,
         max_results_per_request: int = 100,
+        http_client: httpx.AsyncClient | None = None,
+        rate_limiter: AsyncTokenBucket | None = None,
+        response_cache: ResponseCache | None = None,
     ) -> None:
         """Initialize ArXiv source explorer.
 
         Args:
             api_base_url: Base URL for arXiv API
-            delay_seconds: Delay between requests in seconds
+            delay_seconds: Minimum interval between request starts, used to
+                build a private limiter when none is injected
             max_results_per_request: Maximum results per API request
+            http_client: Shared pooled client; a short-lived client is opened
+                per request when omitted
+            rate_limiter: Limiter shared by all arXiv traffic
+            response_cache: On-disk cache for raw feed pages; every page is
+                fetched from arXiv when omitted
         """
         self.api_base_url = api_base_url
         self.delay_seconds = delay_seconds
         self.max_results_per_request = max_results_per_request
+        self.http_client = http_client
+        if rate_limiter is None and delay_seconds > 0:
+            rate_limiter = AsyncTokenBucket(rate=1.0 / delay_seconds)
+        self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
         # Reuse ArxivExtractor for parsing
-        self.extractor = ArxivExtractor(api_base_url=api_base_url)
+        self.extractor = ArxivExtractor(
+            api_base_url=api_base_url,
+            http_client=http_client,
+            rate_limiter=rate_limiter,
+        )
 
     async def explore_recent(
         self,
@@ -121,13 +142,209 @@ class ArxivSourceExplorer(BaseSourceExplorer):
         Returns:
             List of ArXiv papers
         """
-        # Convert YYYY-MM-DD to YYYYMMDD format for ArXiv API
-        date_formatted = date.replace("-", "")
-        start_time = date_formatted + "0000"
-        end_time = date_formatted + "2359"
-        query = f"submittedDate:[{start_time}+TO+{end_time}]+AND+cat:{category}"
+        query = self.historical_query(category, date)
         return await self._explore_papers_with_query(query, start_index, limit)
 
+    @staticmethod
+    def historical_query(category: str, date: str) -> str:
+        """Build the search query for one category on one submission day.
+
+        Args:
+            category: ArXiv category (e.g., "cs.AI")
+            date: Date in YYYY-MM-DD format
+
+        Returns:
+            ArXiv search query string
+        """
+        return ArxivSourceExplorer.date_range_query(category, date, date)
+
+    @staticmethod
+    def date_range_query(
+        categories: str | Sequence[str], start_date: str, end_date: str
+    ) -> str:
+        """Build the search query for categories over whole submission days.
+
+        Args:
+            categories: ArXiv category (e.g., "cs.AI") or several categories
+                matched with OR
+            start_date: First day in YYYY-MM-DD format
+            end_date: Last day (inclusive) in YYYY-MM-DD format
+
+        Returns:
+            ArXiv search query string
+        """
+        # Convert YYYY-MM-DD to YYYYMMDD format for ArXiv API
+        start_time = start_date.replace("-", "") + "0000"
+        end_time = end_date.replace("-", "") + "2359"
+        category_clause = ArxivSourceExplorer.category_query(categories)
+        return f"submittedDate:[{start_time}+TO+{end_time}]+AND+{category_clause}"
+
+    @staticmethod
+    def category_query(categories: str | Sequence[str]) -> str:
+        """Build the category clause of a search query.
+
+        A paper cross-listed in several categories matches an OR-combined
+        clause once, so one request replaces one request per category.
+
+        Args:
+            categories: ArXiv category or categories
+
+        Returns:
+            ``cat:X`` for one category, ``(cat:X+OR+cat:Y)`` for several
+        """
+        if isinstance(categories, str):
+            categories = [categories]
+        clause = "+OR+".join(f"cat:{category}" for category in categories)
+        return clause if len(categories) == 1 else f"({clause})"
+
+    @staticmethod
+    def attribute_categories(paper: ArxivPaper, categories: Sequence[str]) -> list[str]:
+        """Find which of the queried categories a paper belongs to.
+
+        Args:
+            paper: Paper returned by a combined category query
+            categories: Categories the query was OR-combined from
+
+        Returns:
+            Queried categories listed on the paper, in query order
+        """
+        return [category for category in categories if category in paper.categories]
+
+    async def count_results(self, query: str) -> int:
+        """Ask arXiv how many papers match a query without fetching entries.
+
+        Args:
+            query: ArXiv query string
+
+        Returns:
+            Total number of matching papers
+
+        Raises:
+            NetworkError: If network request fails
+            ParsingError: If the feed carries no totalResults element
+        """
+        xml_content = await self.fetch_page_xml(query, 0, 0)
+        total = self.parse_total_results(xml_content)
+        if total is None:
+            raise ParsingError("ArXiv feed has no opensearch:totalResults")
+        return total
+
+    async def explore_by_ids(self, arxiv_ids: Sequence[str]) -> list[ArxivPaper]:
+        """Fetch specific papers with ``id_list`` requests.
+
+        IDs are sent in chunks of ``max_results_per_request``. Pages are not
+        cached, since the same IDs are refetched to pick up revisions.
+
+        Args:
+            arxiv_ids: ArXiv IDs, with or without version
+
+        Returns:
+            List of ArXiv papers; unknown IDs are absent
+
+        Raises:
+            NetworkError: If network request fails
+            ParsingError: If a response is empty
+        """
+        papers: list[ArxivPaper] = []
+        for offset in range(0, len(arxiv_ids), self.max_results_per_request):
+            chunk = arxiv_ids[offset : offset + self.max_results_per_request]
+            params = {
+                "id_list": ",".join(chunk),
+                "start": "0",
+                "max_results": str(len(chunk)),
+            }
+            try:
+                response = await http_get(
+                    self.api_base_url,
+                    params,
+                    client=self.http_client,
+                    rate_limiter=self.rate_limiter,
+                )
+            except httpx.RequestError as e:
+                raise NetworkError(f"Network error fetching papers: {e}") from e
+            except httpx.HTTPStatusError as e:
+                raise NetworkError(f"HTTP error fetching papers: {e}") from e
+            papers.extend(self._parse_xml_response(response.text))
+        return papers
+
+    async def fetch_page_xml(self, query: str, start: int, max_results: int) -> str:
+        """Fetch one raw Atom page without parsing it.
+
+        Lets callers overlap parsing with the next network request. With a
+        response cache, repeated queries are served or revalidated from disk.
+
+        Args:
+            query: ArXiv query string
+            start: Starting index
+            max_results: Maximum number of results
+
+        Returns:
+            Raw XML response
+
+        Raises:
+            NetworkError: If network request fails
+        """
+        # Build URL manually to preserve + characters in the query
+        # ArXiv API expects + characters to remain as +, not encoded as %2B
+        url = (
+            f"{self.api_base_url}?"
+            f"search_query={query}&"
+            f"start={start}&"
+            f"max_results={max_results}&"
+            f"sortBy=submittedDate&"
+            f"sortOrder=descending"
+        )
+
+        try:
+            if self.response_cache is not None:
+                return await self.response_cache.fetch(
+                    url, client=self.http_client, rate_limiter=self.rate_limiter
+                )
+            response = await http_get(
+                url, client=self.http_client, rate_limiter=self.rate_limiter
+            )
+            return response.text
+        except httpx.RequestError as e:
+            raise NetworkError(f"Network error fetching papers: {e}") from e
+        except httpx.HTTPStatusError as e:
+            raise NetworkError(f"HTTP error fetching papers: {e}") from e
+
+    def parse_papers_xml(self, xml_content: str) -> list[ArxivPaper]:
+        """Parse a raw Atom page into ArXiv papers (CPU-bound, thread-safe).
+
+        Args:
+            xml_content: Raw XML returned by fetch_page_xml
+
+        Returns:
+            List of ArXiv papers
+        """
+        return self._parse_xml_response(xml_content)
+
+    @staticmethod
+    def count_entries(xml_content: str) -> int:
+        """Count Atom entries in a raw page without parsing it.
+
+        Args:
+            xml_content: Raw XML returned by fetch_page_xml
+
+        Returns:
+            Number of entry elements in the page
+        """
+        return len(_ENTRY_TAG_PATTERN.findall(xml_content))
+
+    @staticmethod
+    def parse_total_results(xml_content: str) -> int | None:
+        """Read ``opensearch:totalResults`` from a raw page without parsing it.
+
+        Args:
+            xml_content: Raw XML returned by fetch_page_xml
+
+        Returns:
+            Total number of matching papers, or None if absent
+        """
+        match = _TOTAL_RESULTS_PATTERN.search(xml_content)
+        return int(match.group(1)) if match else None
+
     async def explore_new_papers_by_category_as_arxiv(
         self, category: str, start_date: str, start_index: int = 0, limit: int = 100
     ) -> list[ArxivPaper]:
@@ -191,9 +408,6 @@ class ArxivSourceExplorer(BaseSourceExplorer):
                 papers.extend(batch)
                 start_index += len(batch)
 
-                # Rate limiting
-                await asyncio.sleep(self.delay_seconds)
-
             except (NetworkError, ParsingError) as e:
                 logger.error(f"Error fetching papers batch: {e}")
                 break
@@ -237,26 +451,8 @@ class ArxivSourceExplorer(BaseSourceExplorer):
             NetworkError: If network request fails
             ParsingError: If response parsing fails
         """
-        # Build URL manually to preserve + characters in the query
-        # ArXiv API expects + characters to remain as +, not encoded as %2B
-        url = (
-            f"{self.api_base_url}?"
-            f"search_query={query}&"
-            f"start={start}&"
-            f"max_results={max_results}&"
-            f"sortBy=submittedDate&"
-            f"sortOrder=descending"
-        )
-
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                return self._parse_xml_response(response.text)
-        except httpx.RequestError as e:
-            raise NetworkError(f"Network error fetching papers: {e}") from e
-        except httpx.HTTPStatusError as e:
-            raise NetworkError(f"HTTP error fetching papers: {e}") from e
+        xml_content = await self.fetch_page_xml(query, start, max_results)
+        return self._parse_xml_response(xml_content)
 
     def _parse_xml_response(self, xml_content: str) -> list[ArxivPaper]:
         """Parse XML response from ArXiv API.
@@ -265,103 +461,99 @@ class ArxivSourceExplorer(BaseSourceExplorer):
             xml_content: XML response content
 
         Returns:
-            List of ArXiv papers
+            List of ArXiv papers; entries before a malformed part are kept
 
         Raises:
-            ParsingError: If parsing fails
+            ParsingError: If the content is empty
         """
         if not xml_content or not xml_content.strip():
             raise ParsingError("Empty XML content provided")
 
+        papers: list[ArxivPaper] = []
         try:
-            # Parse XML and find all entries
-            import xml.etree.ElementTree as ElementTree
-
-            root = ElementTree.fromstring(xml_content)
-
-            # Debug: log the XML structure
-            logger.debug(f"XML root tag: {root.tag}")
-            logger.debug(f"XML root attributes: {root.attrib}")
-
-            # Try different ways to find entries
-            entries = root.findall("atom:entry", self.extractor.namespace)
-            logger.debug(f"Found {len(entries)} entries with atom:entry namespace")
-
-            if not entries:
-                # Try without namespace
-                entries = root.findall("entry")
-                logger.debug(f"Found {len(entries)} entries without namespace")
-
-            if not entries:
-                # Try with explicit namespace
-                entries = root.findall(".//{http://www.w3.org/2005/Atom}entry")
-                logger.debug(f"Found {len(entries)} entries with explicit namespace")
-
-            if not entries:
-                # Try with wildcard
-                entries = root.findall(".//entry")
-                logger.debug(f"Found {len(entries)} entries with wildcard")
-
-            papers = []
-            for entry in entries:
-                try:
-                    paper = self._parse_entry_to_paper(entry)
-                    papers.append(paper)
-                except Exception as e:
-                    logger.warning(f"Failed to parse entry: {e}")
-                    continue
-
-            logger.debug(f"Successfully parsed {len(papers)} papers")
-            return papers
-        except Exception as e:
+            papers.extend(iter_atom_papers(xml_content))
+        except ParsingError as e:
             logger.warning(f"Failed to parse XML response: {e}")
-            return []
 
-    def _parse_entry_to_paper(self, entry: Any) -> ArxivPaper:
-        """Parse a single entry element into ArxivPaper using ArxivExtractor methods.
+        logger.debug(f"Successfully parsed {len(papers)} papers")
+        return papers
+
+
+class DateWindowPlanner:
+    """Adaptive planner sizing multi-day query windows per category group.
+
+    Quiet categories return a handful of papers per day, so one query per
+    day wastes most requests. The planner probes ``opensearch:totalResults``
+    for a window of several days, halves the window while the count exceeds
+    one page, and doubles the next window for a category whose counts stay
+    well below a page.
+    """
+
+    def __init__(
+        self,
+        explorer: ArxivSourceExplorer,
+        max_window_days: int = 7,
+        max_results: int = 100,
+    ) -> None:
+        """Initialize the planner.
+
+        Args:
+            explorer: Explorer used to probe result counts
+            max_window_days: Upper bound on days covered by one window
+            max_results: Results a window may hold; normally one page
+        """
+        self.explorer = explorer
+        self.max_window_days = max(1, max_window_days)
+        self.max_results = max_results
+        self._window_days: dict[str, int] = {}
+
+    def window_days(self, categories: str | Sequence[str]) -> int:
+        """Current window size in days for a category or category group."""
+        return self._window_days.get(self._key(categories), self.max_window_days)
+
+    async def plan(
+        self, categories: str | Sequence[str], days: list[str]
+    ) -> tuple[list[str], int | None]:
+        """Choose the days to crawl with one query.
 
         Args:
-            entry: XML entry element
+            categories: ArXiv category (e.g., "cs.AI") or categories queried
+                together with OR
+            days: Consecutive candidate days, newest first
 
         Returns:
-            ArxivPaper instance
+            Tuple of (chosen days newest first, total results or None when
+            a single day is chosen without probing)
+
+        Raises:
+            NetworkError: If a probe request fails
+            ParsingError: If a probe response has no result count
         """
-        # Extract ArXiv ID from the entry ID
-        entry_id = extract_xml_text(entry, "atom:id", self.extractor.namespace)
-        arxiv_id = entry_id.split("/")[-1] if entry_id else ""
-
-        # Extract basic metadata using utility functions
-        title = extract_xml_text(entry, "atom:title", self.extractor.namespace)
-        abstract = extract_xml_text(entry, "atom:summary", self.extractor.namespace)
-        authors = extract_xml_authors(entry, self.extractor.namespace)
-        categories = extract_xml_categories(entry, self.extractor.namespace)
-        published_date = extract_xml_date(
-            entry, "atom:published", self.extractor.namespace
-        )
-        updated_date = extract_xml_date(entry, "atom:updated", self.extractor.namespace)
-
-        # Determine primary category
-        primary_category = categories[0] if categories else ""
-
-        # Build URLs
-        pdf_url = f"https://arxiv.org/pdf/{arxiv_id}"
-        arxiv_url = f"https://arxiv.org/abs/{arxiv_id}"
-
-        return ArxivPaper(
-            arxiv_id=arxiv_id,
-            title=title,
-            abstract=abstract,
-            authors=authors,
-            categories=categories,
-            primary_category=primary_category,
-            published_date=published_date,
-            updated_date=updated_date,
-            url_pdf=pdf_url,
-            url_abs=arxiv_url,
-            doi=None,
-            journal=None,
-            volume=None,
-            pages=None,
-            keywords=[],
-            raw_metadata={},
+        key = self._key(categories)
+        window = days[: self.window_days(key)]
+        if len(window) <= 1:
+            return window, None
+
+        while True:
+            query = self.explorer.date_range_query(categories, window[-1], window[0])
+            total = await self.explorer.count_results(query)
+            if total <= self.max_results or len(window) == 1:
+                break
+            window = window[: len(window) // 2]
+            # Remember the split so the next window starts at a size that fits
+            self._window_days[key] = len(window)
+
+        if total <= self.max_results // 2:
+            self._window_days[key] = min(
+                self.max_window_days,
+                max(self.window_days(key), len(window) * 2),
+            )
+        logger.debug(
+            f"Planned {len(window)}-day window for {key} "
+            f"({window[-1]}..{window[0]}, {total} results)"
         )
+        return window, total
+
+    @staticmethod
+    def _key(categories: str | Sequence[str]) -> str:
+        return categories if isinstance(categories, str) else ",".join(categories)
@@ -1,13 +1,22 @@
 """ArXiv storage manager for paper metadata storage."""
 
+from collections.abc import Iterable, Sequence
 from typing import Any
 
-from sqlmodel import Session, select
+from sqlalchemy import tuple_
+from sqlmodel import Session, col, func, select
+from sqlmodel.sql.expression import SelectOfScalar
 from tqdm import tqdm
 
 from core.log import get_logger
 from core.models.domain.arxiv import ArxivPaper
-from core.models.rows import ArxivFailedPaper, Paper
+from core.models.rows import (
+    ArxivFailedPaper,
+    CrawlCheckpoint,
+    CrawlCompletion,
+    CrawlFailedUnit,
+    Paper,
+)
 from core.types import PaperSummaryStatus
 from core.utils import get_current_timestamp
 
@@ -38,10 +47,7 @@ class ArxivStorageManager:
         Returns:
             Created Paper object or None if already exists
         """
-        # Extract ArXiv-specific information from ArxivPaper
         arxiv_id = paper.arxiv_id
-        primary_category = paper.primary_category
-        all_categories = paper.categories
 
         with Session(self.engine) as session:
             # Check if paper already exists
@@ -58,18 +64,7 @@ class ArxivStorageManager:
                 return None
 
             # Create new paper record with batched status
-            db_paper = Paper(
-                arxiv_id=arxiv_id,
-                title=paper.title,
-                abstract=paper.abstract,
-                primary_category=primary_category,
-                categories=",".join(all_categories),
-                authors=";".join(paper.authors),
-                url_abs=paper.url_abs,
-                url_pdf=paper.url_pdf,
-                published_at=paper.published_date,
-                summary_status=PaperSummaryStatus.BATCHED,
-            )
+            db_paper = self._to_row(paper)
 
             session.add(db_paper)
             session.commit()
@@ -87,6 +82,328 @@ class ArxivStorageManager:
 
             return db_paper
 
+    @staticmethod
+    def _to_row(paper: ArxivPaper) -> Paper:
+        """Build a Paper row with batched status from an ArxivPaper."""
+        return Paper(
+            arxiv_id=paper.arxiv_id,
+            title=paper.title,
+            abstract=paper.abstract,
+            primary_category=paper.primary_category,
+            categories=",".join(paper.categories),
+            authors=";".join(paper.authors),
+            url_abs=paper.url_abs,
+            url_pdf=paper.url_pdf,
+            published_at=paper.published_date,
+            latest_version=paper.version,
+            summary_status=PaperSummaryStatus.BATCHED,
+        )
+
+    @staticmethod
+    def _revision(paper_id: int, paper: ArxivPaper) -> dict[str, Any]:
+        """Build the update mapping that moves a stored row to a new version."""
+        return {
+            "paper_id": paper_id,
+            "latest_version": paper.version,
+            "title": paper.title,
+            "abstract": paper.abstract,
+            "primary_category": paper.primary_category,
+            "categories": ",".join(paper.categories),
+            "authors": ";".join(paper.authors),
+            "url_abs": paper.url_abs,
+            "url_pdf": paper.url_pdf,
+            "updated_at": get_current_timestamp(),
+            "summary_status": PaperSummaryStatus.BATCHED,
+        }
+
+    def store_papers_bulk(self, papers: list[ArxivPaper]) -> int:
+        """Insert new papers and apply revisions in a single transaction.
+
+        Existing arXiv IDs are looked up with one IN query instead of one
+        SELECT per paper. Synchronous, so it can run in a worker thread.
+
+        Args:
+            papers: List of ArxivPaper objects to store
+
+        Returns:
+            Number of newly stored papers
+
+        Raises:
+            Exception: If the transaction fails; nothing is written then
+        """
+        inserted, _ = self.upsert_papers(papers)
+        return len(inserted)
+
+    def upsert_papers(self, papers: list[ArxivPaper]) -> tuple[set[str], set[str]]:
+        """Insert new papers and update stored ones whose version increased.
+
+        Stored versions are read with one IN query; new rows are inserted
+        and revised rows updated by primary key as one executemany each, so
+        no row is loaded into the session. Revised papers get the new
+        metadata and go back to batched status so their summaries are
+        regenerated. Papers at the same or an older version are skipped.
+
+        Args:
+            papers: List of ArxivPaper objects to store
+
+        Returns:
+            arXiv IDs of the inserted papers and of the revised papers
+
+        Raises:
+            Exception: If the transaction fails; nothing is written then
+        """
+        if not papers:
+            return set(), set()
+
+        # Keep the newest version of papers listed more than once
+        latest: dict[str, ArxivPaper] = {}
+        for paper in papers:
+            seen = latest.get(paper.arxiv_id)
+            if seen is None or paper.version > seen.version:
+                latest[paper.arxiv_id] = paper
+
+        with Session(self.engine) as session:
+            stored_versions = {
+                arxiv_id: (paper_id, version)
+                for arxiv_id, paper_id, version in session.exec(
+                    select(Paper.arxiv_id, Paper.paper_id, Paper.latest_version).where(
+                        Paper.arxiv_id.in_(list(latest))  # type: ignore
+                    )
+                ).all()
+            }
+
+            new_rows: list[Paper] = []
+            revisions: list[dict[str, Any]] = []
+            inserted: set[str] = set()
+            revised: set[str] = set()
+            for arxiv_id, paper in latest.items():
+                stored = stored_versions.get(arxiv_id)
+                if stored is None:
+                    new_rows.append(self._to_row(paper))
+                    inserted.add(arxiv_id)
+                    continue
+                paper_id, stored_version = stored
+                if paper_id is not None and paper.version > stored_version:
+                    revisions.append(self._revision(paper_id, paper))
+                    revised.add(arxiv_id)
+
+            try:
+                session.add_all(new_rows)
+                if revisions:
+                    session.bulk_update_mappings(Paper, revisions)
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+
+        logger.debug(
+            f"Stored {len(inserted)} new papers, revised {len(revised)}, "
+            f"skipped {len(papers) - len(inserted) - len(revised)} unchanged"
+        )
+        return inserted, revised
+
+    def record_completions(
+        self, unit_counts: dict[tuple[str, str], tuple[int, int]]
+    ) -> int:
+        """Mark (category, day) units completed, skipping recorded ones.
+
+        Args:
+            unit_counts: (category, day) -> (papers_found, papers_stored)
+
+        Returns:
+            Number of completion rows written
+        """
+        if not unit_counts:
+            return 0
+
+        with Session(self.engine) as session:
+            # Only the requested units are looked up, not the whole history
+            recorded = set(
+                session.exec(
+                    select(CrawlCompletion.category, CrawlCompletion.date).where(
+                        tuple_(
+                            col(CrawlCompletion.category), col(CrawlCompletion.date)
+                        ).in_(list(unit_counts))
+                    )
+                ).all()
+            )
+            rows = [
+                CrawlCompletion(
+                    category=category,
+                    date=day,
+                    papers_found=found,
+                    papers_stored=stored,
+                )
+                for (category, day), (found, stored) in unit_counts.items()
+                if (category, day) not in recorded
+            ]
+            session.add_all(rows)
+            session.commit()
+        return len(rows)
+
+    def completed_intervals(
+        self, categories: Sequence[str]
+    ) -> list[tuple[str, str, str]]:
+        """Load recorded completions as runs of consecutive days.
+
+        Runs are found in SQL (day number minus row number is constant
+        within a run), so only one row per run is transferred.
+
+        Args:
+            categories: ArXiv categories to load
+
+        Returns:
+            (category, first_day, last_day) per run, oldest first
+        """
+        days = (
+            select(CrawlCompletion.category, CrawlCompletion.date)
+            .where(CrawlCompletion.category.in_(list(categories)))  # type: ignore
+            .distinct()
+            .subquery()
+        )
+        runs = select(
+            days.c.category,
+            days.c.date,
+            (
+                func.julianday(days.c.date)
+                - func.row_number().over(
+                    partition_by=days.c.category, order_by=days.c.date
+                )
+            ).label("run"),
+        ).subquery()
+        statement = (
+            select(runs.c.category, func.min(runs.c.date), func.max(runs.c.date))
+            .group_by(runs.c.category, runs.c.run)
+            .order_by(runs.c.category, func.min(runs.c.date))
+        )
+        with Session(self.engine) as session:
+            return [tuple(row) for row in session.exec(statement).all()]
+
+    def latest_published_at(self, category: str) -> str | None:
+        """Get the submission time of the newest stored paper in a category.
+
+        Papers are walked newest first along the ``published_at`` index, so
+        the lookup stops at the first paper listing the category.
+
+        Args:
+            category: ArXiv category (e.g., "cs.AI")
+
+        Returns:
+            ISO8601 datetime, or None if no paper of the category is stored
+        """
+        # Match whole entries of the comma-separated list: cs.A is not cs.AI
+        listed = ("," + col(Paper.categories) + ",").contains(
+            f",{category},", autoescape=True
+        )
+        with Session(self.engine) as session:
+            return session.exec(
+                select(Paper.published_at)
+                .where(listed)
+                .order_by(col(Paper.published_at).desc())
+                .limit(1)
+            ).first()
+
+    @staticmethod
+    def _checkpoint_statement(
+        categories: Sequence[str], start_date: str, end_date: str
+    ) -> SelectOfScalar[CrawlCheckpoint]:
+        return select(CrawlCheckpoint).where(
+            CrawlCheckpoint.categories == ",".join(categories),
+            CrawlCheckpoint.start_date == start_date,
+            CrawlCheckpoint.end_date == end_date,
+        )
+
+    def load_checkpoint(
+        self, categories: Sequence[str], start_date: str, end_date: str
+    ) -> CrawlCheckpoint | None:
+        """Load the page cursor of an interrupted query.
+
+        Args:
+            categories: Categories of the query, in query order
+            start_date: First day in YYYY-MM-DD format
+            end_date: Last day in YYYY-MM-DD format
+
+        Returns:
+            Checkpoint, or None if the query has no unfinished pages
+        """
+        with Session(self.engine) as session:
+            return session.exec(
+                self._checkpoint_statement(categories, start_date, end_date)
+            ).first()
+
+    def find_checkpoint(self, category: str, date: str) -> CrawlCheckpoint | None:
+        """Find an interrupted query whose newest day is ``date``.
+
+        Args:
+            category: Category the query must include
+            date: Last day of the query in YYYY-MM-DD format
+
+        Returns:
+            Checkpoint, or None if no such query was interrupted
+        """
+        with Session(self.engine) as session:
+            checkpoints = session.exec(
+                select(CrawlCheckpoint).where(CrawlCheckpoint.end_date == date)
+            ).all()
+        for checkpoint in checkpoints:
+            if category in checkpoint.categories.split(","):
+                return checkpoint
+        return None
+
+    def save_checkpoint(
+        self,
+        categories: Sequence[str],
+        start_date: str,
+        end_date: str,
+        next_index: int,
+        papers_found: int,
+        papers_stored: int,
+    ) -> None:
+        """Create or move the page cursor of a query.
+
+        Args:
+            categories: Categories of the query, in query order
+            start_date: First day in YYYY-MM-DD format
+            end_date: Last day in YYYY-MM-DD format
+            next_index: Start index of the first page not stored yet
+            papers_found: Papers found up to ``next_index``
+            papers_stored: Papers stored up to ``next_index``
+        """
+        with Session(self.engine) as session:
+            checkpoint = session.exec(
+                self._checkpoint_statement(categories, start_date, end_date)
+            ).first()
+            if checkpoint is None:
+                checkpoint = CrawlCheckpoint(
+                    categories=",".join(categories),
+                    start_date=start_date,
+                    end_date=end_date,
+                )
+            checkpoint.next_index = next_index
+            checkpoint.papers_found = papers_found
+            checkpoint.papers_stored = papers_stored
+            checkpoint.updated_at = get_current_timestamp()
+            session.add(checkpoint)
+            session.commit()
+
+    def clear_checkpoint(
+        self, categories: Sequence[str], start_date: str, end_date: str
+    ) -> None:
+        """Delete the page cursor of a query once all its pages are stored.
+
+        Args:
+            categories: Categories of the query, in query order
+            start_date: First day in YYYY-MM-DD format
+            end_date: Last day in YYYY-MM-DD format
+        """
+        with Session(self.engine) as session:
+            checkpoint = session.exec(
+                self._checkpoint_statement(categories, start_date, end_date)
+            ).first()
+            if checkpoint is not None:
+                session.delete(checkpoint)
+                session.commit()
+
     async def store_papers_batch(self, papers: list[ArxivPaper]) -> int:
         """Store multiple papers in batch.
 
@@ -152,3 +469,184 @@ class ArxivStorageManager:
                 logger.info(f"Stored failed paper {arxiv_id}: {error_message}")
 
             session.commit()
+
+    def load_failed_papers(self) -> list[ArxivFailedPaper]:
+        """Load every paper failure that has not been resolved yet.
+
+        Returns:
+            Failed paper records, oldest first
+        """
+        with Session(self.engine) as session:
+            return list(
+                session.exec(
+                    select(ArxivFailedPaper).order_by(
+                        ArxivFailedPaper.failed_id  # type: ignore
+                    )
+                ).all()
+            )
+
+    def resolve_failed_papers(self, arxiv_ids: Iterable[str]) -> int:
+        """Delete the failure records of papers that were stored on retry.
+
+        Args:
+            arxiv_ids: ArXiv IDs as recorded in the failed papers table
+
+        Returns:
+            Number of failure records deleted
+        """
+        with Session(self.engine) as session:
+            records = session.exec(
+                select(ArxivFailedPaper).where(
+                    ArxivFailedPaper.arxiv_id.in_(list(arxiv_ids))  # type: ignore
+                )
+            ).all()
+            for record in records:
+                session.delete(record)
+            session.commit()
+            return len(records)
+
+    def mark_failed_papers_retried(
+        self, arxiv_ids: Iterable[str], error_message: str
+    ) -> None:
+        """Count one more failed retry for each paper.
+
+        Args:
+            arxiv_ids: ArXiv IDs as recorded in the failed papers table
+            error_message: Error message of the retry
+        """
+        now = get_current_timestamp()
+        with Session(self.engine) as session:
+            for record in session.exec(
+                select(ArxivFailedPaper).where(
+                    ArxivFailedPaper.arxiv_id.in_(list(arxiv_ids))  # type: ignore
+                )
+            ).all():
+                record.retry_count += 1
+                record.last_retry_at = now
+                record.updated_at = now
+                record.error_message = error_message
+                session.add(record)
+            session.commit()
+
+    def record_failed_units(
+        self, units: Iterable[tuple[str, str]], error_message: str
+    ) -> None:
+        """Queue failed (category, day) units for retry.
+
+        A unit that is queued already counts one more failed retry.
+
+        Args:
+            units: (category, day) pairs whose crawl failed
+            error_message: Error message of the failed crawl
+        """
+        units = set(units)
+        if not units:
+            return
+
+        now = get_current_timestamp()
+        with Session(self.engine) as session:
+            queued = {
+                (record.category, record.date): record
+                for record in session.exec(
+                    select(CrawlFailedUnit).where(
+                        CrawlFailedUnit.category.in_(  # type: ignore
+                            {category for category, _ in units}
+                        )
+                    )
+                ).all()
+            }
+            for category, day in units:
+                record = queued.get((category, day))
+                if record is None:
+                    record = CrawlFailedUnit(
+                        category=category, date=day, error_message=error_message
+                    )
+                else:
+                    record.retry_count += 1
+                    record.last_retry_at = now
+                    record.error_message = error_message
+                record.updated_at = now
+                session.add(record)
+            session.commit()
+
+    def clear_failed_units(self, units: Iterable[tuple[str, str]]) -> int:
+        """Remove (category, day) units from the retry queue once crawled.
+
+        Args:
+            units: (category, day) pairs that were crawled completely
+
+        Returns:
+            Number of queued units removed
+        """
+        units = set(units)
+        if not units:
+            return 0
+
+        with Session(self.engine) as session:
+            records = [
+                record
+                for record in session.exec(
+                    select(CrawlFailedUnit).where(
+                        CrawlFailedUnit.category.in_(  # type: ignore
+                            {category for category, _ in units}
+                        )
+                    )
+                ).all()
+                if (record.category, record.date) in units
+            ]
+            for record in records:
+                session.delete(record)
+            session.commit()
+            return len(records)
+
+    def load_failed_units(self) -> list[CrawlFailedUnit]:
+        """Load every queued failed unit.
+
+        Returns:
+            Failed unit records, newest day first
+        """
+        with Session(self.engine) as session:
+            return list(
+                session.exec(
+                    select(CrawlFailedUnit).order_by(
+                        CrawlFailedUnit.date.desc()  # type: ignore
+                    )
+                ).all()
+            )
+
+    def completion_totals(self, categories: Sequence[str]) -> tuple[int, int, int]:
+        """Aggregate recorded completions of categories.
+
+        Args:
+            categories: ArXiv categories to aggregate
+
+        Returns:
+            Tuple of (completed_units, papers_found, papers_stored); papers
+            cross-listed in several categories count once per category
+        """
+        with Session(self.engine) as session:
+            units, papers_found, papers_stored = session.exec(
+                select(
+                    func.count(),
+                    func.coalesce(func.sum(CrawlCompletion.papers_found), 0),
+                    func.coalesce(func.sum(CrawlCompletion.papers_stored), 0),
+                ).where(
+                    CrawlCompletion.category.in_(list(categories))  # type: ignore
+                )
+            ).one()
+        return units, papers_found, papers_stored
+
+    def count_failures(self) -> tuple[int, int]:
+        """Count unresolved failures.
+
+        Returns:
+            Tuple of (failed_papers, failed_units)
+        """
+        with Session(self.engine) as session:
+            failed_papers = session.exec(
+                select(func.count()).select_from(ArxivFailedPaper)
+            ).one()
+            failed_units = session.exec(
+                select(func.count()).select_from(CrawlFailedUnit)
+            ).one()
+        return failed_papers, failed_units
@@ -0,0 +1,147 @@
+"""Interval index of completed date-category crawl units."""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from datetime import date
+
+
+def _ordinal(day: str) -> int:
+    return date.fromisoformat(day).toordinal()
+
+
+def _day(ordinal: int) -> str:
+    return date.fromordinal(ordinal).isoformat()
+
+
+class CompletedUnitIndex:
+    """Completed (category, day) units as disjoint day intervals per category.
+
+    Each category keeps sorted start and end day ordinals of maximal runs of
+    completed days, so a decade of contiguous crawling is one interval.
+    Membership and gap lookups are binary searches; adding a day merges it
+    with the neighbouring runs.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._starts: dict[str, list[int]] = {}
+        self._ends: dict[str, list[int]] = {}
+        self._count = 0
+
+    def add(self, category: str, day: str) -> bool:
+        """Mark one unit completed.
+
+        Args:
+            category: ArXiv category (e.g., "cs.AI")
+            day: Date in YYYY-MM-DD format
+
+        Returns:
+            True if the unit was not completed before
+        """
+        count = self._count
+        self.add_interval(category, day, day)
+        return self._count > count
+
+    def add_interval(self, category: str, first_day: str, last_day: str) -> None:
+        """Mark every day from ``first_day`` to ``last_day`` completed.
+
+        Args:
+            category: ArXiv category (e.g., "cs.AI")
+            first_day: First day in YYYY-MM-DD format
+            last_day: Last day (inclusive) in YYYY-MM-DD format
+        """
+        starts = self._starts.setdefault(category, [])
+        ends = self._ends.setdefault(category, [])
+        low, high = _ordinal(first_day), _ordinal(last_day)
+
+        # Runs overlapping or touching [low, high] collapse into one
+        first = bisect_left(ends, low - 1)
+        last = bisect_right(starts, high + 1)
+        covered = 0
+        if first < last:
+            covered = sum(ends[i] - starts[i] + 1 for i in range(first, last))
+            low = min(low, starts[first])
+            high = max(high, ends[last - 1])
+        starts[first:last] = [low]
+        ends[first:last] = [high]
+        self._count += high - low + 1 - covered
+
+    def __contains__(self, unit: object) -> bool:
+        """Check whether a (category, day) unit is completed."""
+        if not isinstance(unit, tuple) or len(unit) != 2:
+            return False
+        category, day = unit
+        starts = self._starts.get(category)
+        if not starts:
+            return False
+        ordinal = _ordinal(day)
+        index = bisect_right(starts, ordinal) - 1
+        return index >= 0 and self._ends[category][index] >= ordinal
+
+    def next_gap(self, category: str, day: str) -> str:
+        """Get the newest day on or before ``day`` that is not completed.
+
+        Args:
+            category: ArXiv category (e.g., "cs.AI")
+            day: Date in YYYY-MM-DD format
+
+        Returns:
+            ``day`` itself, or the day before the run of completed days
+            containing it
+        """
+        starts = self._starts.get(category)
+        if not starts:
+            return day
+        ordinal = _ordinal(day)
+        index = bisect_right(starts, ordinal) - 1
+        if index >= 0 and self._ends[category][index] >= ordinal:
+            return _day(starts[index] - 1)
+        return day
+
+    def count_between(self, category: str, first_day: str, last_day: str) -> int:
+        """Count completed days of a category in an inclusive range.
+
+        Args:
+            category: ArXiv category (e.g., "cs.AI")
+            first_day: First day in YYYY-MM-DD format
+            last_day: Last day (inclusive) in YYYY-MM-DD format
+
+        Returns:
+            Number of completed days from ``first_day`` to ``last_day``
+        """
+        starts = self._starts.get(category, [])
+        ends = self._ends.get(category, [])
+        low, high = _ordinal(first_day), _ordinal(last_day)
+        total = 0
+        index = bisect_left(ends, low)
+        while index < len(starts) and starts[index] <= high:
+            total += min(ends[index], high) - max(starts[index], low) + 1
+            index += 1
+        return total
+
+    def intervals(self, category: str) -> list[tuple[str, str]]:
+        """Get the completed runs of a category, oldest first."""
+        return [
+            (_day(start), _day(end))
+            for start, end in zip(
+                self._starts.get(category, []),
+                self._ends.get(category, []),
+                strict=True,
+            )
+        ]
+
+    @property
+    def interval_count(self) -> int:
+        """Number of completed runs over all categories."""
+        return sum(len(starts) for starts in self._starts.values())
+
+    def __len__(self) -> int:
+        """Number of completed units."""
+        return self._count
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        """Yield every completed (category, day) unit."""
+        for category, starts in self._starts.items():
+            for start, end in zip(starts, self._ends[category], strict=True):
+                for ordinal in range(start, end + 1):
+                    yield category, _day(ordinal)
@@ -0,0 +1,238 @@
+"""Retry queue for ArXiv papers and crawl units that failed."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.engine import Engine
+
+from core.extractors.concrete.arxiv_source_explorer import ArxivSourceExplorer
+from core.extractors.concrete.arxiv_storage_manager import ArxivStorageManager
+from core.extractors.concrete.historical_crawl_manager import HistoricalCrawlManager
+from core.log import get_logger
+from core.utils import parse_datetime, split_arxiv_version
+
+logger = get_logger(__name__)
+
+
+class CrawlRetryManager:
+    """Retries failed papers and failed date-category units with backoff.
+
+    A failure is due ``base_delay * 2**retry_count`` seconds (capped at
+    ``max_delay``) after its last attempt. Failed papers are refetched in
+    bulk through ``id_list``; failed units are crawled again through the
+    historical crawl manager, which keeps them open until they complete.
+    Failures that used up ``max_retries`` stay recorded but are skipped.
+    """
+
+    def __init__(
+        self,
+        historical_crawl_manager: HistoricalCrawlManager | None = None,
+        poll_interval: float = 300.0,
+        base_delay: float = 600.0,
+        max_delay: float = 86400.0,
+        max_retries: int = 5,
+        batch_size: int = 100,
+    ) -> None:
+        """Initialize the retry manager.
+
+        Args:
+            historical_crawl_manager: Manager that crawls failed units again;
+                only failed papers are retried when None
+            poll_interval: Seconds between retry cycles (default: 300.0)
+            base_delay: Backoff in seconds before the first retry
+                (default: 600.0)
+            max_delay: Upper bound of the backoff in seconds (default: 86400.0)
+            max_retries: Retries before a failure is given up (default: 5)
+            batch_size: Failures retried per kind and cycle (default: 100)
+        """
+        self.historical_crawl_manager = historical_crawl_manager
+        self.poll_interval = poll_interval
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retries = max_retries
+        self.batch_size = batch_size
+
+        self._running = False
+        self._retry_task: asyncio.Task[None] | None = None
+
+    def retry_delay(self, retry_count: int) -> float:
+        """Get the backoff in seconds after ``retry_count`` failed retries."""
+        return float(min(self.base_delay * 2**retry_count, self.max_delay))
+
+    def is_due(
+        self,
+        retry_count: int,
+        last_attempt_at: str,
+        now: datetime | None = None,
+    ) -> bool:
+        """Check whether a failure should be retried now.
+
+        Args:
+            retry_count: Failed retries so far
+            last_attempt_at: ISO8601 datetime of the last attempt
+            now: Current time (default: now in UTC)
+
+        Returns:
+            True if retries are left and the backoff has elapsed
+        """
+        if retry_count >= self.max_retries:
+            return False
+        attempted_at = parse_datetime(last_attempt_at)
+        if attempted_at is None:
+            return True
+        if attempted_at.tzinfo is None:
+            attempted_at = attempted_at.replace(tzinfo=UTC)
+        now = now or datetime.now(UTC)
+        return attempted_at + timedelta(seconds=self.retry_delay(retry_count)) <= now
+
+    async def retry_failed_papers(
+        self, engine: Engine, explorer: ArxivSourceExplorer
+    ) -> tuple[int, int]:
+        """Refetch due failed papers in bulk and store them.
+
+        Returns:
+            Tuple of (papers_retried, papers_recovered)
+        """
+        storage_manager = ArxivStorageManager(engine)
+        due = [
+            record
+            for record in await asyncio.to_thread(storage_manager.load_failed_papers)
+            if self.is_due(
+                record.retry_count, record.last_retry_at or record.created_at
+            )
+        ][: self.batch_size]
+        if not due:
+            return 0, 0
+
+        # Records may hold versioned IDs while refetched papers carry bare ones
+        recorded_ids: dict[str, list[str]] = {}
+        for record in due:
+            bare_id, _ = split_arxiv_version(record.arxiv_id)
+            recorded_ids.setdefault(bare_id, []).append(record.arxiv_id)
+
+        try:
+            papers = await explorer.explore_by_ids(list(recorded_ids))
+            await asyncio.to_thread(storage_manager.upsert_papers, papers)
+        except Exception as e:
+            logger.warning(f"Retry of {len(due)} failed papers failed: {e}")
+            await asyncio.to_thread(
+                storage_manager.mark_failed_papers_retried,
+                [record.arxiv_id for record in due],
+                str(e),
+            )
+            return len(due), 0
+
+        recovered = [
+            arxiv_id
+            for paper in papers
+            for arxiv_id in recorded_ids.pop(paper.arxiv_id, [])
+        ]
+        await asyncio.to_thread(storage_manager.resolve_failed_papers, recovered)
+        missing = [arxiv_id for ids in recorded_ids.values() for arxiv_id in ids]
+        if missing:
+            await asyncio.to_thread(
+                storage_manager.mark_failed_papers_retried,
+                missing,
+                "Not returned by id_list lookup",
+            )
+
+        logger.info(f"Retried {len(due)} failed papers, recovered {len(recovered)}")
+        return len(due), len(recovered)
+
+    async def retry_failed_units(
+        self, engine: Engine, explorer: ArxivSourceExplorer
+    ) -> tuple[int, int]:
+        """Crawl due failed units again, newest day first.
+
+        Newest first lets the resumed query of an interrupted multi-day
+        window complete its older units before they are retried alone.
+
+        Returns:
+            Tuple of (units_retried, units_recovered)
+        """
+        if self.historical_crawl_manager is None:
+            return 0, 0
+
+        storage_manager = ArxivStorageManager(engine)
+        due = [
+            (record.category, record.date)
+            for record in await asyncio.to_thread(storage_manager.load_failed_units)
+            if self.is_due(
+                record.retry_count, record.last_retry_at or record.created_at
+            )
+        ][: self.batch_size]
+
+        recovered = 0
+        for category, date in due:
+            if await self.historical_crawl_manager.retry_unit(
+                engine, explorer, category, date
+            ):
+                recovered += 1
+
+        if due:
+            logger.info(f"Retried {len(due)} failed units, recovered {recovered}")
+        return len(due), recovered
+
+    async def run_retry_cycle(
+        self, engine: Engine, explorer: ArxivSourceExplorer
+    ) -> dict[str, tuple[int, int]]:
+        """Retry due failed papers and units once.
+
+        Returns:
+            Dictionary mapping "papers" and "units" to (retried, recovered)
+        """
+        return {
+            "papers": await self.retry_failed_papers(engine, explorer),
+            "units": await self.retry_failed_units(engine, explorer),
+        }
+
+    async def start(self, explorer: ArxivSourceExplorer, engine: Engine) -> None:
+        """Start retrying in the background.
+
+        Args:
+            explorer: ArxivSourceExplorer instance for dependency injection
+            engine: Database engine instance for persistence
+        """
+        if self._running:
+            logger.warning("Crawl retry manager is already running")
+            return
+
+        logger.info("Starting crawl retry manager")
+        self._running = True
+        self._retry_task = asyncio.create_task(self._retry_scheduler(engine, explorer))
+
+    async def stop(self) -> None:
+        """Stop the crawl retry manager."""
+        if not self._running:
+            logger.warning("Crawl retry manager is not running")
+            return
+
+        logger.info("Stopping crawl retry manager")
+        self._running = False
+
+        if self._retry_task:
+            self._retry_task.cancel()
+            try:
+                await self._retry_task
+            except asyncio.CancelledError:
+                pass
+            self._retry_task = None
+
+    async def _retry_scheduler(
+        self, engine: Engine, explorer: ArxivSourceExplorer
+    ) -> None:
+        """Run a retry cycle every ``poll_interval`` seconds until stopped."""
+        while self._running:
+            try:
+                await self.run_retry_cycle(engine, explorer)
+            except asyncio.CancelledError:
+                logger.info("Crawl retry scheduler cancelled")
+                break
+            except Exception as e:
+                logger.error(f"Error in crawl retry scheduler: {e}")
+            await asyncio.sleep(self.poll_interval)
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the crawl retry manager is running."""
+        return self._running
@@ -0,0 +1,108 @@
+"""Rolling throughput counters of the crawl pipeline."""
+
+import time
+from collections import deque
+from dataclasses import dataclass
+
+from core.models.domain.arxiv import CrawlPipelineMetrics, CrawlThroughput
+
+
+@dataclass(frozen=True)
+class _FinishedQuery:
+    """Counters of one finished crawl query."""
+
+    started_at: float
+    finished_at: float
+    pages: int
+    papers: int
+    parse_seconds: float
+    store_seconds: float
+    store_batches: int
+    units: int
+
+
+class CrawlThroughputTracker:
+    """Keeps the pipeline metrics of recent crawl queries in memory.
+
+    Rates are taken over the wall-clock span of the queries that finished
+    within the last ``window_seconds``, so concurrent queries add up instead
+    of being averaged.
+    """
+
+    def __init__(self, window_seconds: float = 900.0) -> None:
+        """Initialize the tracker.
+
+        Args:
+            window_seconds: How long a finished query counts towards the rates
+                (default: 900.0)
+        """
+        self.window_seconds = window_seconds
+        self._queries: deque[_FinishedQuery] = deque()
+
+    def record(
+        self,
+        metrics: CrawlPipelineMetrics,
+        units_completed: int,
+        finished_at: float | None = None,
+    ) -> None:
+        """Add a finished crawl query.
+
+        Args:
+            metrics: Pipeline metrics of the query
+            units_completed: Date-category units the query completed
+            finished_at: ``time.monotonic()`` at the end of the query
+                (default: now)
+        """
+        if finished_at is None:
+            finished_at = time.monotonic()
+        self._queries.append(
+            _FinishedQuery(
+                started_at=finished_at - metrics.wall_seconds,
+                finished_at=finished_at,
+                pages=metrics.pages_fetched,
+                papers=metrics.papers_found,
+                parse_seconds=metrics.parse_seconds,
+                store_seconds=metrics.store_seconds,
+                store_batches=metrics.store_batches,
+                units=units_completed,
+            )
+        )
+        self._prune(finished_at)
+
+    def snapshot(self, now: float | None = None) -> CrawlThroughput:
+        """Compute the rates over the current window.
+
+        Args:
+            now: ``time.monotonic()`` of the snapshot (default: now)
+
+        Returns:
+            Rates; all zero when no query finished within the window
+        """
+        if now is None:
+            now = time.monotonic()
+        self._prune(now)
+        if not self._queries:
+            return CrawlThroughput()
+
+        elapsed = now - min(query.started_at for query in self._queries)
+        if elapsed <= 0:
+            return CrawlThroughput()
+        pages = sum(query.pages for query in self._queries)
+        store_batches = sum(query.store_batches for query in self._queries)
+        parse_seconds = sum(query.parse_seconds for query in self._queries)
+        store_seconds = sum(query.store_seconds for query in self._queries)
+        return CrawlThroughput(
+            requests_per_minute=pages * 60 / elapsed,
+            papers_per_second=sum(query.papers for query in self._queries) / elapsed,
+            parse_ms_per_page=parse_seconds * 1000 / pages if pages else 0.0,
+            store_ms_per_batch=(
+                store_seconds * 1000 / store_batches if store_batches else 0.0
+            ),
+            units_per_hour=sum(query.units for query in self._queries) * 3600 / elapsed,
+        )
+
+    def _prune(self, now: float) -> None:
+        while (
+            self._queries and self._queries[0].finished_at < now - self.window_seconds
+        ):
+            self._queries.popleft()
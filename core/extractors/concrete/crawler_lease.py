@@ -0,0 +1,143 @@
+"""Database lease electing the single active crawler worker."""
+
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import or_, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
+
+from core.log import get_logger
+from core.models.api.responses import CrawlerProgressResponse, CrawlerStatusResponse
+from core.models.rows import CrawlerLease
+from core.utils import get_current_timestamp
+
+logger = get_logger(__name__)
+
+
+class CrawlerLeaseManager:
+    """Reads and updates the lease row shared by crawler workers and the API.
+
+    A worker holds the lease while ``expires_at`` lies in the future and
+    must renew it within ``ttl_seconds``; a lapsed lease is taken over by
+    the next worker that tries to acquire it. Every acquisition and renewal
+    is a single conditional UPDATE, so two workers never both succeed.
+    """
+
+    def __init__(
+        self, engine: Engine, name: str = "historical", ttl_seconds: float = 60.0
+    ) -> None:
+        """Initialize the lease manager.
+
+        Args:
+            engine: Database engine shared with the crawler
+            name: Lease name; one crawler is active per name
+                (default: "historical")
+            ttl_seconds: Seconds a lease stays valid without renewal
+                (default: 60.0)
+        """
+        self.engine = engine
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+
+    def read(self) -> CrawlerLease | None:
+        """Get the lease row, or None before any worker or request created it."""
+        with Session(self.engine) as session:
+            return session.get(CrawlerLease, self.name)
+
+    def acquire(self, holder: str, now: datetime | None = None) -> bool:
+        """Acquire the lease for ``holder`` or renew it if already held.
+
+        Args:
+            holder: Worker identifier (e.g., "host:pid")
+            now: Current time (default: now in UTC)
+
+        Returns:
+            True if ``holder`` holds the lease afterwards
+        """
+        now = now or datetime.now(UTC)
+        self._ensure_row()
+        statement = (
+            update(CrawlerLease)
+            .where(CrawlerLease.name == self.name)  # type: ignore
+            .where(
+                or_(
+                    CrawlerLease.holder.is_(None),  # type: ignore
+                    CrawlerLease.holder == holder,  # type: ignore
+                    CrawlerLease.expires_at < now.isoformat(),  # type: ignore
+                )
+            )
+            .values(
+                holder=holder,
+                expires_at=(now + timedelta(seconds=self.ttl_seconds)).isoformat(),
+                updated_at=get_current_timestamp(),
+            )
+        )
+        with self.engine.begin() as connection:
+            acquired = connection.execute(statement).rowcount == 1
+        return acquired
+
+    def release(self, holder: str) -> None:
+        """Give up the lease if ``holder`` holds it."""
+        statement = (
+            update(CrawlerLease)
+            .where(CrawlerLease.name == self.name)  # type: ignore
+            .where(CrawlerLease.holder == holder)  # type: ignore
+            .values(holder=None, expires_at=None, updated_at=get_current_timestamp())
+        )
+        with self.engine.begin() as connection:
+            connection.execute(statement)
+
+    def publish(
+        self,
+        holder: str,
+        status: CrawlerStatusResponse,
+        progress: CrawlerProgressResponse,
+    ) -> None:
+        """Store the crawl status and progress reported by the lease holder."""
+        statement = (
+            update(CrawlerLease)
+            .where(CrawlerLease.name == self.name)  # type: ignore
+            .where(CrawlerLease.holder == holder)  # type: ignore
+            .values(
+                status=status.model_dump_json(),
+                progress=progress.model_dump_json(),
+                updated_at=get_current_timestamp(),
+            )
+        )
+        with self.engine.begin() as connection:
+            connection.execute(statement)
+
+    def request_running(self, running: bool) -> None:
+        """Record whether the lease holder should be crawling.
+
+        Args:
+            running: True to start crawling, False to stop it
+        """
+        self._ensure_row()
+        statement = (
+            update(CrawlerLease)
+            .where(CrawlerLease.name == self.name)  # type: ignore
+            .values(run_requested=running, updated_at=get_current_timestamp())
+        )
+        with self.engine.begin() as connection:
+            connection.execute(statement)
+        logger.info(f"Crawler {self.name} {'start' if running else 'stop'} requested")
+
+    @staticmethod
+    def is_held(lease: CrawlerLease | None, now: datetime | None = None) -> bool:
+        """Check whether a lease row is held by a live worker."""
+        if lease is None or lease.holder is None or lease.expires_at is None:
+            return False
+        return lease.expires_at > (now or datetime.now(UTC)).isoformat()
+
+    def _ensure_row(self) -> None:
+        """Create the lease row; a concurrent creator wins silently."""
+        with Session(self.engine) as session:
+            if session.get(CrawlerLease, self.name) is not None:
+                return
+            session.add(CrawlerLease(name=self.name))
+            try:
+                session.commit()
+            except IntegrityError:
+                session.rollback()
@@ -0,0 +1,300 @@
+"""Standalone crawler process controlled through the database."""
+
+import argparse
+import asyncio
+import os
+import signal
+import socket
+from collections.abc import Sequence
+
+import httpx
+from sqlalchemy.engine import Engine
+
+from core.config import Settings, load_settings
+from core.database.engine import create_database_engine, create_database_tables
+from core.extractors.concrete.arxiv_source_explorer import ArxivSourceExplorer
+from core.extractors.concrete.crawl_retry_manager import CrawlRetryManager
+from core.extractors.concrete.crawler_lease import CrawlerLeaseManager
+from core.extractors.concrete.daily_crawl_manager import DailyCrawlManager
+from core.extractors.concrete.historical_crawl_manager import HistoricalCrawlManager
+from core.extractors.http_client import create_http_client
+from core.extractors.rate_limiter import AsyncTokenBucket
+from core.extractors.response_cache import ResponseCache
+from core.log import get_logger, setup_logging
+
+logger = get_logger(__name__)
+
+
+def create_arxiv_http_client(settings: Settings) -> httpx.AsyncClient:
+    """Create the pooled HTTP client shared by all arXiv traffic."""
+    return create_http_client(
+        max_connections=settings.arxiv_http_max_connections,
+        max_keepalive_connections=settings.arxiv_http_max_keepalive_connections,
+        keepalive_expiry=settings.arxiv_http_keepalive_expiry,
+        connect_timeout=settings.arxiv_http_connect_timeout,
+        read_timeout=settings.arxiv_http_read_timeout,
+        http2=settings.arxiv_http2,
+    )
+
+
+def create_arxiv_explorer(
+    settings: Settings,
+    http_client: httpx.AsyncClient,
+    rate_limiter: AsyncTokenBucket,
+    api_base_url: str | None = None,
+) -> ArxivSourceExplorer:
+    """Create the arXiv source explorer described by the settings.
+
+    Args:
+        settings: Application settings
+        http_client: Shared arXiv HTTP client
+        rate_limiter: Limiter pacing every arXiv request
+        api_base_url: Override of ``settings.arxiv_api_base_url``
+
+    Returns:
+        Explorer with the response cache attached when enabled
+    """
+    # Raw feed pages survive restarts so re-crawls revalidate instead of refetch
+    response_cache = None
+    if settings.arxiv_cache_enabled:
+        response_cache = ResponseCache(
+            cache_dir=settings.arxiv_cache_dir,
+            recent_ttl_seconds=settings.arxiv_cache_recent_ttl_seconds,
+            immutable_after_days=settings.arxiv_cache_immutable_after_days,
+        )
+
+    return ArxivSourceExplorer(
+        api_base_url=api_base_url or settings.arxiv_api_base_url,
+        delay_seconds=settings.arxiv_delay_seconds,
+        max_results_per_request=settings.arxiv_max_results_per_request,
+        http_client=http_client,
+        rate_limiter=rate_limiter,
+        response_cache=response_cache,
+    )
+
+
+def create_historical_crawl_manager(settings: Settings) -> HistoricalCrawlManager:
+    """Create the historical crawl manager described by the settings."""
+    return HistoricalCrawlManager(
+        categories=settings.historical_crawl_categories,
+        rate_limit_delay=settings.historical_crawl_rate_limit_delay,
+        batch_size=settings.historical_crawl_batch_size,
+        max_concurrency=settings.historical_crawl_max_concurrency,
+        max_window_days=settings.historical_crawl_max_window_days,
+        combine_categories=settings.historical_crawl_combine_categories,
+    )
+
+
+def create_daily_crawl_manager(settings: Settings) -> DailyCrawlManager | None:
+    """Create the daily crawl manager, or None if daily crawling is disabled."""
+    if not settings.daily_crawl_enabled:
+        return None
+    return DailyCrawlManager(
+        categories=settings.arxiv_categories,
+        poll_interval=settings.daily_crawl_interval,
+        batch_size=settings.arxiv_max_results_per_request,
+        lookback_days=settings.daily_crawl_lookback_days,
+    )
+
+
+def create_crawl_retry_manager(
+    settings: Settings, historical_crawl_manager: HistoricalCrawlManager | None
+) -> CrawlRetryManager | None:
+    """Create the crawl retry manager, or None if retrying is disabled.
+
+    Args:
+        settings: Application settings
+        historical_crawl_manager: Manager that crawls failed units again
+
+    Returns:
+        Retry manager, or None if ``crawl_retry_enabled`` is off
+    """
+    if not settings.crawl_retry_enabled:
+        return None
+    return CrawlRetryManager(
+        historical_crawl_manager=historical_crawl_manager,
+        poll_interval=settings.crawl_retry_interval,
+        base_delay=settings.crawl_retry_base_delay,
+        max_retries=settings.crawl_retry_max_retries,
+        batch_size=settings.arxiv_max_results_per_request,
+    )
+
+
+class CrawlerWorker:
+    """Runs the crawl managers while holding the crawler lease.
+
+    Every ``poll_interval`` seconds the worker acquires or renews the lease,
+    starts or stops its managers as the API requested, and publishes the
+    crawl status and progress to the lease row. Workers that do not hold
+    the lease stand by and take over once it lapses.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        explorer: ArxivSourceExplorer,
+        historical_crawl_manager: HistoricalCrawlManager,
+        daily_crawl_manager: DailyCrawlManager | None = None,
+        crawl_retry_manager: CrawlRetryManager | None = None,
+        lease_ttl: float = 60.0,
+        poll_interval: float = 5.0,
+        holder: str | None = None,
+    ) -> None:
+        """Initialize the worker.
+
+        Args:
+            engine: Database engine shared with the API
+            explorer: ArxivSourceExplorer used by every manager
+            historical_crawl_manager: Manager of the backward crawl
+            daily_crawl_manager: Optional poller of new submissions
+            crawl_retry_manager: Optional retrier of failed papers and units
+            lease_ttl: Seconds the lease stays valid without renewal
+                (default: 60.0)
+            poll_interval: Seconds between lease renewals (default: 5.0);
+                must be well below ``lease_ttl``
+            holder: Lease holder name (default: "host:pid")
+        """
+        self.engine = engine
+        self.explorer = explorer
+        self.historical_crawl_manager = historical_crawl_manager
+        self.daily_crawl_manager = daily_crawl_manager
+        self.crawl_retry_manager = crawl_retry_manager
+        self.lease = CrawlerLeaseManager(engine, ttl_seconds=lease_ttl)
+        self.poll_interval = poll_interval
+        self.holder = holder or f"{socket.gethostname()}:{os.getpid()}"
+
+        self._crawling = False
+        self._stopping = asyncio.Event()
+
+    async def poll_once(self) -> bool:
+        """Renew the lease and apply the requested crawl state once.
+
+        Returns:
+            True if the worker holds the lease afterwards
+        """
+        if not await asyncio.to_thread(self.lease.acquire, self.holder):
+            if self._crawling:
+                logger.warning(f"Crawler lease lost by {self.holder}, stopping")
+                await self._stop_crawling()
+            return False
+
+        lease = await asyncio.to_thread(self.lease.read)
+        run_requested = lease is not None and lease.run_requested
+        if run_requested and not self._crawling:
+            await self._start_crawling()
+        elif not run_requested and self._crawling:
+            await self._stop_crawling()
+
+        status = self.historical_crawl_manager.get_progress_summary(self.engine)
+        progress = await asyncio.to_thread(
+            self.historical_crawl_manager.get_progress_summary_for_progress,
+            self.engine,
+        )
+        await asyncio.to_thread(self.lease.publish, self.holder, status, progress)
+        return True
+
+    async def run(self) -> None:
+        """Poll until ``stop`` is called, then stop crawling and release."""
+        logger.info(f"Crawler worker {self.holder} started")
+        try:
+            while not self._stopping.is_set():
+                try:
+                    await self.poll_once()
+                except Exception as e:
+                    logger.error(f"Error in crawler worker poll: {e}")
+                try:
+                    await asyncio.wait_for(
+                        self._stopping.wait(), timeout=self.poll_interval
+                    )
+                except TimeoutError:
+                    pass
+        finally:
+            if self._crawling:
+                await self._stop_crawling()
+            await asyncio.to_thread(self.lease.release, self.holder)
+            logger.info(f"Crawler worker {self.holder} stopped")
+
+    def stop(self) -> None:
+        """Ask ``run`` to finish after the current poll."""
+        self._stopping.set()
+
+    @property
+    def is_crawling(self) -> bool:
+        """Check if the worker's crawl managers are running."""
+        return self._crawling
+
+    async def _start_crawling(self) -> None:
+        logger.info(f"Crawler worker {self.holder} starts crawling")
+        await self.historical_crawl_manager.start(self.explorer, self.engine)
+        if self.daily_crawl_manager:
+            await self.daily_crawl_manager.start(self.explorer, self.engine)
+        if self.crawl_retry_manager:
+            await self.crawl_retry_manager.start(self.explorer, self.engine)
+        self._crawling = True
+
+    async def _stop_crawling(self) -> None:
+        logger.info(f"Crawler worker {self.holder} stops crawling")
+        await self.historical_crawl_manager.stop()
+        if self.daily_crawl_manager:
+            await self.daily_crawl_manager.stop()
+        if self.crawl_retry_manager:
+            await self.crawl_retry_manager.stop()
+        self._crawling = False
+
+
+async def _run_worker(settings: Settings) -> None:
+    """Build the crawl services from the settings and run a worker."""
+    engine = create_database_engine(settings.environment)
+    create_database_tables(engine)
+
+    http_client = create_arxiv_http_client(settings)
+    # The API process keeps the rest of the arXiv budget
+    rate_limiter = AsyncTokenBucket(
+        rate=settings.worker_arxiv_requests_per_second, burst=settings.arxiv_burst
+    )
+    explorer = create_arxiv_explorer(settings, http_client, rate_limiter)
+    historical_crawl_manager = create_historical_crawl_manager(settings)
+
+    worker = CrawlerWorker(
+        engine,
+        explorer,
+        historical_crawl_manager,
+        daily_crawl_manager=create_daily_crawl_manager(settings),
+        crawl_retry_manager=create_crawl_retry_manager(
+            settings, historical_crawl_manager
+        ),
+        lease_ttl=settings.crawler_lease_ttl,
+        poll_interval=settings.crawler_poll_interval,
+    )
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, worker.stop)
+
+    try:
+        await worker.run()
+    finally:
+        await http_client.aclose()
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the crawler worker of the configured environment."""
+    parser = argparse.ArgumentParser(
+        description="Crawl arXiv in a worker process controlled by the API"
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=None,
+        help="Seconds between lease renewals (default: from settings)",
+    )
+    args = parser.parse_args(argv)
+
+    settings = load_settings()
+    if args.poll_interval is not None:
+        settings.crawler_poll_interval = args.poll_interval
+    setup_logging(level=settings.log_level, enable_file_logging=True)
+    asyncio.run(_run_worker(settings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""Forward ArXiv crawling of new submissions alongside the historical backfill."""
+
+import asyncio
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.engine import Engine
+
+from core.extractors.concrete.arxiv_source_explorer import ArxivSourceExplorer
+from core.extractors.concrete.arxiv_storage_manager import ArxivStorageManager
+from core.extractors.exceptions import NetworkError
+from core.log import get_logger
+
+logger = get_logger(__name__)
+
+
+class DailyCrawlManager:
+    """Polls ArXiv categories for papers newer than the newest stored one."""
+
+    def __init__(
+        self,
+        categories: Sequence[str],
+        poll_interval: float = 3600.0,
+        batch_size: int = 100,
+        lookback_days: int = 2,
+    ) -> None:
+        """Initialize the daily crawl manager.
+
+        Args:
+            categories: List of ArXiv categories to poll (e.g., ['cs.AI'])
+            poll_interval: Seconds between polling cycles (default: 3600.0)
+            batch_size: Number of papers per request (default: 100)
+            lookback_days: Days polled for a category with no stored papers
+                (default: 2)
+        """
+        self.categories = list(categories)
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.lookback_days = max(1, lookback_days)
+
+        self._running = False
+        self._poll_task: asyncio.Task[None] | None = None
+
+        logger.info(f"Daily crawl manager initialized with categories: {categories}")
+
+    def since_date(self, engine: Engine, category: str) -> str:
+        """Get the first day to poll for ``category``.
+
+        Returns:
+            Day of the newest stored paper in the category, or
+            ``lookback_days`` before today if none is stored
+        """
+        return self._since(ArxivStorageManager(engine).latest_published_at(category))
+
+    def _since(self, cutoff: str | None) -> str:
+        """Get the first day to poll from a category's newest submission time."""
+        if cutoff:
+            return cutoff[:10]
+        since = datetime.now(UTC) - timedelta(days=self.lookback_days)
+        return since.strftime("%Y-%m-%d")
+
+    async def crawl_category(
+        self,
+        engine: Engine,
+        explorer: ArxivSourceExplorer,
+        category: str,
+        cutoff: str | None = None,
+    ) -> tuple[int, int]:
+        """Fetch and store the papers of ``category`` submitted since the last poll.
+
+        Pages are newest first, so paging stops at the first page that reaches
+        ``cutoff``: everything after it is older. Papers stored meanwhile,
+        e.g. cross-listed papers of another category or of the backfill, do
+        not move the cutoff and so cannot stop paging early.
+
+        Args:
+            engine: Database engine
+            explorer: ArxivSourceExplorer instance for fetching papers
+            category: ArXiv category to poll (e.g., "cs.AI")
+            cutoff: Submission time of the newest paper of ``category``
+                stored before the poll began; read now when None
+
+        Returns:
+            Tuple of (papers_found, papers_stored)
+        """
+        storage_manager = ArxivStorageManager(engine)
+        if cutoff is None:
+            cutoff = storage_manager.latest_published_at(category)
+        since = self._since(cutoff)
+        today = datetime.now(UTC).strftime("%Y-%m-%d")
+        query = explorer.date_range_query([category], since, today)
+
+        papers_found = papers_stored = 0
+        start = 0
+        while True:
+            try:
+                xml_content = await explorer.fetch_page_xml(
+                    query, start, self.batch_size
+                )
+            except NetworkError as e:
+                logger.error(f"Error polling {category} since {since}: {e}")
+                break
+
+            papers = await asyncio.to_thread(explorer.parse_papers_xml, xml_content)
+            stored = await asyncio.to_thread(storage_manager.store_papers_bulk, papers)
+            papers_found += len(papers)
+            papers_stored += stored
+
+            if len(papers) < self.batch_size or (
+                cutoff is not None
+                and any(paper.published_date <= cutoff for paper in papers)
+            ):
+                break
+            start += self.batch_size
+
+        logger.info(
+            f"Polled {category} since {since}: "
+            f"stored {papers_stored}/{papers_found} papers"
+        )
+        return papers_found, papers_stored
+
+    async def run_poll_cycle(
+        self, engine: Engine, explorer: ArxivSourceExplorer
+    ) -> dict[str, tuple[int, int]]:
+        """Poll every category once.
+
+        Cutoffs of all categories are read before the first one is polled,
+        so papers cross-listed in a later category are still fetched for it.
+
+        Returns:
+            Dictionary mapping categories to (papers_found, papers_stored)
+        """
+        storage_manager = ArxivStorageManager(engine)
+        cutoffs = {
+            category: await asyncio.to_thread(
+                storage_manager.latest_published_at, category
+            )
+            for category in self.categories
+        }
+        results = {}
+        for category in self.categories:
+            results[category] = await self.crawl_category(
+                engine, explorer, category, cutoffs[category]
+            )
+        return results
+
+    async def start(self, explorer: ArxivSourceExplorer, engine: Engine) -> None:
+        """Start polling in the background.
+
+        Args:
+            explorer: ArxivSourceExplorer instance for dependency injection
+            engine: Database engine instance for persistence
+        """
+        if self._running:
+            logger.warning("Daily crawl manager is already running")
+            return
+
+        logger.info("Starting daily crawl manager")
+        self._running = True
+        self._poll_task = asyncio.create_task(self._poll_scheduler(engine, explorer))
+
+    async def stop(self) -> None:
+        """Stop the daily crawl manager."""
+        if not self._running:
+            logger.warning("Daily crawl manager is not running")
+            return
+
+        logger.info("Stopping daily crawl manager")
+        self._running = False
+
+        if self._poll_task:
+            self._poll_task.cancel()
+            try:
+                await self._poll_task
+            except asyncio.CancelledError:
+                pass
+            self._poll_task = None
+
+    async def _poll_scheduler(
+        self, engine: Engine, explorer: ArxivSourceExplorer
+    ) -> None:
+        """Poll all categories every ``poll_interval`` seconds until stopped."""
+        while self._running:
+            try:
+                await self.run_poll_cycle(engine, explorer)
+            except asyncio.CancelledError:
+                logger.info("Daily crawl scheduler cancelled")
+                break
+            except Exception as e:
+                logger.error(f"Error in daily crawl scheduler: {e}")
+            await asyncio.sleep(self.poll_interval)
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the daily crawl manager is running."""
+        return self._running
@@ -1,14 +1,22 @@
 """Historical ArXiv crawling manager for backward crawling from yesterday."""
 
 import asyncio
+from collections import deque
 from collections.abc import Sequence
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from sqlalchemy.engine import Engine
-from sqlmodel import Session, select
+from sqlmodel import Session
 
 from core.extractors.concrete.arxiv_crawl_manager import ArxivCrawlManager
-from core.extractors.concrete.arxiv_source_explorer import ArxivSourceExplorer
+from core.extractors.concrete.arxiv_source_explorer import (
+    ArxivSourceExplorer,
+    DateWindowPlanner,
+)
+from core.extractors.concrete.arxiv_storage_manager import ArxivStorageManager
+from core.extractors.concrete.completion_index import CompletedUnitIndex
+from core.extractors.concrete.crawl_throughput import CrawlThroughputTracker
+from core.extractors.exceptions import NetworkError, ParsingError
 from core.log import get_logger
 from core.models.api.responses import (
     CrawlCycleResult,
@@ -22,6 +30,9 @@ from core.utils import (
 
 logger = get_logger(__name__)
 
+# Upper bound of the backoff after consecutive failed crawl cycles
+MAX_FAILURE_BACKOFF = 600.0
+
 
 class HistoricalCrawlManager:
     """Manages historical ArXiv crawling from yesterday backwards."""
@@ -31,23 +42,45 @@ class HistoricalCrawlManager:
         categories: Sequence[str],
         rate_limit_delay: float = 10.0,
         batch_size: int = 100,
+        max_concurrency: int = 1,
+        max_window_days: int = 1,
+        combine_categories: bool = False,
     ) -> None:
         """Initialize the historical crawl manager.
 
         Args:
             categories: List of ArXiv categories to crawl (e.g., ['cs.AI', 'cs.LG'])
-            rate_limit_delay: Delay between requests in seconds (default: 10.0)
+            rate_limit_delay: Backoff in seconds after a failed crawl cycle
+                (default: 10.0), doubled for every further consecutive
+                failure up to ``MAX_FAILURE_BACKOFF``; request pacing is
+                done by the explorer's rate limiter
             batch_size: Number of papers per request (default: 100)
+            max_concurrency: Date-category units crawled at the same time
+                (default: 1); all of them share the explorer's rate limiter
+            max_window_days: Days a single query may cover (default: 1);
+                above 1, quiet categories are crawled in adaptive
+                multi-day windows sized from arXiv's result counts
+            combine_categories: Crawl all pending categories of a day with
+                one OR-combined query instead of one query per category
         """
         self.categories = list(categories)
         self.end_date = "2015-01-01"  # Hard limit as specified
         self.rate_limit_delay = rate_limit_delay
         self.batch_size = batch_size
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_window_days = max(1, max_window_days)
+        self.combine_categories = combine_categories
 
         # Simple in-memory state
         self._current_date = get_previous_date(datetime.now().strftime("%Y-%m-%d"))
         self._current_category_index = 0
-        self._completed_combinations: set[tuple[str, str]] = set()
+        self._completed_units = CompletedUnitIndex()
+        self._in_flight: set[tuple[str, str]] = set()
+        # Units reserved for a window but left out of it after sizing; the
+        # cursor may have moved past them while the window was planned
+        self._released_units: deque[tuple[str, str]] = deque()
+        self._window_planner: DateWindowPlanner | None = None
+        self._throughput = CrawlThroughputTracker()
         self._running = False
         self._crawl_task: asyncio.Task[None] | None = None
 
@@ -82,76 +115,320 @@ class HistoricalCrawlManager:
     async def crawl_date_category(
         self, engine: Engine, explorer: ArxivSourceExplorer, category: str, date: str
     ) -> tuple[int, int]:
-        """Crawl papers for a specific date-category combination."""
+        """Crawl papers for a specific date-category combination.
+
+        With ``combine_categories`` the categories still pending on ``date``
+        join one OR-combined query; with ``max_window_days`` above 1 the crawl
+        may extend to older days. Completion is still recorded for each
+        category and day.
+
+        Pages are checkpointed as they are stored. A query that is interrupted
+        is not marked completed; the next claim of its newest unit resumes it
+        at the first page that was not stored.
+        """
+        categories = [category]
+        window = [date]
         try:
+            resumed = self._claim_checkpointed_units(engine, category, date)
+            if resumed is not None:
+                categories, window = resumed
+            else:
+                if self.combine_categories:
+                    categories = self._claim_companion_categories(category, date)
+                if self.max_window_days > 1:
+                    window = await self._plan_window(explorer, categories, date)
+
             # Create crawl manager for this operation
             crawl_manager = ArxivCrawlManager(
                 engine=engine,
                 categories=self.categories,
-                delay_seconds=2.0,
                 max_results_per_request=self.batch_size,
+                checkpoint_pages=True,
             )
 
-            # Use crawl manager to crawl and store papers with injected explorer
-            papers_found, papers_stored = await crawl_manager.crawl_and_store_papers(
-                explorer=explorer,
-                category=category,
-                date=date,
-                start_index=0,
-                limit=self.batch_size,
-            )
+            if len(categories) == 1 and len(window) == 1:
+                # Use crawl manager to crawl and store papers with injected explorer
+                papers_found, papers_stored = (
+                    await crawl_manager.crawl_and_store_papers(
+                        explorer=explorer,
+                        category=category,
+                        date=date,
+                        start_index=0,
+                        limit=self.batch_size,
+                    )
+                )
+                unit_counts = {(category, date): (papers_found, papers_stored)}
+            else:
+                papers_found, papers_stored = (
+                    await crawl_manager.crawl_and_store_window(
+                        explorer=explorer,
+                        categories=categories,
+                        start_date=window[-1],
+                        end_date=window[0],
+                        limit=self.batch_size,
+                    )
+                )
+                metrics = crawl_manager.last_metrics
+                unit_counts = {
+                    (unit_category, day): metrics.unit_counts(unit_category, day)
+                    for unit_category in categories
+                    for day in window
+                }
+
+            if not crawl_manager.last_metrics.completed:
+                self._throughput.record(crawl_manager.last_metrics, 0)
+                logger.warning(
+                    f"Crawl of {','.join(categories)} from {window[-1]} to "
+                    f"{window[0]} was interrupted, queueing it for retry"
+                )
+                self._record_failed_units(
+                    engine, categories, window, "Crawl interrupted before last page"
+                )
+                return papers_found, papers_stored
 
             # Mark as completed
-            self._completed_combinations.add((category, date))
-            self._save_completion_to_db(
-                engine, category, date, papers_found, papers_stored
-            )
-
-            # Rate limiting
-            await asyncio.sleep(self.rate_limit_delay)
+            for (unit_category, day), (unit_found, unit_stored) in unit_counts.items():
+                self._completed_units.add(unit_category, day)
+                self._save_completion_to_db(
+                    engine, unit_category, day, unit_found, unit_stored
+                )
+            ArxivStorageManager(engine).clear_failed_units(unit_counts)
+            self._throughput.record(crawl_manager.last_metrics, len(unit_counts))
 
             return papers_found, papers_stored
 
         except Exception as e:
             logger.error(f"Error crawling {category} on {date}: {e}")
-            # Mark as completed even if failed
-            self._completed_combinations.add((category, date))
-            self._save_completion_to_db(engine, category, date, 0, 0)
+            # Leave the units open and queue them for retry
+            self._record_failed_units(engine, categories, window, str(e))
             return 0, 0
 
-    async def run_crawl_cycle(
-        self, engine: Engine, explorer: ArxivSourceExplorer
-    ) -> CrawlCycleResult | None:
-        """Run one crawl cycle."""
-        # Keep trying until we find an uncompleted date-category or reach the end
+        finally:
+            for unit_category in categories:
+                for day in window:
+                    self._in_flight.discard((unit_category, day))
+
+    def _record_failed_units(
+        self,
+        engine: Engine,
+        categories: Sequence[str],
+        window: Sequence[str],
+        error_message: str,
+    ) -> None:
+        """Queue every unit of a failed query for the retry manager."""
+        try:
+            ArxivStorageManager(engine).record_failed_units(
+                [
+                    (unit_category, day)
+                    for unit_category in categories
+                    for day in window
+                ],
+                error_message,
+            )
+        except Exception as e:
+            logger.error(f"Failed to queue {categories} on {window} for retry: {e}")
+
+    async def retry_unit(
+        self, engine: Engine, explorer: ArxivSourceExplorer, category: str, date: str
+    ) -> bool:
+        """Crawl a failed date-category unit again.
+
+        Units completed in the meantime, e.g. by the resumed query of a newer
+        day, are only removed from the retry queue. Units being crawled are
+        left for a later retry.
+
+        Returns:
+            True if the unit is completed afterwards
+        """
+        unit = (category, date)
+        if unit in self._completed_units:
+            ArxivStorageManager(engine).clear_failed_units([unit])
+            return True
+        if unit in self._in_flight:
+            return False
+
+        self._in_flight.add(unit)
+        await self.crawl_date_category(engine, explorer, category, date)
+        return unit in self._completed_units
+
+    def _is_pending(self, category: str, date: str) -> bool:
+        """Check a unit is neither completed nor being crawled."""
+        unit = (category, date)
+        return unit not in self._completed_units and unit not in self._in_flight
+
+    def _claim_checkpointed_units(
+        self, engine: Engine, category: str, date: str
+    ) -> tuple[list[str], list[str]] | None:
+        """Reserve the units of an interrupted query whose newest day is ``date``.
+
+        Resuming needs the exact query that was interrupted, so its categories
+        and days are reused instead of planning a new query.
+
+        Returns:
+            Categories and days (newest first) of the query, or None if there
+            is nothing to resume
+        """
+        checkpoint = ArxivStorageManager(engine).find_checkpoint(category, date)
+        if checkpoint is None:
+            return None
+
+        categories = checkpoint.categories.split(",")
+        days = [checkpoint.end_date]
+        while days[-1] > checkpoint.start_date:
+            days.append(get_previous_date(days[-1]))
+
+        others = [
+            (unit_category, day)
+            for unit_category in categories
+            for day in days
+            if (unit_category, day) != (category, date)
+        ]
+        if not all(self._is_pending(*unit) for unit in others):
+            return None
+        self._in_flight.update(others)
+        return categories, days
+
+    def _claim_companion_categories(self, category: str, date: str) -> list[str]:
+        """Reserve the other pending categories of ``date`` for one query.
+
+        Returns:
+            ``category`` followed by the reserved companion categories
+        """
+        companions = [
+            other
+            for other in self.categories
+            if other != category and self._is_pending(other, date)
+        ]
+        self._in_flight.update((other, date) for other in companions)
+        return [category, *companions]
+
+    async def _plan_window(
+        self, explorer: ArxivSourceExplorer, categories: list[str], date: str
+    ) -> list[str]:
+        """Reserve the days one query will cover, starting at ``date``.
+
+        Candidate days run backwards from ``date`` and stop at the end date or
+        at a day on which any of ``categories`` is completed or being crawled.
+
+        Returns:
+            Days covered by the window, newest first
+        """
+        if (
+            self._window_planner is None
+            or self._window_planner.explorer is not explorer
+        ):
+            self._window_planner = DateWindowPlanner(
+                explorer,
+                max_window_days=self.max_window_days,
+                max_results=self.batch_size,
+            )
+
+        days = [date]
+        day = date
+        while len(days) < self._window_planner.window_days(categories):
+            day = get_previous_date(day)
+            if day <= self.end_date or not all(
+                self._is_pending(category, day) for category in categories
+            ):
+                break
+            days.append(day)
+        self._in_flight.update(
+            (category, day) for category in categories for day in days[1:]
+        )
+
+        window = days[:1]
+        try:
+            window, _ = await self._window_planner.plan(categories, days)
+        except (NetworkError, ParsingError) as e:
+            logger.warning(f"Could not size window for {categories} at {date}: {e}")
+        finally:
+            # Days left out of the window are claimed again before the cursor
+            for day in days[len(window) :]:
+                for category in categories:
+                    self._in_flight.discard((category, day))
+                    self._released_units.append((category, day))
+        return window
+
+    def claim_next_date_category(self) -> tuple[str, str] | None:
+        """Claim the next uncompleted date-category and advance past it.
+
+        The cursor moves before the unit is crawled, so concurrent workers
+        never claim the same unit; it only counts as completed once crawled.
+        Days already reserved by a running multi-day window are skipped, and
+        days such a window released again are claimed first.
+        """
+        while self._released_units:
+            category, date = self._released_units.popleft()
+            if self._is_pending(category, date):
+                self._in_flight.add((category, date))
+                return date, category
+
         while True:
-            # Get next date-category to process
+            if self._current_category_index == 0:
+                self._current_date = self._skip_completed_days(self._current_date)
             next_item = self.get_next_date_category()
             if not next_item:
-                logger.info("Reached end date, crawling complete")
                 return None
 
+            self.advance_to_next()
             date, category = next_item
+            if self._is_pending(category, date):
+                self._in_flight.add((category, date))
+                return date, category
 
-            # Check if already completed
-            if (category, date) in self._completed_combinations:
-                self.advance_to_next()
-                continue  # Try next combination instead of returning None
+    def _skip_completed_days(self, date: str) -> str:
+        """Get the newest day on or before ``date`` with a pending category.
 
-            # Found uncompleted combination, execute crawl
-            papers_found, papers_stored = await self.crawl_date_category(
-                engine, explorer, category, date
-            )
+        One gap lookup per category jumps over runs of days on which every
+        category is completed already.
+        """
+        return max(
+            (
+                self._completed_units.next_gap(category, date)
+                for category in self.categories
+            ),
+            default=date,
+        )
 
-            # Advance to next
-            self.advance_to_next()
+    async def run_crawl_cycle(
+        self,
+        engine: Engine,
+        explorer: ArxivSourceExplorer,
+        retry: tuple[str, str] | None = None,
+    ) -> CrawlCycleResult | None:
+        """Run one crawl cycle.
 
-            return CrawlCycleResult(
-                papers_found=papers_found,
-                papers_stored=papers_stored,
-                category=category,
-                date=date,
-            )
+        Args:
+            engine: Database engine instance for persistence
+            explorer: ArxivSourceExplorer instance for fetching papers
+            retry: (date, category) of a failed unit to crawl again; the
+                next unit is claimed instead once it is no longer pending
+
+        Returns:
+            Result of the crawled unit, or None once the end date is reached
+        """
+        next_item: tuple[str, str] | None
+        if retry is not None and self._is_pending(retry[1], retry[0]):
+            self._in_flight.add((retry[1], retry[0]))
+            next_item = retry
+        else:
+            next_item = self.claim_next_date_category()
+        if not next_item:
+            logger.info("Reached end date, crawling complete")
+            return None
+
+        date, category = next_item
+        papers_found, papers_stored = await self.crawl_date_category(
+            engine, explorer, category, date
+        )
+
+        return CrawlCycleResult(
+            papers_found=papers_found,
+            papers_stored=papers_stored,
+            category=category,
+            date=date,
+            completed=(category, date) in self._completed_units,
+        )
 
     @property
     def current_date(self) -> str:
@@ -176,14 +453,69 @@ class HistoricalCrawlManager:
     def get_progress_summary_for_progress(
         self, engine: Engine
     ) -> CrawlerProgressResponse:
-        """Get current crawling progress summary for progress endpoint."""
+        """Get current crawling progress summary for progress endpoint.
+
+        Totals come from the recorded completions; rates cover the crawl
+        queries that finished recently, and the ETA extrapolates their unit
+        completion rate over the units left before the end date.
+        """
+        storage_manager = ArxivStorageManager(engine)
+        completed_units, papers_found, papers_stored = (
+            storage_manager.completion_totals(self.categories)
+        )
+        failed_papers, failed_units = storage_manager.count_failures()
+        throughput = self._throughput.snapshot()
+        backlog_dates, remaining_units = self._backlog()
+
+        eta_seconds = None
+        if throughput.units_per_hour > 0:
+            eta_seconds = remaining_units * 3600 / throughput.units_per_hour
+
         return CrawlerProgressResponse(
-            total_papers_found=0,  # TODO: Implement actual counting
-            total_papers_stored=0,  # TODO: Implement actual counting
-            completed_date_categories=len(self._completed_combinations),
-            failed_date_categories=0,  # TODO: Implement actual counting
+            total_papers_found=papers_found,
+            total_papers_stored=papers_stored,
+            completed_date_categories=completed_units,
+            failed_date_categories=failed_units,
+            failed_papers=failed_papers,
+            requests_per_minute=throughput.requests_per_minute,
+            papers_per_second=throughput.papers_per_second,
+            parse_ms_per_page=throughput.parse_ms_per_page,
+            store_ms_per_batch=throughput.store_ms_per_batch,
+            backlog_dates=backlog_dates,
+            remaining_units=remaining_units,
+            eta_seconds=eta_seconds,
         )
 
+    def _backlog(self) -> tuple[int, int]:
+        """Count the days and units the cursor has yet to reach.
+
+        Returns:
+            Tuple of (days from the cursor down to the end date, units on
+            those days that are neither claimed yet nor completed)
+        """
+        current = datetime.strptime(self._current_date, "%Y-%m-%d")
+        end = datetime.strptime(self.end_date, "%Y-%m-%d")
+        backlog_dates = max(0, (current - end).days)
+        if backlog_dates == 0:
+            return 0, 0
+
+        # Completed units between the end date and the cursor's day, then on it
+        day_after_end = (end + timedelta(days=1)).strftime("%Y-%m-%d")
+        day_before_cursor = (current - timedelta(days=1)).strftime("%Y-%m-%d")
+        completed_ahead = sum(
+            self._completed_units.count_between(
+                category, day_after_end, day_before_cursor
+            )
+            for category in self.categories
+        )
+        completed_ahead += sum(
+            1
+            for category in self.categories[self._current_category_index :]
+            if (category, self._current_date) in self._completed_units
+        )
+        total = backlog_dates * len(self.categories) - self._current_category_index
+        return backlog_dates, max(0, total - completed_ahead)
+
     async def start(self, explorer: ArxivSourceExplorer, engine: Engine) -> None:
         """Start the historical crawl manager with dependencies.
 
@@ -198,50 +530,39 @@ class HistoricalCrawlManager:
         logger.info("Starting historical crawl manager")
         self._running = True
 
-        # Load completed combinations from database
-        self._load_completed_combinations_from_db(engine)
+        # Load completed units from database
+        self._load_completed_units_from_db(engine)
 
         # Start background crawl task
         self._crawl_task = asyncio.create_task(self._crawl_scheduler(engine, explorer))
 
         logger.info("Historical crawl manager started successfully")
 
-    def _load_completed_combinations_from_db(self, engine: Engine) -> None:
-        """Load completed combinations from database."""
+    def _load_completed_units_from_db(self, engine: Engine) -> None:
+        """Load completed units from database as runs of consecutive days."""
         try:
-            with Session(engine) as session:
-                completed_records = session.exec(
-                    select(CrawlCompletion).where(
-                        CrawlCompletion.category.in_(self.categories)  # type: ignore
-                    )
-                ).all()
-
-                for record in completed_records:
-                    self._completed_combinations.add((record.category, record.date))
-
+            for category, first_day, last_day in ArxivStorageManager(
+                engine
+            ).completed_intervals(self.categories):
+                self._completed_units.add_interval(category, first_day, last_day)
         except Exception as e:
             logger.warning(f"Failed to load completed logs from DB: {e}")
 
-        # Log completed combinations with smart truncation
-        completed_count = len(self._completed_combinations)
-        if completed_count == 0:
+        if not self._completed_units:
             logger.info("No completed logs found in DB")
             return
 
-        completed_list = sorted(self._completed_combinations)
-        if completed_count <= 4:
-            combinations_str = ", ".join(
-                [f"{cat}-{date}" for cat, date in completed_list]
+        # One summary per category instead of listing every unit
+        for category in self.categories:
+            intervals = self._completed_units.intervals(category)
+            if not intervals:
+                continue
+            oldest, newest = intervals[0][0], intervals[-1][1]
+            days = self._completed_units.count_between(category, oldest, newest)
+            logger.info(
+                f"Loaded completed logs of {category}: {days} days in "
+                f"{len(intervals)} runs ({oldest} ... {newest})"
             )
-            logger.info(f"Loaded {completed_count} completed logs: {combinations_str}")
-            return
-
-        # Show first 2 and last 2 for readability
-        first_two = ", ".join([f"{cat}-{date}" for cat, date in completed_list[:2]])
-        last_two = ", ".join([f"{cat}-{date}" for cat, date in completed_list[-2:]])
-        logger.info(
-            f"Loaded {completed_count} completed logs: {first_two} ... {last_two}"
-        )
 
     def _save_completion_to_db(
         self,
@@ -292,26 +613,58 @@ class HistoricalCrawlManager:
     async def _crawl_scheduler(
         self, engine: Engine, explorer: ArxivSourceExplorer
     ) -> None:
-        """Background scheduler for historical crawling."""
+        """Background scheduler running ``max_concurrency`` crawl workers."""
+        await asyncio.gather(
+            *(self._crawl_worker(engine, explorer) for _ in range(self.max_concurrency))
+        )
+
+    async def _crawl_worker(
+        self, engine: Engine, explorer: ArxivSourceExplorer
+    ) -> None:
+        """Claim and crawl work units until none are left or the manager stops.
+
+        A unit that fails is crawled again after a backoff instead of moving
+        on, so an arXiv outage does not sweep the backlog into the retry
+        queue. The backoff doubles with every consecutive failure.
+        """
+        failures = 0
+        retry: tuple[str, str] | None = None
         while self._running:
             try:
                 # Run single crawl cycle
-                result = await self.run_crawl_cycle(engine, explorer)
+                result = await self.run_crawl_cycle(engine, explorer, retry)
                 if not result:
                     logger.info(
                         "Historical crawling completed - no more papers to process"
                     )
                     break
-
-                # Wait before next cycle
-                await asyncio.sleep(self.rate_limit_delay)
+                if result.completed:
+                    failures = 0
+                    retry = None
+                    continue
+
+                failures += 1
+                retry = (result.date, result.category)
+                delay = self.failure_backoff(failures)
+                logger.warning(
+                    f"Crawl of {result.category} on {result.date} failed "
+                    f"{failures} time(s), retrying in {delay:.0f}s"
+                )
+                await asyncio.sleep(delay)
 
             except asyncio.CancelledError:
                 logger.info("Historical crawl scheduler cancelled")
                 break
             except Exception as e:
+                failures += 1
                 logger.error(f"Error in historical crawl scheduler: {e}")
-                await asyncio.sleep(self.rate_limit_delay)
+                await asyncio.sleep(self.failure_backoff(failures))
+
+    def failure_backoff(self, failures: int) -> float:
+        """Get the pause in seconds after ``failures`` consecutive failures."""
+        return float(
+            min(self.rate_limit_delay * 2 ** max(0, failures - 1), MAX_FAILURE_BACKOFF)
+        )
 
     @property
     def is_running(self) -> bool:
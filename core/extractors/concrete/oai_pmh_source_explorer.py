@@ -0,0 +1,200 @@
+"""ArXiv OAI-PMH source explorer for bulk harvesting."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
+from datetime import UTC, datetime, timedelta
+
+import httpx
+
+from core.extractors.base import BaseSourceExplorer
+from core.extractors.exceptions import NetworkError
+from core.extractors.http_client import http_get
+from core.extractors.rate_limiter import AsyncTokenBucket
+from core.log import get_logger
+from core.models.domain.arxiv import ArxivPaper
+from core.models.domain.paper_extraction import PaperMetadata
+
+from .arxiv_oai_parser import OaiPmhPage, parse_list_records
+
+logger = get_logger(__name__)
+
+
+class OaiPmhSourceExplorer(BaseSourceExplorer):
+    """ArXiv source explorer that harvests records over OAI-PMH.
+
+    One ListRecords response carries up to the server's page size (1000
+    records on arXiv) instead of the 100 entries of an Atom query, and the
+    harvest continues with resumption tokens rather than start offsets.
+    Harvests select records by *datestamp*, the date a record was created or
+    last changed, so a date range also returns older papers revised in it.
+    """
+
+    def __init__(
+        self,
+        api_base_url: str = "https://oaipmh.arxiv.org/oai",
+        delay_seconds: float = 3.0,
+        http_client: httpx.AsyncClient | None = None,
+        rate_limiter: AsyncTokenBucket | None = None,
+        metadata_prefix: str = "arXiv",
+    ) -> None:
+        """Initialize the OAI-PMH explorer.
+
+        Args:
+            api_base_url: Base URL of the OAI-PMH endpoint
+            delay_seconds: Minimum interval between request starts, used to
+                build a private limiter when none is injected
+            http_client: Shared pooled client; a short-lived client is opened
+                per request when omitted
+            rate_limiter: Limiter shared by all arXiv traffic
+            metadata_prefix: OAI-PMH metadata format to request
+        """
+        self.api_base_url = api_base_url
+        self.delay_seconds = delay_seconds
+        self.http_client = http_client
+        if rate_limiter is None and delay_seconds > 0:
+            rate_limiter = AsyncTokenBucket(rate=1.0 / delay_seconds)
+        self.rate_limiter = rate_limiter
+        self.metadata_prefix = metadata_prefix
+
+    @staticmethod
+    def set_for_category(category: str) -> str:
+        """Map an arXiv category to the OAI-PMH set that contains it.
+
+        Args:
+            category: ArXiv category (e.g., "cs.AI") or archive (e.g., "cs")
+
+        Returns:
+            Set spec of the category's archive (e.g., "cs")
+        """
+        return category.split(".", 1)[0]
+
+    async def fetch_page_xml(self, params: dict[str, str]) -> str:
+        """Fetch one raw ListRecords response.
+
+        Args:
+            params: OAI-PMH request parameters
+
+        Returns:
+            Raw XML response
+
+        Raises:
+            NetworkError: If network request fails
+        """
+        try:
+            response = await http_get(
+                self.api_base_url,
+                params=params,
+                client=self.http_client,
+                rate_limiter=self.rate_limiter,
+            )
+            return response.text
+        except httpx.RequestError as e:
+            raise NetworkError(f"Network error harvesting records: {e}") from e
+        except httpx.HTTPStatusError as e:
+            raise NetworkError(f"HTTP error harvesting records: {e}") from e
+
+    async def harvest(
+        self,
+        set_spec: str | None = None,
+        from_date: str | None = None,
+        until_date: str | None = None,
+    ) -> AsyncGenerator[OaiPmhPage, None]:
+        """Harvest records page by page, following resumption tokens.
+
+        Responses are parsed with the streaming parser in a worker thread.
+
+        Args:
+            set_spec: OAI-PMH set (e.g., "cs"); all sets when None
+            from_date: First datestamp in YYYY-MM-DD format
+            until_date: Last datestamp (inclusive) in YYYY-MM-DD format
+
+        Yields:
+            One parsed page per ListRecords response
+
+        Raises:
+            NetworkError: If network request fails
+            ParsingError: If a response is malformed or an OAI-PMH error
+        """
+        params = {"verb": "ListRecords", "metadataPrefix": self.metadata_prefix}
+        if set_spec:
+            params["set"] = set_spec
+        if from_date:
+            params["from"] = from_date
+        if until_date:
+            params["until"] = until_date
+
+        while True:
+            xml_content = await self.fetch_page_xml(params)
+            page = await asyncio.to_thread(parse_list_records, xml_content)
+            yield page
+            if not page.resumption_token:
+                return
+            # A resumption token replaces every other argument but the verb
+            params = {"verb": "ListRecords", "resumptionToken": page.resumption_token}
+
+    async def explore_papers(
+        self,
+        category: str,
+        from_date: str | None = None,
+        until_date: str | None = None,
+        limit: int | None = None,
+    ) -> list[ArxivPaper]:
+        """Harvest the papers of a category within a datestamp range.
+
+        Args:
+            category: ArXiv category (e.g., "cs.AI") or archive (e.g., "cs")
+            from_date: First datestamp in YYYY-MM-DD format
+            until_date: Last datestamp (inclusive) in YYYY-MM-DD format
+            limit: Stop after this many papers; harvest everything when None
+
+        Returns:
+            List of ArXiv papers listing the category
+        """
+        set_spec = self.set_for_category(category)
+        papers: list[ArxivPaper] = []
+        async with aclosing(self.harvest(set_spec, from_date, until_date)) as pages:
+            async for page in pages:
+                papers.extend(
+                    paper
+                    for paper in page.papers
+                    if category == set_spec or category in paper.categories
+                )
+                if limit is not None and len(papers) >= limit:
+                    return papers[:limit]
+        return papers
+
+    async def explore_recent(
+        self, limit: int = 100, days_back: int = 7
+    ) -> list[PaperMetadata]:
+        """Explore recently created or updated papers in every set.
+
+        Args:
+            limit: Maximum number of papers to return
+            days_back: Number of days of datestamps to harvest
+
+        Returns:
+            List of recent paper metadata
+        """
+        from_date = (datetime.now(UTC) - timedelta(days=days_back)).strftime("%Y-%m-%d")
+        papers: list[PaperMetadata] = []
+        async with aclosing(self.harvest(from_date=from_date)) as pages:
+            async for page in pages:
+                papers.extend(page.papers)
+                if len(papers) >= limit:
+                    break
+        return papers[:limit]
+
+    async def explore_by_category(
+        self, category: str, limit: int = 100
+    ) -> list[PaperMetadata]:
+        """Explore papers by category.
+
+        Args:
+            category: ArXiv category (e.g., "cs.AI")
+            limit: Maximum number of papers to return
+
+        Returns:
+            List of paper metadata in the category
+        """
+        return list(await self.explore_papers(category, limit=limit))
@@ -1,6 +1,9 @@
 """Simple factory for managing paper extractors."""
 
-from core.extractors.base import BaseExtractor
+import re
+from collections.abc import Sequence
+
+from core.extractors.base import BaseExtractor, BaseSourceExplorer
 from core.extractors.exceptions import UnsupportedURLError
 from core.log import get_logger
 
@@ -9,6 +12,15 @@ logger = get_logger(__name__)
 # Global extractor registry
 _extractors: dict[str, BaseExtractor] = {}
 
+# Host -> extractor name, rebuilt whenever an extractor is registered
+_routes: dict[str, str] = {}
+
+# Host of an absolute URL; several times cheaper than urlsplit on unique URLs
+_HOST_PATTERN = re.compile(r"[a-zA-Z][a-zA-Z0-9+.-]*://(?:[^/?#@]*@)?([^/?#:]*)")
+
+# Global source explorer registry
+_source_explorers: dict[str, BaseSourceExplorer] = {}
+
 
 def register_extractor(name: str, extractor: BaseExtractor) -> None:
     """Register a new extractor.
@@ -18,9 +30,50 @@ def register_extractor(name: str, extractor: BaseExtractor) -> None:
         extractor: Extractor instance
     """
     _extractors[name] = extractor
+    _rebuild_routes()
     logger.info(f"Registered extractor: {name}")
 
 
+def _rebuild_routes() -> None:
+    """Map every declared host to its extractor; earlier registrations win."""
+    _routes.clear()
+    for name, extractor in _extractors.items():
+        for host in extractor.hosts:
+            _routes.setdefault(host.lower(), name)
+
+
+def _url_host(url: str) -> str | None:
+    match = _HOST_PATTERN.match(url)
+    if match is None:
+        return None
+    return match.group(1).lower() or None
+
+
+def _route(host: str) -> BaseExtractor | None:
+    """Look up a host, then its parent domains (e.g., export.arxiv.org)."""
+    while True:
+        name = _routes.get(host)
+        if name is not None:
+            # The registry may have been cleared since the routes were built
+            return _extractors.get(name)
+        _, dot, host = host.partition(".")
+        if not dot:
+            return None
+
+
+def _find(url: str, host: str | None) -> BaseExtractor | None:
+    """Route by host, then try ``can_extract`` of the eligible extractors."""
+    if host is not None:
+        extractor = _route(host)
+        if extractor is not None:
+            return extractor
+
+    for extractor in _extractors.values():
+        if (host is None or not extractor.hosts) and extractor.can_extract(url):
+            return extractor
+    return None
+
+
 def get_extractor(name: str) -> BaseExtractor:
     """Get extractor by name.
 
@@ -41,6 +94,10 @@ def get_extractor(name: str) -> BaseExtractor:
 def find_extractor_for_url(url: str) -> BaseExtractor:
     """Find the appropriate extractor for a given URL.
 
+    URLs with a host are routed through the host table in O(1); only
+    extractors that declare no hosts are then tried with ``can_extract``.
+    URLs without a scheme or host are checked against every extractor.
+
     Args:
         url: URL to find extractor for
 
@@ -50,11 +107,44 @@ def find_extractor_for_url(url: str) -> BaseExtractor:
     Raises:
         UnsupportedURLError: If no extractor found for the URL
     """
-    for extractor in _extractors.values():
-        if extractor.can_extract(url):
-            return extractor
+    extractor = _find(url, _url_host(url))
+    if extractor is None:
+        raise UnsupportedURLError(f"No extractor found for URL: {url}")
+    return extractor
+
 
-    raise UnsupportedURLError(f"No extractor found for URL: {url}")
+def route_urls(
+    urls: Sequence[str],
+) -> tuple[dict[BaseExtractor, list[str]], list[str]]:
+    """Group URLs by the extractor that handles them.
+
+    Each distinct host is routed once per call, so a bulk import of URLs
+    from one source costs one host match and one dict lookup per URL.
+
+    Args:
+        urls: URLs to route
+
+    Returns:
+        Tuple of (URLs per extractor, URLs no extractor handles), both in
+        input order
+    """
+    routed: dict[BaseExtractor, list[str]] = {}
+    unsupported: list[str] = []
+    extractor_by_host: dict[str, BaseExtractor | None] = {}
+    for url in urls:
+        host = _url_host(url)
+        if host is None:
+            extractor = _find(url, None)
+        else:
+            if host not in extractor_by_host:
+                extractor_by_host[host] = _route(host)
+            # Hosts without a route may still match a hostless extractor
+            extractor = extractor_by_host[host] or _find(url, host)
+        if extractor is None:
+            unsupported.append(url)
+        else:
+            routed.setdefault(extractor, []).append(url)
+    return routed, unsupported
 
 
 def get_all_extractors() -> dict[str, BaseExtractor]:
@@ -73,3 +163,40 @@ def get_supported_sources() -> list[str]:
         List of supported source names
     """
     return [extractor.get_source_name() for extractor in _extractors.values()]
+
+
+def register_source_explorer(name: str, explorer: BaseSourceExplorer) -> None:
+    """Register a source explorer for the source crawl scheduler.
+
+    Args:
+        name: Name of the source (e.g., "arxiv")
+        explorer: Explorer instance
+    """
+    _source_explorers[name] = explorer
+    logger.info(f"Registered source explorer: {name}")
+
+
+def get_source_explorer(name: str) -> BaseSourceExplorer:
+    """Get source explorer by name.
+
+    Args:
+        name: Name of the source
+
+    Returns:
+        Explorer instance
+
+    Raises:
+        KeyError: If source explorer not found
+    """
+    if name not in _source_explorers:
+        raise KeyError(f"Source explorer not found: {name}")
+    return _source_explorers[name]
+
+
+def get_all_source_explorers() -> dict[str, BaseSourceExplorer]:
+    """Get all registered source explorers.
+
+    Returns:
+        Dictionary of all source explorers
+    """
+    return _source_explorers.copy()
@@ -0,0 +1,107 @@
+"""Shared HTTP client construction for paper sources."""
+
+import importlib.util
+
+import httpx
+
+from core.extractors.rate_limiter import AsyncTokenBucket, parse_retry_after
+from core.log import get_logger
+
+logger = get_logger(__name__)
+
+# Status codes an upstream uses to ask us to slow down
+BACKOFF_STATUS_CODES = frozenset({429, 503})
+
+
+def create_http_client(
+    max_connections: int = 10,
+    max_keepalive_connections: int = 5,
+    keepalive_expiry: float = 30.0,
+    connect_timeout: float = 10.0,
+    read_timeout: float = 30.0,
+    http2: bool = False,
+) -> httpx.AsyncClient:
+    """Create a pooled AsyncClient meant to be shared across requests.
+
+    Args:
+        max_connections: Maximum number of concurrent connections
+        max_keepalive_connections: Idle connections kept open for reuse
+        keepalive_expiry: Seconds an idle connection is kept open
+        connect_timeout: Connect timeout in seconds
+        read_timeout: Read, write and pool timeout in seconds
+        http2: Enable HTTP/2; ignored with a warning if ``h2`` is not installed
+
+    Returns:
+        Configured AsyncClient; the caller owns it and must close it
+    """
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP/2 requested but 'h2' is not installed, using HTTP/1.1")
+        http2 = False
+
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+    )
+
+
+async def http_get(
+    url: str,
+    params: dict[str, str] | None = None,
+    client: httpx.AsyncClient | None = None,
+    rate_limiter: AsyncTokenBucket | None = None,
+    max_backoff_retries: int = 3,
+    default_backoff_seconds: float = 10.0,
+    headers: dict[str, str] | None = None,
+) -> httpx.Response:
+    """Send a rate-limited GET through ``client``, or a short-lived client.
+
+    With a rate limiter, every attempt first takes a token. A 429/503 answer
+    pauses the shared limiter for ``Retry-After`` (or the default backoff) and
+    the request is retried up to ``max_backoff_retries`` times. A
+    ``304 Not Modified`` answer to a conditional request is returned as is.
+
+    Args:
+        url: Request URL
+        params: Query parameters
+        client: Shared client; a short-lived client is opened when None
+        rate_limiter: Limiter shared by every caller of the same upstream
+        max_backoff_retries: Retries after a 429/503 answer
+        default_backoff_seconds: Pause used when Retry-After is missing
+        headers: Extra request headers, e.g. conditional-GET validators
+
+    Raises:
+        httpx.RequestError: If the request fails
+        httpx.HTTPStatusError: If the response status is an error
+    """
+    attempt = 0
+    while True:
+        if rate_limiter is not None:
+            await rate_limiter.acquire()
+
+        if client is not None:
+            response = await client.get(url, params=params, headers=headers)
+        else:
+            async with httpx.AsyncClient(timeout=30.0) as short_lived:
+                response = await short_lived.get(url, params=params, headers=headers)
+
+        if (
+            rate_limiter is None
+            or response.status_code not in BACKOFF_STATUS_CODES
+            or attempt >= max_backoff_retries
+        ):
+            break
+
+        attempt += 1
+        delay = parse_retry_after(response.headers.get("Retry-After"))
+        rate_limiter.penalize(
+            delay if delay is not None else default_backoff_seconds * attempt
+        )
+
+    if response.status_code != httpx.codes.NOT_MODIFIED:
+        response.raise_for_status()
+    return response
@@ -0,0 +1,97 @@
+"""Async token-bucket rate limiter for outbound source requests."""
+
+import asyncio
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+from core.log import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncTokenBucket:
+    """Token bucket shared by every coroutine that talks to one upstream.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``. Each
+    request takes one token when it *starts*, so request latency does not
+    eat into the allowed rate. ``penalize`` pauses the whole bucket, e.g.
+    when the upstream answers 429/503 with ``Retry-After``.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """Initialize the token bucket.
+
+        Args:
+            rate: Sustained requests per second
+            burst: Maximum number of requests that may start back to back
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        if burst < 1:
+            raise ValueError(f"Burst must be at least 1, got {burst}")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may start, then consume one token."""
+        # The lock serializes waiters so tokens are handed out in FIFO order.
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def penalize(self, delay_seconds: float) -> None:
+        """Block all requests for ``delay_seconds`` and drain the bucket.
+
+        Args:
+            delay_seconds: Seconds to wait before the next request may start
+        """
+        now = time.monotonic()
+        self._blocked_until = max(self._blocked_until, now + delay_seconds)
+        self._tokens = 0.0
+        self._updated_at = self._blocked_until
+        logger.warning(f"Upstream asked to back off, pausing for {delay_seconds:.1f}s")
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header into seconds.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP-date
+
+    Returns:
+        Non-negative delay in seconds, or None if the header is absent/invalid
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
@@ -0,0 +1,263 @@
+"""On-disk response cache with conditional-GET revalidation for source APIs."""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from urllib.parse import urlencode, urlsplit, urlunsplit
+
+import httpx
+
+from core.extractors.http_client import http_get
+from core.extractors.rate_limiter import AsyncTokenBucket
+from core.log import get_logger
+
+logger = get_logger(__name__)
+
+# Last day of an arXiv range, e.g. "submittedDate:[202501010000+TO+202501012359]"
+_SUBMITTED_UNTIL_PATTERN = re.compile(r"submittedDate:\[\d+\+TO\+(\d{8})")
+
+
+@dataclass
+class CachedResponse:
+    """A cached response body and the validators needed to revalidate it."""
+
+    body: str
+    stored_at: float
+    ttl_seconds: float | None
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def is_fresh(self, now: float) -> bool:
+        """Return True if the entry may be served without asking the upstream."""
+        return self.ttl_seconds is None or now < self.stored_at + self.ttl_seconds
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from the validators."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Gzip-compressed on-disk cache of GET responses, keyed by normalized URL.
+
+    Freshness depends on the age of the data a query asks for: a query whose
+    ``submittedDate`` range ended more than ``immutable_after_days`` ago never
+    expires, while anything newer (or without a date range) is fresh for
+    ``recent_ttl_seconds``. Stale entries are revalidated with the stored
+    ETag/Last-Modified, so a ``304 Not Modified`` costs no body transfer.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        recent_ttl_seconds: float = 3600.0,
+        immutable_after_days: int = 7,
+    ) -> None:
+        """Initialize the cache and create its directory.
+
+        Args:
+            cache_dir: Directory holding the cached bodies and metadata
+            recent_ttl_seconds: Freshness of responses for recent data
+            immutable_after_days: Age in days after which a date range is
+                treated as immutable
+        """
+        self.cache_dir = Path(cache_dir)
+        self.recent_ttl_seconds = recent_ttl_seconds
+        self.immutable_after_days = immutable_after_days
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def normalize_url(url: str, params: dict[str, str] | None = None) -> str:
+        """Normalize a request URL so equivalent queries share a cache key.
+
+        Query parameters are sorted but not decoded, so ``+`` in arXiv
+        queries stays distinct from an encoded ``%2B``.
+
+        Args:
+            url: Request URL, possibly with a query string
+            params: Extra query parameters sent with the request
+
+        Returns:
+            URL with lower-cased scheme/host and sorted query parameters
+        """
+        parts = urlsplit(url)
+        pairs = [pair for pair in parts.query.split("&") if pair]
+        if params:
+            pairs.extend(urlencode(params).split("&"))
+        return urlunsplit(
+            (
+                parts.scheme.lower(),
+                parts.netloc.lower(),
+                parts.path,
+                "&".join(sorted(pairs)),
+                "",
+            )
+        )
+
+    def ttl_for(self, url: str, today: date | None = None) -> float | None:
+        """Return the freshness lifetime for a normalized URL.
+
+        Args:
+            url: Normalized request URL
+            today: Reference date, defaults to the current UTC date
+
+        Returns:
+            None if the queried date range is immutable, else the recent TTL
+        """
+        match = _SUBMITTED_UNTIL_PATTERN.search(url)
+        if match is None:
+            return self.recent_ttl_seconds
+
+        try:
+            until = datetime.strptime(match.group(1), "%Y%m%d").date()
+        except ValueError:
+            return self.recent_ttl_seconds
+
+        today = today or datetime.now(UTC).date()
+        if until < today - timedelta(days=self.immutable_after_days):
+            return None
+        return self.recent_ttl_seconds
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        # Two-character fan-out keeps directories small on long crawls
+        directory = self.cache_dir / key[:2]
+        return directory / f"{key}.xml.gz", directory / f"{key}.json"
+
+    @staticmethod
+    def _key(normalized_url: str) -> str:
+        return hashlib.sha256(normalized_url.encode("utf-8")).hexdigest()
+
+    def get(self, normalized_url: str) -> CachedResponse | None:
+        """Load a cached response regardless of freshness.
+
+        Args:
+            normalized_url: URL returned by normalize_url
+
+        Returns:
+            Cached response, or None on a miss or an unreadable entry
+        """
+        body_path, meta_path = self._paths(self._key(normalized_url))
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = gzip.decompress(body_path.read_bytes()).decode("utf-8")
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, EOFError) as e:
+            logger.warning(f"Ignoring unreadable cache entry for {normalized_url}: {e}")
+            return None
+
+        return CachedResponse(
+            body=body,
+            stored_at=meta["stored_at"],
+            ttl_seconds=meta.get("ttl_seconds"),
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+        )
+
+    def put(self, normalized_url: str, entry: CachedResponse) -> None:
+        """Store a response, replacing any previous entry atomically.
+
+        Args:
+            normalized_url: URL returned by normalize_url
+            entry: Response body and validators
+        """
+        body_path, meta_path = self._paths(self._key(normalized_url))
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "url": normalized_url,
+            "stored_at": entry.stored_at,
+            "ttl_seconds": entry.ttl_seconds,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+        }
+        # Body first, so metadata never points at a missing or partial body
+        _write_atomic(body_path, gzip.compress(entry.body.encode("utf-8")))
+        _write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+
+    async def fetch(
+        self,
+        url: str,
+        params: dict[str, str] | None = None,
+        client: httpx.AsyncClient | None = None,
+        rate_limiter: AsyncTokenBucket | None = None,
+    ) -> str:
+        """Return the body for a GET, from the cache when possible.
+
+        Fresh entries are served without a request or a rate-limiter token.
+        Stale entries are revalidated with a conditional GET; a 304 renews
+        the entry. Misses are fetched and stored.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            client: Shared client passed to http_get
+            rate_limiter: Limiter passed to http_get
+
+        Returns:
+            Response body
+
+        Raises:
+            httpx.RequestError: If the request fails
+            httpx.HTTPStatusError: If the response status is an error
+        """
+        normalized_url = self.normalize_url(url, params)
+        cached = await asyncio.to_thread(self.get, normalized_url)
+        now = time.time()
+        if cached is not None and cached.is_fresh(now):
+            logger.debug(f"Response cache hit: {normalized_url}")
+            return cached.body
+
+        response = await http_get(
+            url,
+            params=params,
+            client=client,
+            rate_limiter=rate_limiter,
+            headers=cached.conditional_headers() if cached else None,
+        )
+
+        ttl_seconds = self.ttl_for(normalized_url)
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            logger.debug(f"Response cache revalidated: {normalized_url}")
+            entry = CachedResponse(
+                body=cached.body,
+                stored_at=now,
+                ttl_seconds=ttl_seconds,
+                etag=response.headers.get("ETag", cached.etag),
+                last_modified=response.headers.get(
+                    "Last-Modified", cached.last_modified
+                ),
+            )
+        else:
+            entry = CachedResponse(
+                body=response.text,
+                stored_at=now,
+                ttl_seconds=ttl_seconds,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+
+        await asyncio.to_thread(self.put, normalized_url, entry)
+        return entry.body
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    descriptor, temporary_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as temporary_file:
+            temporary_file.write(data)
+        os.replace(temporary_name, path)
+    except BaseException:
+        Path(temporary_name).unlink(missing_ok=True)
+        raise
@@ -0,0 +1,181 @@
+"""Source-agnostic crawl scheduler over registered source explorers."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+
+from core.extractors.base import BaseSourceExplorer
+from core.extractors.factory import get_all_source_explorers
+from core.extractors.rate_limiter import AsyncTokenBucket
+from core.log import get_logger
+from core.models.domain.paper_extraction import (
+    PaperMetadata,
+    SourceCrawlConfig,
+    SourceCrawlResult,
+)
+
+logger = get_logger(__name__)
+
+# Receives (source, category, papers); category is None for recent papers
+PaperSink = Callable[[str, str | None, list[PaperMetadata]], Awaitable[None]]
+
+
+class SourceCrawlScheduler:
+    """Crawls every registered source explorer concurrently.
+
+    Each source gets its own token bucket and concurrency budget from its
+    ``SourceCrawlConfig``, so a slow or strict source only throttles its
+    own explorations. Within a source, categories are explored in parallel
+    up to ``max_concurrency``; every exploration takes one token first.
+    Discovered papers go to the sink; storing them is up to the caller.
+    """
+
+    def __init__(
+        self,
+        configs: Mapping[str, SourceCrawlConfig] | None = None,
+        default_config: SourceCrawlConfig | None = None,
+        poll_interval: float = 3600.0,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            configs: Crawl configuration per registered source name
+            default_config: Configuration of sources missing from ``configs``
+                (default: recent papers at one exploration per second)
+            poll_interval: Seconds between crawl cycles (default: 3600.0)
+        """
+        self.configs = dict(configs or {})
+        self.default_config = default_config or SourceCrawlConfig()
+        self.poll_interval = poll_interval
+
+        self._limiters: dict[str, AsyncTokenBucket] = {}
+        self._running = False
+        self._crawl_task: asyncio.Task[None] | None = None
+
+    def config(self, source: str) -> SourceCrawlConfig:
+        """Get the crawl configuration of a source."""
+        return self.configs.get(source, self.default_config)
+
+    def rate_limiter(self, source: str) -> AsyncTokenBucket:
+        """Get the token bucket pacing a source, kept across cycles."""
+        if source not in self._limiters:
+            config = self.config(source)
+            self._limiters[source] = AsyncTokenBucket(
+                rate=config.requests_per_second, burst=config.burst
+            )
+        return self._limiters[source]
+
+    async def crawl_source(
+        self, source: str, explorer: BaseSourceExplorer, sink: PaperSink
+    ) -> SourceCrawlResult:
+        """Explore every configured category of one source.
+
+        Failed explorations are logged and counted, not raised, so they do
+        not cancel the other categories or sources.
+
+        Args:
+            source: Registered source name
+            explorer: Explorer of the source
+            sink: Receiver of the discovered papers
+
+        Returns:
+            Counts of the cycle over the source
+        """
+        config = self.config(source)
+        limiter = self.rate_limiter(source)
+        budget = asyncio.Semaphore(config.max_concurrency)
+        result = SourceCrawlResult(source=source)
+
+        async def explore(category: str | None) -> None:
+            async with budget:
+                await limiter.acquire()
+                result.explorations += 1
+                try:
+                    if category is None:
+                        papers = await explorer.explore_recent(limit=config.limit)
+                    else:
+                        papers = await explorer.explore_by_category(
+                            category, limit=config.limit
+                        )
+                    result.papers_found += len(papers)
+                    await sink(source, category, papers)
+                except Exception as e:
+                    result.failures += 1
+                    logger.warning(f"Exploring {source} {category or 'recent'}: {e}")
+
+        categories: list[str | None] = list(config.categories) or [None]
+        async with asyncio.TaskGroup() as task_group:
+            for category in categories:
+                task_group.create_task(explore(category))
+
+        logger.info(
+            f"Crawled {source}: {result.papers_found} papers from "
+            f"{result.explorations} explorations, {result.failures} failed"
+        )
+        return result
+
+    async def run_cycle(self, sink: PaperSink) -> dict[str, SourceCrawlResult]:
+        """Crawl all registered sources once, concurrently.
+
+        Args:
+            sink: Receiver of the discovered papers
+
+        Returns:
+            Result per source name
+        """
+        explorers = get_all_source_explorers()
+        async with asyncio.TaskGroup() as task_group:
+            tasks = {
+                source: task_group.create_task(
+                    self.crawl_source(source, explorer, sink)
+                )
+                for source, explorer in explorers.items()
+            }
+        return {source: task.result() for source, task in tasks.items()}
+
+    async def start(self, sink: PaperSink) -> None:
+        """Start crawling every ``poll_interval`` seconds in the background.
+
+        Args:
+            sink: Receiver of the discovered papers
+        """
+        if self._running:
+            logger.warning("Source crawl scheduler is already running")
+            return
+
+        logger.info("Starting source crawl scheduler")
+        self._running = True
+        self._crawl_task = asyncio.create_task(self._crawl_scheduler(sink))
+
+    async def stop(self) -> None:
+        """Stop the source crawl scheduler."""
+        if not self._running:
+            logger.warning("Source crawl scheduler is not running")
+            return
+
+        logger.info("Stopping source crawl scheduler")
+        self._running = False
+
+        if self._crawl_task:
+            self._crawl_task.cancel()
+            try:
+                await self._crawl_task
+            except asyncio.CancelledError:
+                pass
+            self._crawl_task = None
+
+    async def _crawl_scheduler(self, sink: PaperSink) -> None:
+        """Run a crawl cycle every ``poll_interval`` seconds until stopped."""
+        while self._running:
+            try:
+                await self.run_cycle(sink)
+            except asyncio.CancelledError:
+                logger.info("Source crawl scheduler cancelled")
+                break
+            except Exception as e:
+                logger.error(f"Error in source crawl scheduler: {e}")
+            await asyncio.sleep(self.poll_interval)
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the source crawl scheduler is running."""
+        return self._running
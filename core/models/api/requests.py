@@ -1,5 +1,7 @@
 """API request models."""
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -15,6 +17,14 @@ class PaperCreateRequest(BaseModel):
     )
 
 
+class PaperImportBatchRequest(BaseModel):
+    """Request model for importing several papers by URL."""
+
+    urls: list[str] = Field(
+        ..., min_length=1, max_length=500, description="Paper URLs to import"
+    )
+
+
 class StarRequest(BaseModel):
     """Request model for star operations."""
 
@@ -23,6 +33,33 @@ class StarRequest(BaseModel):
     )
 
 
+class StarBatchItem(BaseModel):
+    """Single star or unstar operation within a batch."""
+
+    paper_id: int = Field(..., description="Paper ID")
+    action: Literal["star", "unstar"] = Field(..., description="Operation to apply")
+    note: str | None = Field(
+        default=None, description="Optional note for the starred paper", max_length=500
+    )
+
+
+class StarBatchRequest(BaseModel):
+    """Request model for batched star operations."""
+
+    items: list[StarBatchItem] = Field(
+        ..., min_length=1, max_length=100, description="Operations applied in order"
+    )
+
+
+class SummaryReadBatchRequest(BaseModel):
+    """Request model for marking several paper summaries as read."""
+
+    paper_ids: list[int] = Field(
+        ..., min_length=1, max_length=100, description="Paper IDs to mark as read"
+    )
+    language: str = Field(default="Korean", description="Language of the summaries")
+
+
 class PaperListRequest(BaseModel):
     """Request model for paper list query."""
 
@@ -1,5 +1,7 @@
 """API response models."""
 
+from typing import Any
+
 from pydantic import BaseModel, Field
 
 from core.log import get_logger
@@ -13,6 +15,21 @@ from core.models.rows import (
 
 logger = get_logger(__name__)
 
+_PAPER_FIELDS = tuple(PaperBase.model_fields)
+
+
+def _paper_fields(paper: PaperBase) -> dict[str, Any]:
+    """Read paper columns from an already-validated row without model_dump.
+
+    Loaded column values live in the instance ``__dict__``; reading them there
+    avoids the ORM attribute descriptors. Expired columns fall back to getattr.
+    """
+    loaded = paper.__dict__
+    return {
+        name: loaded[name] if name in loaded else getattr(paper, name)
+        for name in _PAPER_FIELDS
+    }
+
 
 class PaperResponse(PaperBase, table=False):
     """Response model for paper details."""
@@ -30,15 +47,16 @@ class PaperResponse(PaperBase, table=False):
         is_starred: bool = False,
         is_read: bool = False,
     ) -> "PaperResponse":
-        """Create PaperResponse from Paper (SQLModel)."""
+        """Create PaperResponse from Paper (SQLModel).
 
-        # Create base paper data from Paper model
-        paper_data = paper.model_dump()
-        return cls(
+        Rows loaded from the database are already validated, so the response
+        is constructed directly instead of re-validating a dumped dict.
+        """
+        return cls.model_construct(
             summary=summary,
             is_starred=is_starred,
             is_read=is_read,
-            **paper_data,
+            **_paper_fields(paper),
         )
 
 
@@ -62,15 +80,17 @@ class PaperListItemResponse(PaperBase, table=False):
         is_starred: bool = False,
         is_read: bool = False,
     ) -> "PaperListItemResponse":
-        """Create PaperListItemResponse from Paper with overview."""
-        paper_data = paper.model_dump()
-        return cls(
+        """Create PaperListItemResponse from Paper with overview.
+
+        Skips validation because the paper row is already validated.
+        """
+        return cls.model_construct(
             overview=overview,
             has_summary=has_summary,
             relevance=relevance,
             is_starred=is_starred,
             is_read=is_read,
-            **paper_data,
+            **_paper_fields(paper),
         )
 
     @classmethod
@@ -206,6 +226,47 @@ class StarResponse(BaseModel):
         return cls(success=False, is_starred=False, message=message)
 
 
+class PaperImportBatchItem(BaseModel):
+    """Result of importing a single paper URL."""
+
+    url: str
+    success: bool
+    message: str
+    created: bool = False
+    paper: PaperResponse | None = None
+
+
+class PaperImportBatchResponse(BaseModel):
+    """Response model for bulk paper import, one result per URL."""
+
+    results: list[PaperImportBatchItem] = Field(..., description="Per-URL results")
+    created_count: int = Field(..., description="Papers newly created")
+    existing_count: int = Field(..., description="Papers that already existed")
+    failed_count: int = Field(..., description="URLs that could not be imported")
+
+
+class StarBatchResponse(BaseModel):
+    """Response model for batched star operations, one result per item."""
+
+    results: list[StarResponse] = Field(..., description="Per-item results")
+
+
+class SummaryReadBatchItem(BaseModel):
+    """Result of marking a single paper summary as read."""
+
+    paper_id: int
+    success: bool
+    message: str
+    is_read: bool = False
+    summary_id: int | None = None
+
+
+class SummaryReadBatchResponse(BaseModel):
+    """Response model for batched mark-as-read operations."""
+
+    results: list[SummaryReadBatchItem] = Field(..., description="Per-item results")
+
+
 class StarredPapersResponse(BaseModel):
     """Response model for starred papers list with pagination."""
 
@@ -232,6 +293,9 @@ class CrawlCycleResult(BaseModel):
     papers_stored: int = Field(description="Number of papers stored")
     category: str = Field(description="Category that was crawled")
     date: str = Field(description="Date that was crawled")
+    completed: bool = Field(
+        default=True, description="Whether the unit was crawled to its last page"
+    )
 
 
 class CrawlerResponse(BaseModel):
@@ -259,6 +323,21 @@ class CrawlerProgressResponse(BaseModel):
     total_papers_stored: int
     completed_date_categories: int
     failed_date_categories: int
+    failed_papers: int = 0
+    requests_per_minute: float = 0.0
+    papers_per_second: float = 0.0
+    parse_ms_per_page: float = 0.0
+    store_ms_per_batch: float = 0.0
+    backlog_dates: int = Field(
+        default=0, description="Days between the crawl cursor and the end date"
+    )
+    remaining_units: int = Field(
+        default=0, description="Date-category units left before the end date"
+    )
+    eta_seconds: float | None = Field(
+        default=None,
+        description="Time to reach the end date at the recent completion rate",
+    )
 
 
 class StatisticsResponse(BaseModel):
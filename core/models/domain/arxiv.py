@@ -1,5 +1,6 @@
 """Domain models for ArXiv exploration."""
 
+from collections.abc import Sequence
 from datetime import datetime
 
 from pydantic import BaseModel, Field
@@ -11,6 +12,7 @@ class ArxivPaper(PaperMetadata):
     """ArXiv paper domain model."""
 
     arxiv_id: str = Field(..., description="ArXiv ID (e.g., 1706.03762)")
+    version: int = Field(default=1, ge=1, description="Latest ArXiv version")
     primary_category: str = Field(..., description="Primary ArXiv category")
 
 
@@ -39,3 +41,77 @@ class CompletedDay(BaseModel):
     category: str = Field(..., description="ArXiv category")
     completed_date: str = Field(..., description="Completed date")
     created_at: str = Field(default_factory=lambda: datetime.now().isoformat())
+
+
+class CrawlPipelineMetrics(BaseModel):
+    """Per-stage timings and counts for one pipelined crawl unit."""
+
+    pages_fetched: int = Field(default=0, description="Raw pages fetched")
+    papers_found: int = Field(default=0, description="Papers parsed from pages")
+    papers_stored: int = Field(default=0, description="New papers written")
+    fetch_seconds: float = Field(default=0.0, description="Time spent in requests")
+    parse_seconds: float = Field(default=0.0, description="Time spent parsing XML")
+    store_seconds: float = Field(default=0.0, description="Time spent writing")
+    store_batches: int = Field(default=0, description="Bulk-store transactions")
+    wall_seconds: float = Field(default=0.0, description="End-to-end duration")
+    completed: bool = Field(
+        default=False, description="Whether every page was fetched and stored"
+    )
+    papers_found_by_category: dict[str, dict[str, int]] = Field(
+        default_factory=dict,
+        description="Papers parsed per queried category and submission day",
+    )
+    papers_stored_by_category: dict[str, dict[str, int]] = Field(
+        default_factory=dict,
+        description="New papers written per queried category and submission day",
+    )
+
+    def count_found(self, categories: Sequence[str], day: str, count: int = 1) -> None:
+        """Attribute parsed papers to each matched category on a day."""
+        for category in categories:
+            by_day = self.papers_found_by_category.setdefault(category, {})
+            by_day[day] = by_day.get(day, 0) + count
+
+    def count_stored(self, categories: Sequence[str], day: str, count: int) -> None:
+        """Attribute newly written papers to each matched category on a day."""
+        for category in categories:
+            by_day = self.papers_stored_by_category.setdefault(category, {})
+            by_day[day] = by_day.get(day, 0) + count
+
+    def unit_counts(self, category: str, day: str) -> tuple[int, int]:
+        """Found and stored counts for one category on one day."""
+        return (
+            self.papers_found_by_category.get(category, {}).get(day, 0),
+            self.papers_stored_by_category.get(category, {}).get(day, 0),
+        )
+
+
+class CrawlThroughput(BaseModel):
+    """Crawl rates over a recent window of finished crawl queries."""
+
+    requests_per_minute: float = Field(default=0.0, description="Pages fetched")
+    papers_per_second: float = Field(default=0.0, description="Papers parsed")
+    parse_ms_per_page: float = Field(
+        default=0.0, description="Mean parse time of one page in milliseconds"
+    )
+    store_ms_per_batch: float = Field(
+        default=0.0, description="Mean time of one bulk store in milliseconds"
+    )
+    units_per_hour: float = Field(
+        default=0.0, description="Date-category units completed"
+    )
+
+
+class SnapshotImportProgress(BaseModel):
+    """Progress of an offline import from an arXiv metadata snapshot."""
+
+    bytes_read: int = Field(default=0, description="Snapshot bytes consumed")
+    bytes_total: int = Field(default=0, description="Snapshot size in bytes")
+    records_read: int = Field(default=0, description="Snapshot records read")
+    papers_found: int = Field(
+        default=0, description="Records in the imported categories"
+    )
+    papers_stored: int = Field(default=0, description="New papers written")
+    completed: bool = Field(
+        default=False, description="Whether the whole snapshot was imported"
+    )
@@ -27,6 +27,32 @@ class PaperMetadata(BaseModel):
     )
 
 
+class SourceCrawlConfig(BaseModel):
+    """What the source crawl scheduler explores of one source, and how fast."""
+
+    categories: list[str] = Field(
+        default_factory=list,
+        description="Categories explored per cycle; recent papers when empty",
+    )
+    limit: int = Field(default=100, ge=1, description="Papers per exploration")
+    requests_per_second: float = Field(
+        default=1.0, gt=0, description="Explorations started per second"
+    )
+    burst: int = Field(default=1, ge=1, description="Explorations started at once")
+    max_concurrency: int = Field(
+        default=1, ge=1, description="Explorations of the source running at once"
+    )
+
+
+class SourceCrawlResult(BaseModel):
+    """Outcome of one crawl cycle over a source."""
+
+    source: str = Field(..., description="Registered source name")
+    explorations: int = Field(default=0, description="Explorations attempted")
+    failures: int = Field(default=0, description="Explorations that failed")
+    papers_found: int = Field(default=0, description="Papers returned")
+
+
 class PaperExtractor(Protocol):
     """Protocol for paper extractors."""
 
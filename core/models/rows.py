@@ -21,7 +21,7 @@ class PaperBase(SQLModel):
     authors: str = Field(description="Semicolon-separated authors")
     url_abs: str = Field(description="Abstract URL")
     url_pdf: str | None = Field(default=None, description="PDF URL")
-    published_at: str = Field(description="ISO8601 datetime")
+    published_at: str = Field(index=True, description="ISO8601 datetime")
     updated_at: str = Field(
         default_factory=get_current_timestamp,
         description="ISO8601 datetime - automatically updated",
@@ -191,11 +191,32 @@ class ArxivFailedPaper(SQLModel, table=True):
     )
 
 
+class CrawlFailedUnit(SQLModel, table=True):
+    """Date-category crawl unit whose crawl failed, queued for retry."""
+
+    failed_unit_id: int | None = Field(default=None, primary_key=True)
+    category: str = Field(index=True, description="ArXiv category (e.g., cs.AI)")
+    date: str = Field(description="Date in YYYY-MM-DD format")
+    error_message: str = Field(description="Error message of the last attempt")
+    retry_count: int = Field(default=0, description="Number of retry attempts made")
+    last_retry_at: str | None = Field(
+        default=None, description="ISO8601 datetime of last retry attempt"
+    )
+    created_at: str = Field(
+        default_factory=get_current_timestamp,
+        description="ISO8601 datetime - automatically updated",
+    )
+    updated_at: str = Field(
+        default_factory=get_current_timestamp,
+        description="ISO8601 datetime - automatically updated",
+    )
+
+
 class CrawlCompletion(SQLModel, table=True):
     """Crawl completion status for date-category combinations."""
 
     completion_id: int | None = Field(default=None, primary_key=True)
-    category: str = Field(description="ArXiv category (e.g., cs.AI)")
+    category: str = Field(index=True, description="ArXiv category (e.g., cs.AI)")
     date: str = Field(description="Date in YYYY-MM-DD format")
     papers_found: int = Field(default=0, description="Number of papers found")
     papers_stored: int = Field(default=0, description="Number of papers stored")
@@ -203,3 +224,50 @@ class CrawlCompletion(SQLModel, table=True):
         default_factory=get_current_timestamp,
         description="ISO8601 datetime when crawl was completed",
     )
+
+
+class CrawlCheckpoint(SQLModel, table=True):
+    """Page cursor of an interrupted crawl query over categories and days."""
+
+    checkpoint_id: int | None = Field(default=None, primary_key=True)
+    categories: str = Field(
+        index=True, description="Comma-separated categories of the query"
+    )
+    start_date: str = Field(description="First day of the query (YYYY-MM-DD)")
+    end_date: str = Field(index=True, description="Last day of the query (YYYY-MM-DD)")
+    next_index: int = Field(default=0, description="Start index of the next page")
+    papers_found: int = Field(default=0, description="Papers found so far")
+    papers_stored: int = Field(default=0, description="Papers stored so far")
+    updated_at: str = Field(
+        default_factory=get_current_timestamp,
+        description="ISO8601 datetime of the last stored page",
+    )
+
+
+class CrawlerLease(SQLModel, table=True):
+    """Lease electing the one crawler worker allowed to crawl.
+
+    The API records whether crawling is requested; the worker holding the
+    lease renews it and publishes its status and progress as JSON.
+    """
+
+    name: str = Field(primary_key=True, description="Lease name (e.g., historical)")
+    holder: str | None = Field(
+        default=None, description="Worker holding the lease (host:pid)"
+    )
+    expires_at: str | None = Field(
+        default=None, description="ISO8601 datetime the lease lapses unless renewed"
+    )
+    run_requested: bool = Field(
+        default=True, description="Whether the worker should be crawling"
+    )
+    status: str | None = Field(
+        default=None, description="CrawlerStatusResponse JSON of the worker"
+    )
+    progress: str | None = Field(
+        default=None, description="CrawlerProgressResponse JSON of the worker"
+    )
+    updated_at: str = Field(
+        default_factory=get_current_timestamp,
+        description="ISO8601 datetime - automatically updated",
+    )
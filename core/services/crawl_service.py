@@ -3,6 +3,7 @@
 from sqlalchemy.engine import Engine
 
 from core.extractors.concrete.arxiv_source_explorer import ArxivSourceExplorer
+from core.extractors.concrete.crawler_lease import CrawlerLeaseManager
 from core.extractors.concrete.historical_crawl_manager import HistoricalCrawlManager
 from core.log import get_logger
 from core.models.api.responses import (
@@ -57,3 +58,82 @@ class CrawlService:
     def get_progress(self, engine: Engine) -> CrawlerProgressResponse:
         """Get current crawling progress."""
         return self.crawl_manager.get_progress_summary_for_progress(engine)
+
+
+class WorkerCrawlService:
+    """Service controlling a ``theark-crawler`` worker through its lease.
+
+    Start and stop only record the request in the lease row; the worker
+    holding the lease applies it on its next renewal. Status and progress
+    are the ones the worker last published.
+    """
+
+    def __init__(self, lease_manager: CrawlerLeaseManager, categories: str) -> None:
+        """Initialize worker crawl service.
+
+        Args:
+            lease_manager: Lease manager of the crawler worker
+            categories: Comma-separated categories reported before the worker
+                publishes its status
+        """
+        self.lease_manager = lease_manager
+        self.categories = categories
+
+    def is_running(self, engine: Engine) -> bool:
+        """Check if a live worker is crawling or about to."""
+        lease = self.lease_manager.read()
+        return self.lease_manager.is_held(lease) and bool(lease and lease.run_requested)
+
+    async def start_crawling(
+        self, explorer: ArxivSourceExplorer, engine: Engine
+    ) -> bool:
+        """Request the worker to start crawling."""
+        try:
+            self.lease_manager.request_running(True)
+        except Exception as e:
+            logger.error(f"Failed to request crawling: {e}")
+            return False
+
+        if not self.lease_manager.is_held(self.lease_manager.read()):
+            logger.warning("No crawler worker holds the lease; start is pending")
+        return True
+
+    async def stop_crawling(self) -> bool:
+        """Request the worker to stop crawling."""
+        try:
+            self.lease_manager.request_running(False)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to request crawl stop: {e}")
+            return False
+
+    def get_status(self, engine: Engine) -> CrawlerStatusResponse:
+        """Get the status last published by the worker."""
+        lease = self.lease_manager.read()
+        if lease is None or lease.status is None:
+            return CrawlerStatusResponse(
+                is_running=False,
+                is_active=False,
+                current_date="",
+                current_category_index=0,
+                categories=self.categories,
+            )
+
+        status = CrawlerStatusResponse.model_validate_json(lease.status)
+        # A published status goes stale once the worker stops renewing
+        is_active = self.lease_manager.is_held(lease)
+        status.is_active = is_active
+        status.is_running = is_active and lease.run_requested and status.is_running
+        return status
+
+    def get_progress(self, engine: Engine) -> CrawlerProgressResponse:
+        """Get the progress last published by the worker."""
+        lease = self.lease_manager.read()
+        if lease is None or lease.progress is None:
+            return CrawlerProgressResponse(
+                total_papers_found=0,
+                total_papers_stored=0,
+                completed_date_categories=0,
+                failed_date_categories=0,
+            )
+        return CrawlerProgressResponse.model_validate_json(lease.progress)
@@ -3,15 +3,16 @@
 from sqlmodel import Session
 
 from core import get_logger
-from core.config import load_settings
+from core.config import Settings, load_settings
 from core.database.repository import (
     PaperRepository,
     SummaryRepository,
     UserStarRepository,
 )
 from core.database.repository.summary_read import SummaryReadRepository
+from core.extractors.base import BaseExtractor
 from core.extractors.exceptions import ExtractionError
-from core.extractors.factory import find_extractor_for_url
+from core.extractors.factory import find_extractor_for_url, route_urls
 from core.llm.openai_client import UnifiedOpenAIClient
 from core.models import (
     PaperCreateRequest,
@@ -21,13 +22,16 @@ from core.models import (
     SummaryReadResponse,
 )
 from core.models.api.responses import (
+    PaperImportBatchItem,
+    PaperImportBatchResponse,
     PaperListLightweightResponse,
     PaperListResponse,
     SummaryDetailResponse,
+    SummaryReadBatchItem,
+    SummaryReadBatchResponse,
 )
 from core.models.domain.paper_extraction import PaperMetadata
 from core.models.rows import Paper, Summary
-from core.services.summarization_service import PaperSummarizationService
 
 logger = get_logger(__name__)
 
@@ -35,9 +39,13 @@ logger = get_logger(__name__)
 class PaperService:
     """Service for paper CRUD operations using new architecture."""
 
-    def __init__(self) -> None:
-        """Initialize paper service."""
-        self.settings = load_settings()
+    def __init__(self, settings: Settings | None = None) -> None:
+        """Initialize paper service.
+
+        Args:
+            settings: Application settings; loaded from the environment if omitted
+        """
+        self.settings = settings or load_settings()
 
     def _extract_arxiv_id(self, paper_data: PaperCreateRequest) -> str:
         """Extract arXiv ID from paper data."""
@@ -72,6 +80,108 @@ class PaperService:
         # Convert Paper to PaperResponse
         return PaperResponse.from_crawler_paper(paper)
 
+    async def import_papers(
+        self, urls: list[str], paper_repo: PaperRepository
+    ) -> PaperImportBatchResponse:
+        """Import several papers by URL, one result per distinct URL.
+
+        Existing papers are found with one IN query, metadata for the rest
+        is fetched with each extractor's batch lookup, and new papers are
+        inserted in one transaction.
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        identifiers: dict[str, str] = {}
+        errors: dict[str, str] = {}
+        urls_by_extractor: dict[BaseExtractor, list[str]] = {}
+        routed, unsupported = route_urls(unique_urls)
+        for url in unsupported:
+            errors[url] = f"Invalid URL format: No extractor found for URL: {url}"
+        for extractor, extractor_urls in routed.items():
+            found = extractor.extract_identifiers(extractor_urls)
+            identifiers.update(found)
+            for url in extractor_urls:
+                if url not in found:
+                    errors[url] = (
+                        f"Invalid URL format: Could not extract identifier from: {url}"
+                    )
+            urls_by_extractor[extractor] = [
+                url for url in extractor_urls if url in found
+            ]
+
+        existing = {
+            paper.arxiv_id: paper
+            for paper in paper_repo.get_by_arxiv_ids(list(set(identifiers.values())))
+        }
+
+        # Fetch each missing identifier once, whatever URL form it came in
+        metadata: dict[str, PaperMetadata] = {}
+        scheduled: set[str] = set()
+        for extractor, extractor_urls in urls_by_extractor.items():
+            fetch_urls = []
+            for url in extractor_urls:
+                arxiv_id = identifiers[url]
+                if arxiv_id not in existing and arxiv_id not in scheduled:
+                    scheduled.add(arxiv_id)
+                    fetch_urls.append(url)
+            if fetch_urls:
+                for url, paper_metadata in (
+                    await extractor.extract_metadata_many(fetch_urls)
+                ).items():
+                    metadata[identifiers[url]] = paper_metadata
+
+        created = {
+            arxiv_id: self._create_paper_from_metadata(arxiv_id, paper_metadata)
+            for arxiv_id, paper_metadata in metadata.items()
+        }
+        paper_repo.create_many(list(created.values()))
+        logger.info(
+            f"Imported {len(created)} new papers, "
+            f"{len(existing)} already existed, out of {len(unique_urls)} URLs"
+        )
+
+        results: list[PaperImportBatchItem] = []
+        for url in unique_urls:
+            arxiv_id = identifiers.get(url, "")
+            if url in errors:
+                results.append(
+                    PaperImportBatchItem(url=url, success=False, message=errors[url])
+                )
+            elif arxiv_id in existing:
+                results.append(
+                    PaperImportBatchItem(
+                        url=url,
+                        success=True,
+                        message="Paper already exists",
+                        paper=PaperResponse.from_crawler_paper(existing[arxiv_id]),
+                    )
+                )
+            elif arxiv_id in created:
+                results.append(
+                    PaperImportBatchItem(
+                        url=url,
+                        success=True,
+                        message="Paper created successfully",
+                        created=True,
+                        paper=PaperResponse.from_crawler_paper(created[arxiv_id]),
+                    )
+                )
+            else:
+                results.append(
+                    PaperImportBatchItem(
+                        url=url,
+                        success=False,
+                        message=f"Failed to extract paper {arxiv_id}",
+                    )
+                )
+
+        return PaperImportBatchResponse(
+            results=results,
+            # Several URL forms may name one paper, so papers are counted once
+            created_count=len(created),
+            existing_count=len(existing),
+            failed_count=sum(not item.success for item in results),
+        )
+
     async def _extract_paper(
         self,
         url: str,
@@ -176,12 +286,15 @@ class PaperService:
 
         Related method: get_papers() - for retrieving multiple papers
         """
-        paper = self._get_paper_by_identifier(paper_identifier, db_session)
-        if not paper:
+        detail = self._get_paper_detail_by_identifier(
+            paper_identifier, db_session, user_id, language
+        )
+        if not detail:
             raise ValueError(f"Paper not found: {paper_identifier}")
 
-        return self._enrich_paper_response(
-            paper, db_session, user_id, language=language
+        paper, summary, is_starred, is_read = detail
+        return PaperResponse.from_crawler_paper(
+            paper, summary=summary, is_starred=is_starred, is_read=is_read
         )
 
     def delete_paper(
@@ -371,24 +484,36 @@ class PaperService:
         Returns:
             Full summary details with read status
         """
-        # Get the full summary
-        summarization_service = PaperSummarizationService()
-        summary = await summarization_service.get_summary(
-            paper_id, db_session, language
+        detail = PaperRepository(db_session).get_paper_detail(
+            paper_id=paper_id, user_id=user_id, language=language
         )
-
-        if not summary:
+        summary = detail[1] if detail else None
+        if not detail or summary is None:
             raise ValueError(f"No summary found for paper {paper_id} in {language}")
 
-        # Check read status
-        is_read = False
-        if user_id and summary.summary_id:
-            summary_read_repo = SummaryReadRepository(db_session)
-            is_read = summary_read_repo.is_summary_read_by_user(
-                user_id, summary.summary_id
-            )
+        return SummaryDetailResponse(summary=summary, is_read=detail[3])
 
-        return SummaryDetailResponse(summary=summary, is_read=is_read)
+    def _get_paper_detail_by_identifier(
+        self,
+        paper_identifier: str,
+        db_session: Session,
+        user_id: int | None,
+        language: str,
+    ) -> tuple[Paper, Summary | None, bool, bool] | None:
+        """Get a paper detail row by ID or arXiv ID."""
+        paper_repo = PaperRepository(db_session)
+
+        # Try to parse as integer (paper ID)
+        try:
+            paper_id = int(paper_identifier)
+        except ValueError:
+            # Try as arXiv ID
+            return paper_repo.get_paper_detail(
+                arxiv_id=paper_identifier, user_id=user_id, language=language
+            )
+        return paper_repo.get_paper_detail(
+            paper_id=paper_id, user_id=user_id, language=language
+        )
 
     def _get_paper_by_identifier(
         self, paper_identifier: str, db_session: Session
@@ -464,3 +589,50 @@ class PaperService:
             success=True,
             message="Summary marked as read successfully",
         )
+
+    async def mark_summaries_as_read(
+        self,
+        paper_ids: list[int],
+        user_id: int,
+        db_session: Session,
+        language: str = "Korean",
+    ) -> SummaryReadBatchResponse:
+        """Mark the summaries of several papers as read in one transaction."""
+        unique_ids = list(dict.fromkeys(paper_ids))
+        existing = PaperRepository(db_session).get_existing_paper_ids(unique_ids)
+        summary_ids = SummaryRepository(db_session).get_summary_ids_by_paper_ids(
+            unique_ids, language
+        )
+        SummaryReadRepository(db_session).mark_many_as_read(
+            user_id, list(summary_ids.values())
+        )
+
+        results: list[SummaryReadBatchItem] = []
+        for paper_id in paper_ids:
+            if paper_id not in existing:
+                results.append(
+                    SummaryReadBatchItem(
+                        paper_id=paper_id,
+                        success=False,
+                        message=f"Paper {paper_id} not found",
+                    )
+                )
+            elif paper_id not in summary_ids:
+                results.append(
+                    SummaryReadBatchItem(
+                        paper_id=paper_id,
+                        success=False,
+                        message=f"Summary not found for paper {paper_id}",
+                    )
+                )
+            else:
+                results.append(
+                    SummaryReadBatchItem(
+                        paper_id=paper_id,
+                        success=True,
+                        message="Summary marked as read successfully",
+                        is_read=True,
+                        summary_id=summary_ids[paper_id],
+                    )
+                )
+        return SummaryReadBatchResponse(results=results)
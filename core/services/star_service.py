@@ -8,6 +8,8 @@ from core.database.repository import (
     UserStarRepository,
 )
 from core.models import StarResponse
+from core.models.api.requests import StarBatchItem
+from core.models.api.responses import StarBatchResponse
 
 
 class StarService:
@@ -76,6 +78,92 @@ class StarService:
 
         return StarResponse.failure_response(f"Paper {paper_id} is not starred")
 
+    def apply_star_batch(
+        self,
+        session: Session,
+        user_id: int | None,
+        items: list[StarBatchItem],
+    ) -> StarBatchResponse:
+        """Apply star and unstar operations in order within one transaction.
+
+        Paper existence and current star state are loaded with one query each,
+        the operations are replayed in memory, and only the net changes are
+        written.
+        """
+        if user_id is None:
+            raise ValueError("User ID is required")
+        if not UserRepository(session).get_by_id(user_id):
+            raise ValueError(f"User {user_id} not found")
+
+        paper_ids = list({item.paper_id for item in items})
+        existing = PaperRepository(session).get_existing_paper_ids(paper_ids)
+        star_repo = UserStarRepository(session)
+        initially_starred = set(star_repo.get_starred_paper_ids(user_id, paper_ids))
+
+        starred = set(initially_starred)
+        to_star: dict[int, str | None] = {}
+        to_unstar: set[int] = set()
+        results: list[StarResponse] = []
+        for item in items:
+            paper_id = item.paper_id
+            if paper_id not in existing:
+                results.append(
+                    StarResponse(
+                        success=False,
+                        is_starred=False,
+                        message=f"Paper {paper_id} not found",
+                        paper_id=paper_id,
+                    )
+                )
+            elif item.action == "star":
+                if paper_id in starred:
+                    results.append(
+                        StarResponse(
+                            success=False,
+                            is_starred=True,
+                            message=f"Paper {paper_id} is already starred",
+                            paper_id=paper_id,
+                        )
+                    )
+                    continue
+                starred.add(paper_id)
+                to_star[paper_id] = item.note
+                results.append(
+                    StarResponse(
+                        success=True,
+                        is_starred=True,
+                        message="Paper starred successfully",
+                        paper_id=paper_id,
+                        note=item.note,
+                    )
+                )
+            else:
+                if paper_id not in starred:
+                    results.append(
+                        StarResponse(
+                            success=False,
+                            is_starred=False,
+                            message=f"Paper {paper_id} is not starred",
+                            paper_id=paper_id,
+                        )
+                    )
+                    continue
+                starred.discard(paper_id)
+                to_star.pop(paper_id, None)
+                if paper_id in initially_starred:
+                    to_unstar.add(paper_id)
+                results.append(
+                    StarResponse(
+                        success=True,
+                        is_starred=False,
+                        message="Paper unstarred successfully",
+                        paper_id=paper_id,
+                    )
+                )
+
+        star_repo.apply_star_changes(user_id, to_star, to_unstar)
+        return StarBatchResponse(results=results)
+
     def is_paper_starred(
         self,
         session: Session,
@@ -20,9 +20,13 @@ logger = get_logger(__name__)
 class StreamService:
     """Service for handling streaming operations."""
 
-    def __init__(self, default_interests: list[str]) -> None:
+    def __init__(
+        self,
+        default_interests: list[str],
+        paper_service: PaperService | None = None,
+    ) -> None:
         """Initialize stream service."""
-        self.paper_service = PaperService()
+        self.paper_service = paper_service or PaperService()
         self.summarization_service = PaperSummarizationService(
             default_interests=default_interests
         )
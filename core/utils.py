@@ -1,6 +1,7 @@
 """Utility functions for the application."""
 
 import json
+import re
 import xml.etree.ElementTree as ElementTree
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -9,6 +10,8 @@ from core import get_logger
 
 logger = get_logger(__name__)
 
+_ARXIV_VERSION_PATTERN = re.compile(r"^(?P<identifier>.+?)v(?P<version>\d+)$")
+
 
 def get_current_timestamp() -> str:
     """Get current timestamp in ISO8601 format."""
@@ -154,6 +157,21 @@ def extract_xml_date(
 
 
 # Crawling utility functions
+def split_arxiv_version(arxiv_id: str) -> tuple[str, int]:
+    """Split a versioned arXiv ID into the bare ID and its version.
+
+    Args:
+        arxiv_id: arXiv ID with or without suffix (e.g., "2501.00001v2")
+
+    Returns:
+        Bare ID and version; IDs without a suffix are version 1
+    """
+    match = _ARXIV_VERSION_PATTERN.match(arxiv_id)
+    if match is None:
+        return arxiv_id, 1
+    return match["identifier"], int(match["version"])
+
+
 def parse_categories_string(categories_str: str) -> list[str]:
     """Parse comma-separated categories string into list.
 
@@ -250,3 +250,48 @@ async def test_stop_all_services_success(mock_settings: Settings):
 
     # Verify stop method was called
     mock_batch_manager.stop.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_crawler_services_share_http_client(
+    mock_settings: Settings, mock_db_engine
+):
+    """Test explorer and extractor share one pooled client closed on shutdown."""
+    from api.services.app_initializer import AppServiceInitializer
+
+    initializer = AppServiceInitializer(mock_settings)
+    initializer.engine = mock_db_engine
+
+    await initializer.initialize_crawler_services()
+
+    client = initializer.http_client
+    assert client is not None
+    assert initializer.arxiv_explorer is not None
+    assert initializer.arxiv_explorer.http_client is client
+    assert initializer.arxiv_explorer.extractor.http_client is client
+
+    await initializer.stop_all_services()
+
+    assert client.is_closed
+    assert initializer.http_client is None
+
+
+@pytest.mark.asyncio
+async def test_crawler_worker_mode_starts_no_crawlers(
+    mock_settings: Settings, mock_db_engine
+):
+    """Test crawling is left to the worker and controlled through its lease."""
+    from api.services.app_initializer import AppServiceInitializer
+    from core.services.crawl_service import WorkerCrawlService
+
+    mock_settings.crawler_worker_enabled = True
+    initializer = AppServiceInitializer(mock_settings)
+    initializer.engine = mock_db_engine
+
+    await initializer.initialize_crawler_services()
+
+    assert initializer.arxiv_explorer is not None
+    assert initializer.historical_crawl_manager is None
+    assert isinstance(initializer.crawl_service, WorkerCrawlService)
+
+    await initializer.stop_all_services()
@@ -1,6 +1,7 @@
 """Global pytest configuration and fixtures."""
 
 import json
+import re
 from collections.abc import Generator
 from logging import Logger
 from pathlib import Path
@@ -213,6 +214,31 @@ def mock_arxiv_server(httpserver: HTTPServer) -> HTTPServer:
                 headers={"Content-Type": "application/xml"},
             )
 
+        if "," in id_list:
+            # Batched lookup: one entry per known id, the default entry
+            # relabelled for other ids, nothing for ids without entries
+            entries = []
+            for paper_id in id_list.split(","):
+                source = arxiv_responses.get(paper_id, arxiv_responses["default"])
+                for entry in re.findall(r"<entry>.*?</entry>", source, re.S):
+                    if paper_id not in arxiv_responses:
+                        entry = re.sub(
+                            r"<id>[^<]*</id>",
+                            f"<id>http://arxiv.org/abs/{paper_id}v1</id>",
+                            entry,
+                            count=1,
+                        )
+                    entries.append(entry)
+            feed = (
+                '<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<feed xmlns="http://www.w3.org/2005/Atom">'
+                + "".join(entries)
+                + "</feed>"
+            )
+            return Response(
+                feed, status=200, headers={"Content-Type": "application/xml"}
+            )
+
         if id_list == "1706.99999":
             # Server error scenario
             return Response(
@@ -252,7 +278,7 @@ def mock_arxiv_extractor(mock_arxiv_server: HTTPServer) -> ArxivExtractor:
 def mock_arxiv_source_explorer(mock_arxiv_server: HTTPServer) -> ArxivSourceExplorer:
     """Provide a mock ArxivSourceExplorer instance configured with mock server."""
     base_url = f"http://{mock_arxiv_server.host}:{mock_arxiv_server.port}/api/query"
-    return ArxivSourceExplorer(api_base_url=base_url)
+    return ArxivSourceExplorer(api_base_url=base_url, delay_seconds=0)
 
 
 @pytest.fixture
@@ -433,7 +459,8 @@ def mock_background_manager() -> BackgroundBatchManager:
 def sample_arxiv_paper() -> ArxivPaper:
     """Create a sample ArxivPaper for testing based on mock response."""
     return ArxivPaper(
-        arxiv_id="2501.00961v3",
+        arxiv_id="2501.00961",
+        version=3,
         title="Uncovering Memorization Effect in the Presence of Spurious Correlations",
         abstract="Machine learning models often rely on simple spurious features -- patterns in training data that correlate with targets but are not causally related to them, like image backgrounds in foreground classification. This reliance typically leads to imbalanced test performance across minority and majority groups.",
         primary_category="cs.LG",
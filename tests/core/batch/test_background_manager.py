@@ -11,7 +11,9 @@ from core.database.repository import (
     PaperRepository,
     SummaryRepository,
 )
+from core.extractors.concrete.arxiv_storage_manager import ArxivStorageManager
 from core.models.batch import BatchResult
+from core.models.domain.arxiv import ArxivPaper
 from core.models.rows import Paper, Summary, LLMBatchRequest
 from core.types import PaperSummaryStatus
 from datetime import datetime, UTC
@@ -394,8 +396,45 @@ async def test_process_batch_results_processes_all_results(
         summary_repo = SummaryRepository(session)
         saved_summaries = await summary_repo.get_by_paper_id(saved_paper.paper_id)
         assert (
-            len(saved_summaries) == 2
-        ), "Should have 2 summaries from 2 successful results"
+            len(saved_summaries) == 1
+        ), "Both successful results should land in the paper's one summary"
+
+
+@pytest.mark.asyncio
+async def test_resummarize_after_version_bump_keeps_one_summary_per_language(
+    mock_db_engine: Engine,
+    mock_background_manager: BackgroundBatchManager,
+    sample_arxiv_paper: ArxivPaper,
+) -> None:
+    """Test that a revised paper's new summary replaces the stored one."""
+    storage = ArxivStorageManager(mock_db_engine)
+    storage.upsert_papers([sample_arxiv_paper])
+    with Session(mock_db_engine) as session:
+        paper_id = session.exec(select(Paper.paper_id)).one()
+    assert paper_id is not None
+
+    results = [create_mock_successful_result(paper_id)]
+    await mock_background_manager._process_batch_results_direct(
+        mock_db_engine, "test_batch", results
+    )
+    with Session(mock_db_engine) as session:
+        (first,) = session.exec(select(Summary)).all()
+
+    revised = sample_arxiv_paper.model_copy(
+        update={"version": sample_arxiv_paper.version + 1}
+    )
+    assert storage.upsert_papers([revised]) == (set(), {revised.arxiv_id})
+    await mock_background_manager._process_batch_results_direct(
+        mock_db_engine, "test_batch", results
+    )
+
+    with Session(mock_db_engine) as session:
+        summaries = session.exec(select(Summary)).all()
+        paper = session.get(Paper, paper_id)
+    assert [s.summary_id for s in summaries] == [first.summary_id]
+    assert summaries[0].updated_at > first.updated_at
+    assert paper is not None
+    assert paper.summary_status == PaperSummaryStatus.DONE
 
 
 @pytest.mark.asyncio
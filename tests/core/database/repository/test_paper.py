@@ -0,0 +1,39 @@
+"""Tests for paper repository."""
+
+from core.database.repository.paper import PaperRepository
+from core.database.repository.summary import SummaryRepository
+from core.models.rows import Paper
+from tests.utils.test_helpers import TestDataFactory
+
+
+def test_iter_papers_with_overview_one_row_per_paper(
+    paper_repo: PaperRepository,
+    summary_repo: SummaryRepository,
+    saved_paper: Paper,
+) -> None:
+    """Test a paper with two summaries in one language is listed once."""
+    assert saved_paper.paper_id is not None
+    other = paper_repo.create(TestDataFactory.create_test_paper(arxiv_id="2508.05678"))
+    for overview in ("old", "new"):
+        summary_repo.create(
+            TestDataFactory.create_test_summary(
+                saved_paper.paper_id, overview=overview, language="Korean"
+            )
+        )
+
+    items = list(paper_repo.iter_papers_with_overview(language="Korean"))
+
+    assert sorted(item.arxiv_id for item in items) == sorted(
+        [saved_paper.arxiv_id, other.arxiv_id]
+    )
+    by_id = {item.arxiv_id: item for item in items}
+    assert by_id[saved_paper.arxiv_id].overview == "new"
+    assert by_id[other.arxiv_id].has_summary is False
+
+    # Offset and limit count papers, not joined summary rows
+    first = list(paper_repo.iter_papers_with_overview(language="Korean", limit=1))
+    second = list(
+        paper_repo.iter_papers_with_overview(language="Korean", skip=1, limit=1)
+    )
+    assert len(first) == len(second) == 1
+    assert {first[0].arxiv_id, second[0].arxiv_id} == set(by_id)
@@ -1,9 +1,17 @@
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+
 from core.database.engine import (
+    SCHEMA_VERSION,
     create_database_engine,
     create_database_tables,
     drop_database_tables,
+    migrate_database,
+    normalize_arxiv_ids,
     reset_database,
 )
+from core.models.rows import Paper
 from core.types import Environment
 
 
@@ -25,3 +33,67 @@ def test_reset_database() -> None:
     assert engine is not None
     create_database_tables(engine)
     reset_database(engine)
+
+
+def _paper(arxiv_id: str) -> Paper:
+    return Paper(
+        arxiv_id=arxiv_id,
+        title="Title",
+        abstract="Abstract",
+        primary_category="cs.AI",
+        categories="cs.AI",
+        authors="Author",
+        url_abs=f"https://arxiv.org/abs/{arxiv_id}",
+        published_at="2025-01-01T00:00:00Z",
+    )
+
+
+def test_normalize_arxiv_ids(mock_db_engine: Engine) -> None:
+    with Session(mock_db_engine) as session:
+        for arxiv_id in [
+            "2501.00001v2",
+            "2501.00002",
+            "2501.00003v1",
+            "2501.00003",
+            "solv-int/9901001",
+        ]:
+            session.add(_paper(arxiv_id))
+        session.commit()
+
+    assert normalize_arxiv_ids(mock_db_engine) == 1
+    assert normalize_arxiv_ids(mock_db_engine) == 0
+
+    with Session(mock_db_engine) as session:
+        versions = {
+            paper.arxiv_id: paper.latest_version
+            for paper in session.exec(select(Paper)).all()
+        }
+    # A bare ID stored already keeps the versioned row for manual review
+    assert versions == {
+        "2501.00001": 2,
+        "2501.00002": 1,
+        "2501.00003v1": 1,
+        "2501.00003": 1,
+        "solv-int/9901001": 1,
+    }
+
+
+def test_migrate_database_runs_once(mock_db_engine: Engine) -> None:
+    with Session(mock_db_engine) as session:
+        session.add(_paper("2501.00001v2"))
+        session.commit()
+
+    # create_database_tables stored the current version, so nothing is scanned
+    assert migrate_database(mock_db_engine) == SCHEMA_VERSION
+    with Session(mock_db_engine) as session:
+        assert session.exec(select(Paper.arxiv_id)).one() == "2501.00001v2"
+
+    with mock_db_engine.begin() as connection:
+        connection.execute(text("DROP INDEX ix_crawlcompletion_category"))
+        connection.execute(text("PRAGMA user_version = 0"))
+    assert migrate_database(mock_db_engine) == 0
+    assert migrate_database(mock_db_engine) == SCHEMA_VERSION
+    with Session(mock_db_engine) as session:
+        assert session.exec(select(Paper.arxiv_id)).one() == "2501.00001"
+    indexes = inspect(mock_db_engine).get_indexes("crawlcompletion")
+    assert [index["name"] for index in indexes] == ["ix_crawlcompletion_category"]
@@ -0,0 +1,79 @@
+"""Tests for the streaming arXiv Atom parser."""
+
+import pytest
+
+from core.extractors.concrete.arxiv_atom_parser import iter_atom_papers
+from core.extractors.exceptions import ParsingError
+
+FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <title>ArXiv Query Results</title>
+  <entry>
+    <id>http://arxiv.org/abs/2501.00001v2</id>
+    <updated>2025-01-02T10:00:00Z</updated>
+    <published>2025-01-01T09:30:00Z</published>
+    <title> A Title </title>
+    <summary>An abstract.</summary>
+    <author><name>Ada Lovelace</name></author>
+    <author><name>Alan Turing</name></author>
+    <arxiv:primary_category term="cs.LG"/>
+    <category term="cs.LG"/>
+    <category term="cs.AI"/>
+  </entry>
+  <entry>
+    <id>http://arxiv.org/abs/2501.00002v1</id>
+    <published>2025-01-01T08:00:00Z</published>
+    <title>Second</title>
+  </entry>
+</feed>"""
+
+
+def test_iter_atom_papers_parses_entries() -> None:
+    """Test fields, category order and id extraction."""
+    papers = list(iter_atom_papers(FEED))
+
+    assert [(paper.arxiv_id, paper.version) for paper in papers] == [
+        ("2501.00001", 2),
+        ("2501.00002", 1),
+    ]
+    first = papers[0]
+    assert first.title == "A Title"
+    assert first.authors == ["Ada Lovelace", "Alan Turing"]
+    assert first.categories == ["cs.LG", "cs.AI"]
+    assert first.primary_category == "cs.LG"
+    assert first.published_date == "2025-01-01T09:30:00+00:00"
+    assert first.updated_date == "2025-01-02T10:00:00+00:00"
+    assert first.url_abs == "https://arxiv.org/abs/2501.00001v2"
+
+
+def test_iter_atom_papers_without_namespace() -> None:
+    """Test feeds without a default Atom namespace parse the same way."""
+    feed = FEED.replace('xmlns="http://www.w3.org/2005/Atom" ', "")
+
+    assert [paper.arxiv_id for paper in iter_atom_papers(feed)] == [
+        "2501.00001",
+        "2501.00002",
+    ]
+
+
+def test_iter_atom_papers_old_style_id() -> None:
+    """Test old-style ids keep their archive prefix."""
+    feed = FEED.replace("2501.00001v2", "cs/0112017v1")
+
+    paper = next(iter_atom_papers(feed))
+
+    assert (paper.arxiv_id, paper.version) == ("cs/0112017", 1)
+    assert paper.url_abs == "https://arxiv.org/abs/cs/0112017v1"
+    assert paper.url_pdf == "https://arxiv.org/pdf/cs/0112017v1"
+
+
+def test_iter_atom_papers_malformed_feed() -> None:
+    """Test entries before a malformed part are yielded, then an error."""
+    papers = iter_atom_papers(FEED[: FEED.index("<title>Second")])
+
+    assert next(papers).arxiv_id == "2501.00001"
+    with pytest.raises(ParsingError):
+        next(papers)
+
+    with pytest.raises(ParsingError):
+        next(iter_atom_papers("   "))
@@ -0,0 +1,261 @@
+"""Tests for the pipelined ArxivCrawlManager."""
+
+import asyncio
+
+import pytest
+from pytest_httpserver import HTTPServer
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+
+from core.extractors.concrete.arxiv_crawl_manager import ArxivCrawlManager
+from core.extractors.concrete.arxiv_source_explorer import ArxivSourceExplorer
+from core.extractors.concrete.arxiv_storage_manager import ArxivStorageManager
+from core.extractors.exceptions import NetworkError
+from core.models.domain.arxiv import ArxivPaper
+from core.models.rows import CrawlCompletion, Paper
+from core.types import PaperSummaryStatus
+
+
+@pytest.mark.asyncio
+async def test_crawl_and_store_papers_pipeline(
+    mock_db_engine: Engine, mock_arxiv_source_explorer: ArxivSourceExplorer
+) -> None:
+    """Pages flow through fetch, parse and store stages with metrics."""
+    manager = ArxivCrawlManager(
+        engine=mock_db_engine, categories=["cs.AI"], store_batch_size=4
+    )
+
+    papers_found, papers_stored = await manager.crawl_and_store_papers(
+        explorer=mock_arxiv_source_explorer,
+        category="cs.AI",
+        date="2025-01-01",
+        limit=3,
+    )
+
+    # 10 entries in pages of 3 -> 4 pages, the last one partial
+    assert (papers_found, papers_stored) == (10, 10)
+    metrics = manager.last_metrics
+    assert metrics.pages_fetched == 4
+    assert metrics.papers_found == 10
+    assert metrics.papers_stored == 10
+    assert metrics.wall_seconds > 0
+
+    with Session(mock_db_engine) as session:
+        assert len(session.exec(select(Paper)).all()) == 10
+
+    # A second crawl finds the same papers but stores nothing new
+    assert await manager.crawl_and_store_papers(
+        explorer=mock_arxiv_source_explorer,
+        category="cs.AI",
+        date="2025-01-01",
+        limit=3,
+    ) == (10, 0)
+
+
+@pytest.mark.asyncio
+async def test_crawl_and_store_papers_network_error(
+    mock_db_engine: Engine,
+) -> None:
+    """A failing fetch stops the pipeline without raising."""
+    explorer = ArxivSourceExplorer(
+        api_base_url="http://127.0.0.1:9/api/query", delay_seconds=0
+    )
+    manager = ArxivCrawlManager(engine=mock_db_engine, categories=["cs.AI"])
+
+    result = await manager.crawl_and_store_papers(
+        explorer=explorer, category="cs.AI", date="2025-01-01"
+    )
+
+    assert result == (0, 0)
+    assert manager.last_metrics.pages_fetched == 0
+
+
+@pytest.mark.asyncio
+async def test_crawl_and_store_papers_store_error_does_not_hang(
+    mock_db_engine: Engine,
+    mock_arxiv_source_explorer: ArxivSourceExplorer,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A failing store stage stops the stages blocked on full queues."""
+    manager = ArxivCrawlManager(
+        engine=mock_db_engine,
+        categories=["cs.AI"],
+        queue_size=1,
+        checkpoint_pages=True,
+    )
+
+    def fail_checkpoint(*args: object) -> None:
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(manager.storage_manager, "save_checkpoint", fail_checkpoint)
+
+    result = await asyncio.wait_for(
+        manager.crawl_and_store_papers(
+            explorer=mock_arxiv_source_explorer,
+            category="cs.AI",
+            date="2025-01-01",
+            limit=1,
+        ),
+        timeout=5,
+    )
+
+    assert result[1] == 1
+    assert not manager.last_metrics.completed
+
+
+@pytest.mark.asyncio
+async def test_crawl_and_store_papers_cancel_does_not_hang(
+    mock_db_engine: Engine,
+    mock_arxiv_source_explorer: ArxivSourceExplorer,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Cancelling a crawl with full queues finishes every stage."""
+    manager = ArxivCrawlManager(
+        engine=mock_db_engine,
+        categories=["cs.AI"],
+        queue_size=1,
+        store_batch_size=1,
+    )
+    storing = asyncio.Event()
+
+    async def stuck_store(*args: object) -> None:
+        storing.set()
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(manager, "_store", stuck_store)
+
+    crawl = asyncio.create_task(
+        manager.crawl_and_store_papers(
+            explorer=mock_arxiv_source_explorer,
+            category="cs.AI",
+            date="2025-01-01",
+            limit=1,
+        )
+    )
+    await asyncio.wait_for(storing.wait(), timeout=5)
+    # Let fetch and parse fill both queues behind the stuck store stage
+    while manager.last_metrics.pages_fetched < 3:
+        await asyncio.sleep(0.01)
+
+    crawl.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(crawl, timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_store_papers_bulk_skips_existing(
+    mock_db_engine: Engine, mock_arxiv_source_explorer: ArxivSourceExplorer
+) -> None:
+    """Bulk insert skips papers already stored and duplicates in the batch."""
+    papers = await mock_arxiv_source_explorer.explore_historical_papers_by_category(
+        "cs.AI", "2025-01-01", 0, 5
+    )
+    storage = ArxivStorageManager(mock_db_engine)
+
+    assert storage.store_papers_bulk(papers[:3]) == 3
+    assert storage.store_papers_bulk(papers + papers[:1]) == 2
+
+
+def test_upsert_papers_applies_newer_versions(
+    mock_db_engine: Engine, sample_arxiv_paper: ArxivPaper
+) -> None:
+    """Only a higher version updates the row and re-batches its summary."""
+    storage = ArxivStorageManager(mock_db_engine)
+    assert storage.upsert_papers([sample_arxiv_paper]) == ({"2501.00961"}, set())
+    with Session(mock_db_engine) as session:
+        row = session.exec(select(Paper)).one()
+        row.summary_status = PaperSummaryStatus.DONE
+        session.add(row)
+        session.commit()
+
+    stale = sample_arxiv_paper.model_copy(update={"version": 2, "abstract": "Old."})
+    revised = sample_arxiv_paper.model_copy(
+        update={"version": 4, "abstract": "Revised."}
+    )
+    assert storage.upsert_papers([stale]) == (set(), set())
+    assert storage.upsert_papers([revised, stale]) == (set(), {"2501.00961"})
+
+    with Session(mock_db_engine) as session:
+        row = session.exec(select(Paper)).one()
+    assert (row.latest_version, row.abstract) == (4, "Revised.")
+    assert row.summary_status == PaperSummaryStatus.BATCHED
+
+
+def test_record_completions_skips_recorded_units(mock_db_engine: Engine) -> None:
+    """Only units without a completion row are written."""
+    storage = ArxivStorageManager(mock_db_engine)
+    assert storage.record_completions({("cs.AI", "2025-01-01"): (3, 3)}) == 1
+    assert (
+        storage.record_completions(
+            {
+                ("cs.AI", "2025-01-01"): (5, 5),
+                ("cs.AI", "2025-01-02"): (2, 1),
+                ("cs.LG", "2025-01-01"): (0, 0),
+            }
+        )
+        == 2
+    )
+
+    with Session(mock_db_engine) as session:
+        rows = session.exec(select(CrawlCompletion)).all()
+    assert sorted((row.category, row.date, row.papers_found) for row in rows) == [
+        ("cs.AI", "2025-01-01", 3),
+        ("cs.AI", "2025-01-02", 2),
+        ("cs.LG", "2025-01-01", 0),
+    ]
+
+
+class _FailingPageExplorer(ArxivSourceExplorer):
+    """Explorer whose requests fail from a given start index on."""
+
+    def __init__(self, api_base_url: str, fail_from: int) -> None:
+        super().__init__(api_base_url=api_base_url, delay_seconds=0)
+        self.fail_from = fail_from
+
+    async def fetch_page_xml(self, query: str, start: int, max_results: int) -> str:
+        if start >= self.fail_from:
+            raise NetworkError("connection reset")
+        return await super().fetch_page_xml(query, start, max_results)
+
+
+@pytest.mark.asyncio
+async def test_interrupted_crawl_resumes_from_checkpoint(
+    mock_db_engine: Engine,
+    mock_arxiv_server: HTTPServer,
+    mock_arxiv_source_explorer: ArxivSourceExplorer,
+) -> None:
+    """Stored pages are checkpointed and a restart skips them."""
+    manager = ArxivCrawlManager(
+        engine=mock_db_engine, categories=["cs.AI"], checkpoint_pages=True
+    )
+    failing_explorer = _FailingPageExplorer(mock_arxiv_source_explorer.api_base_url, 6)
+
+    assert await manager.crawl_and_store_papers(
+        explorer=failing_explorer, category="cs.AI", date="2025-01-01", limit=3
+    ) == (6, 6)
+    assert not manager.last_metrics.completed
+    checkpoint = manager.storage_manager.load_checkpoint(
+        ["cs.AI"], "2025-01-01", "2025-01-01"
+    )
+    assert checkpoint is not None
+    assert (checkpoint.next_index, checkpoint.papers_stored) == (6, 6)
+
+    mock_arxiv_server.clear_log()
+    assert await manager.crawl_and_store_papers(
+        explorer=mock_arxiv_source_explorer,
+        category="cs.AI",
+        date="2025-01-01",
+        limit=3,
+    ) == (10, 10)
+
+    assert manager.last_metrics.completed
+    assert [request.args["start"] for request, _ in mock_arxiv_server.log] == [
+        "6",
+        "9",
+    ]
+    assert (
+        manager.storage_manager.load_checkpoint(["cs.AI"], "2025-01-01", "2025-01-01")
+        is None
+    )
+    with Session(mock_db_engine) as session:
+        assert len(session.exec(select(Paper)).all()) == 10
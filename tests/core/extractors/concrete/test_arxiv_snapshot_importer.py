@@ -0,0 +1,142 @@
+"""Tests for the offline arXiv metadata snapshot importer."""
+
+import json
+from pathlib import Path
+
+import pytest
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+
+from core.extractors.concrete.arxiv_snapshot_importer import (
+    ArxivSnapshotImporter,
+    snapshot_record_to_paper,
+)
+from core.models.domain.arxiv import SnapshotImportProgress
+from core.models.rows import CrawlCompletion, Paper
+
+
+def _record(arxiv_id: str, categories: str, created: str) -> dict:
+    return {
+        "id": arxiv_id,
+        "authors": "Ada Lovelace and Alan Turing",
+        "title": "A title\n  wrapped",
+        "abstract": "  An abstract.\n",
+        "categories": categories,
+        "doi": None,
+        "journal-ref": "J. Test 1 (2024)",
+        "versions": [
+            {"version": "v1", "created": created},
+            {"version": "v2", "created": "Fri, 5 Jan 2024 10:00:00 GMT"},
+        ],
+        "authors_parsed": [["Lovelace", "Ada", ""], ["Turing", "Alan", "Jr"]],
+    }
+
+
+@pytest.fixture
+def snapshot_path(tmp_path: Path) -> Path:
+    """Write a small snapshot spanning two days with one malformed line."""
+    records = [
+        _record("2401.00001", "cs.AI cs.LG", "Mon, 1 Jan 2024 09:00:00 GMT"),
+        _record("2401.00002", "math.AG", "Mon, 1 Jan 2024 10:00:00 GMT"),
+        _record("2401.00003", "cs.LG", "Mon, 1 Jan 2024 11:00:00 GMT"),
+        _record("2401.00004", "cs.AI", "Tue, 2 Jan 2024 09:00:00 GMT"),
+    ]
+    lines = [json.dumps(record) for record in records]
+    lines.insert(2, "{not json")
+    path = tmp_path / "snapshot.json"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def test_snapshot_record_to_paper() -> None:
+    """Test the latest version, authors, dates and text normalization."""
+    paper = snapshot_record_to_paper(
+        _record("2401.00001", "cs.AI cs.LG", "Mon, 1 Jan 2024 09:00:00 GMT")
+    )
+
+    assert (paper.arxiv_id, paper.version) == ("2401.00001", 2)
+    assert paper.title == "A title wrapped"
+    assert paper.abstract == "An abstract."
+    assert paper.authors == ["Ada Lovelace", "Alan Turing Jr"]
+    assert paper.primary_category == "cs.AI"
+    assert paper.published_date == "2024-01-01T09:00:00+00:00"
+    assert paper.updated_date == "2024-01-05T10:00:00+00:00"
+    assert paper.journal == "J. Test 1 (2024)"
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_import_snapshot(
+    mock_db_engine: Engine, snapshot_path: Path, workers: int
+) -> None:
+    """Test filtering, progress reports and completion of finished days."""
+    reports: list[SnapshotImportProgress] = []
+    importer = ArxivSnapshotImporter(
+        mock_db_engine, ["cs.AI", "cs.LG"], batch_lines=2, workers=workers
+    )
+
+    status = importer.import_snapshot(
+        snapshot_path, progress=lambda s: reports.append(s.model_copy())
+    )
+
+    assert (status.records_read, status.papers_found, status.papers_stored) == (
+        5,
+        3,
+        3,
+    )
+    assert status.completed
+    assert [report.bytes_read for report in reports][-1] == status.bytes_total
+    with Session(mock_db_engine) as session:
+        assert len(session.exec(select(Paper)).all()) == 3
+        completions = {
+            (row.category, row.date): row.papers_stored
+            for row in session.exec(select(CrawlCompletion)).all()
+        }
+    # The newest day may be partial in a snapshot, so it is left to the crawl
+    assert completions == {("cs.AI", "2024-01-01"): 1, ("cs.LG", "2024-01-01"): 2}
+
+
+def test_import_snapshot_resumes_after_last_stored_batch(
+    mock_db_engine: Engine, snapshot_path: Path
+) -> None:
+    """Test an interrupted import continues from its saved offset."""
+    importer = ArxivSnapshotImporter(mock_db_engine, ["cs.AI", "cs.LG"], batch_lines=2)
+
+    def interrupt(status: SnapshotImportProgress) -> None:
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        importer.import_snapshot(snapshot_path, progress=interrupt)
+    with Session(mock_db_engine) as session:
+        assert len(session.exec(select(Paper)).all()) == 1
+
+    status = importer.import_snapshot(snapshot_path)
+
+    assert (status.records_read, status.papers_found, status.papers_stored) == (
+        5,
+        3,
+        3,
+    )
+    with Session(mock_db_engine) as session:
+        stored = session.exec(select(CrawlCompletion)).all()
+    assert {(row.category, row.papers_found) for row in stored} == {
+        ("cs.AI", 1),
+        ("cs.LG", 2),
+    }
+
+
+def test_import_snapshot_restarts_for_replaced_snapshot(
+    mock_db_engine: Engine, snapshot_path: Path
+) -> None:
+    """Test a newer snapshot at the same path ignores the old offset."""
+    importer = ArxivSnapshotImporter(mock_db_engine, ["cs.AI", "cs.LG"], batch_lines=2)
+    importer.import_snapshot(snapshot_path)
+
+    snapshot = snapshot_path.read_bytes()
+    snapshot_path.write_bytes(snapshot + snapshot.splitlines(keepends=True)[0])
+    reports: list[SnapshotImportProgress] = []
+    status = importer.import_snapshot(
+        snapshot_path, progress=lambda s: reports.append(s.model_copy())
+    )
+
+    assert [report.records_read for report in reports] == [2, 4, 6]
+    assert status.bytes_read == status.bytes_total
@@ -0,0 +1,46 @@
+"""Tests for the CompletedUnitIndex."""
+
+from core.extractors.concrete.completion_index import CompletedUnitIndex
+
+
+def test_add_merges_neighbouring_days() -> None:
+    """Test days merge into runs and duplicates are not counted twice."""
+    index = CompletedUnitIndex()
+    for day in ["2025-01-01", "2025-01-03", "2025-01-05", "2025-01-02"]:
+        assert index.add("cs.AI", day)
+    assert not index.add("cs.AI", "2025-01-02")
+
+    assert index.intervals("cs.AI") == [
+        ("2025-01-01", "2025-01-03"),
+        ("2025-01-05", "2025-01-05"),
+    ]
+    assert len(index) == 4
+    assert ("cs.AI", "2025-01-03") in index
+    assert ("cs.AI", "2025-01-04") not in index
+    assert ("cs.LG", "2025-01-03") not in index
+
+
+def test_add_interval_absorbs_overlapping_runs() -> None:
+    """Test an interval covering several runs replaces them."""
+    index = CompletedUnitIndex()
+    index.add_interval("cs.AI", "2025-01-01", "2025-01-02")
+    index.add_interval("cs.AI", "2025-01-05", "2025-01-06")
+    index.add_interval("cs.AI", "2025-01-10", "2025-01-10")
+    index.add_interval("cs.AI", "2025-01-02", "2025-01-09")
+
+    assert index.intervals("cs.AI") == [("2025-01-01", "2025-01-10")]
+    assert len(index) == 10
+    assert index.interval_count == 1
+
+
+def test_next_gap_and_count_between() -> None:
+    """Test gap lookups jump over runs and counts clip to the range."""
+    index = CompletedUnitIndex()
+    index.add_interval("cs.AI", "2024-12-20", "2025-01-05")
+    index.add_interval("cs.AI", "2025-01-08", "2025-01-09")
+
+    assert index.next_gap("cs.AI", "2025-01-03") == "2024-12-19"
+    assert index.next_gap("cs.AI", "2025-01-07") == "2025-01-07"
+    assert index.next_gap("cs.LG", "2025-01-03") == "2025-01-03"
+    assert index.count_between("cs.AI", "2025-01-01", "2025-01-08") == 6
+    assert set(index) >= {("cs.AI", "2024-12-31"), ("cs.AI", "2025-01-09")}
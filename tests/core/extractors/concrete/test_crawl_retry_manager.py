@@ -0,0 +1,100 @@
+"""Tests for the CrawlRetryManager."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from pytest_httpserver import HTTPServer
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+
+from core.extractors.concrete.arxiv_source_explorer import ArxivSourceExplorer
+from core.extractors.concrete.arxiv_storage_manager import ArxivStorageManager
+from core.extractors.concrete.crawl_retry_manager import CrawlRetryManager
+from core.extractors.concrete.historical_crawl_manager import HistoricalCrawlManager
+from core.extractors.exceptions import NetworkError
+from core.models.rows import CrawlCompletion, Paper
+
+
+class _FailingExplorer(ArxivSourceExplorer):
+    """Explorer whose page requests always fail."""
+
+    async def fetch_page_xml(self, query: str, start: int, max_results: int) -> str:
+        raise NetworkError("connection reset")
+
+
+def test_is_due_backs_off_exponentially() -> None:
+    """Test the delay doubles per retry and exhausted failures are skipped."""
+    manager = CrawlRetryManager(base_delay=60.0, max_delay=600.0, max_retries=3)
+    now = datetime(2025, 1, 1, 12, tzinfo=UTC)
+    attempted_at = (now - timedelta(seconds=150)).isoformat()
+
+    assert [manager.retry_delay(count) for count in range(5)] == [
+        60.0,
+        120.0,
+        240.0,
+        480.0,
+        600.0,
+    ]
+    assert manager.is_due(1, attempted_at, now)
+    assert not manager.is_due(2, attempted_at, now)
+    assert not manager.is_due(3, (now - timedelta(days=1)).isoformat(), now)
+
+
+@pytest.mark.asyncio
+async def test_retry_failed_papers_refetches_in_bulk(
+    mock_db_engine: Engine,
+    mock_arxiv_server: HTTPServer,
+    mock_arxiv_source_explorer: ArxivSourceExplorer,
+) -> None:
+    """Test found papers are stored and resolved, missing ones count a retry."""
+    storage = ArxivStorageManager(mock_db_engine)
+    await storage.handle_failed_paper("1706.03762v2", "cs.CL", "locked")
+    await storage.handle_failed_paper("9999.99999", "cs.CL", "locked")
+    manager = CrawlRetryManager(base_delay=0)
+
+    assert await manager.retry_failed_papers(
+        mock_db_engine, mock_arxiv_source_explorer
+    ) == (2, 1)
+
+    assert len(mock_arxiv_server.log) == 1
+    assert mock_arxiv_server.log[0][0].args["id_list"] == "1706.03762,9999.99999"
+    with Session(mock_db_engine) as session:
+        assert session.exec(select(Paper.arxiv_id)).all() == ["1706.03762"]
+    [remaining] = storage.load_failed_papers()
+    assert (remaining.arxiv_id, remaining.retry_count) == ("9999.99999", 1)
+    assert storage.count_failures() == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_failed_unit_is_reopened_and_retried(
+    mock_db_engine: Engine, mock_arxiv_source_explorer: ArxivSourceExplorer
+) -> None:
+    """Test a failed unit stays open, is queued and completes on retry."""
+    historical = HistoricalCrawlManager(categories=["cs.AI"])
+    failing_explorer = _FailingExplorer(
+        api_base_url=mock_arxiv_source_explorer.api_base_url, delay_seconds=0
+    )
+
+    await historical.crawl_date_category(
+        mock_db_engine, failing_explorer, "cs.AI", "2025-01-01"
+    )
+
+    storage = ArxivStorageManager(mock_db_engine)
+    assert ("cs.AI", "2025-01-01") not in historical._completed_units
+    assert storage.count_failures() == (0, 1)
+    progress = historical.get_progress_summary_for_progress(mock_db_engine)
+    assert (progress.failed_date_categories, progress.failed_papers) == (1, 0)
+
+    manager = CrawlRetryManager(historical_crawl_manager=historical, base_delay=0)
+    assert await manager.run_retry_cycle(
+        mock_db_engine, mock_arxiv_source_explorer
+    ) == {
+        "papers": (0, 0),
+        "units": (1, 1),
+    }
+
+    assert storage.count_failures() == (0, 0)
+    with Session(mock_db_engine) as session:
+        completion = session.exec(select(CrawlCompletion)).one()
+    assert (completion.category, completion.date) == ("cs.AI", "2025-01-01")
+    assert completion.papers_stored == 10
@@ -0,0 +1,32 @@
+"""Tests for the CrawlThroughputTracker."""
+
+import pytest
+
+from core.extractors.concrete.crawl_throughput import CrawlThroughputTracker
+from core.models.domain.arxiv import CrawlPipelineMetrics
+
+
+def test_snapshot_rates_over_window() -> None:
+    """Test rates span concurrent queries and expired queries drop out."""
+    tracker = CrawlThroughputTracker(window_seconds=100.0)
+    query = CrawlPipelineMetrics(
+        pages_fetched=3,
+        papers_found=250,
+        parse_seconds=0.3,
+        store_seconds=0.2,
+        store_batches=4,
+        wall_seconds=10.0,
+    )
+    tracker.record(query, units_completed=2, finished_at=1000.0)
+    tracker.record(query, units_completed=1, finished_at=1005.0)
+
+    # Both queries overlap within 990..1010, i.e. 20 seconds
+    throughput = tracker.snapshot(now=1010.0)
+    assert throughput.requests_per_minute == pytest.approx(6 * 60 / 20)
+    assert throughput.papers_per_second == pytest.approx(500 / 20)
+    assert throughput.parse_ms_per_page == pytest.approx(100.0)
+    assert throughput.store_ms_per_batch == pytest.approx(50.0)
+    assert throughput.units_per_hour == pytest.approx(3 * 3600 / 20)
+
+    assert tracker.snapshot(now=1102.0).papers_per_second == pytest.approx(250 / 107)
+    assert tracker.snapshot(now=1200.0).requests_per_minute == 0.0
@@ -0,0 +1,41 @@
+"""Tests for the CrawlerLeaseManager."""
+
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.engine import Engine
+
+from core.extractors.concrete.crawler_lease import CrawlerLeaseManager
+
+
+def test_lease_is_exclusive_until_it_lapses(mock_db_engine: Engine) -> None:
+    """Test only one holder at a time and takeover after the TTL."""
+    lease = CrawlerLeaseManager(mock_db_engine, ttl_seconds=60.0)
+    now = datetime(2025, 1, 1, 12, tzinfo=UTC)
+
+    assert lease.acquire("worker-a", now)
+    assert not lease.acquire("worker-b", now + timedelta(seconds=30))
+    assert lease.acquire("worker-a", now + timedelta(seconds=50))
+    assert not lease.acquire("worker-b", now + timedelta(seconds=100))
+    assert CrawlerLeaseManager.is_held(lease.read(), now + timedelta(seconds=100))
+
+    later = now + timedelta(seconds=111)
+    assert not CrawlerLeaseManager.is_held(lease.read(), later)
+    assert lease.acquire("worker-b", later)
+    row = lease.read()
+    assert row is not None and row.holder == "worker-b"
+
+
+def test_release_and_run_request(mock_db_engine: Engine) -> None:
+    """Test release frees the lease and run requests survive holders."""
+    lease = CrawlerLeaseManager(mock_db_engine)
+    lease.request_running(False)
+    assert lease.acquire("worker-a")
+
+    lease.release("worker-b")
+    assert not lease.acquire("worker-b")
+    lease.release("worker-a")
+    assert not CrawlerLeaseManager.is_held(lease.read())
+    assert lease.acquire("worker-b")
+
+    row = lease.read()
+    assert row is not None and row.run_requested is False
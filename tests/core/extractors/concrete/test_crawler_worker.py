@@ -0,0 +1,59 @@
+"""Tests for the CrawlerWorker and its API-side control service."""
+
+import pytest
+from sqlalchemy.engine import Engine
+
+from core.extractors.concrete.arxiv_source_explorer import ArxivSourceExplorer
+from core.extractors.concrete.crawler_lease import CrawlerLeaseManager
+from core.extractors.concrete.crawler_worker import CrawlerWorker
+from core.extractors.concrete.historical_crawl_manager import HistoricalCrawlManager
+from core.services.crawl_service import WorkerCrawlService
+
+
+def _worker(
+    engine: Engine, explorer: ArxivSourceExplorer, holder: str
+) -> CrawlerWorker:
+    historical = HistoricalCrawlManager(categories=["cs.AI"])
+    # Nothing left to crawl, so starting does not reach the network
+    historical.end_date = historical.current_date
+    return CrawlerWorker(engine, explorer, historical, holder=holder)
+
+
+@pytest.mark.asyncio
+async def test_worker_follows_requests_through_the_lease(
+    mock_db_engine: Engine, mock_arxiv_source_explorer: ArxivSourceExplorer
+) -> None:
+    """Test one worker crawls, a second stands by, and the API controls it."""
+    service = WorkerCrawlService(CrawlerLeaseManager(mock_db_engine), "cs.AI")
+    assert not service.is_running(mock_db_engine)
+    assert service.get_status(mock_db_engine).is_active is False
+
+    worker = _worker(mock_db_engine, mock_arxiv_source_explorer, "worker-a")
+    standby = _worker(mock_db_engine, mock_arxiv_source_explorer, "worker-b")
+
+    assert await worker.poll_once()
+    assert not await standby.poll_once()
+    assert worker.is_crawling and not standby.is_crawling
+
+    status = service.get_status(mock_db_engine)
+    assert (status.is_active, status.is_running) == (True, True)
+    assert status.current_date == worker.historical_crawl_manager.current_date
+    assert service.get_progress(mock_db_engine).remaining_units == 0
+
+    assert await service.stop_crawling()
+    assert not service.is_running(mock_db_engine)
+    await worker.poll_once()
+    assert not worker.is_crawling
+    assert not service.get_status(mock_db_engine).is_running
+
+    assert await service.start_crawling(mock_arxiv_source_explorer, mock_db_engine)
+    await worker.poll_once()
+    assert worker.is_crawling
+
+    worker.stop()
+    await worker.run()
+    assert not worker.is_crawling
+    assert not service.get_status(mock_db_engine).is_active
+    assert await standby.poll_once()
+    assert standby.is_crawling
+    await standby.historical_crawl_manager.stop()
@@ -0,0 +1,106 @@
+"""Tests for the forward DailyCrawlManager."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from pytest_httpserver import HTTPServer
+from sqlalchemy.engine import Engine
+
+from core.extractors.concrete.arxiv_source_explorer import ArxivSourceExplorer
+from core.extractors.concrete.arxiv_storage_manager import ArxivStorageManager
+from core.extractors.concrete.daily_crawl_manager import DailyCrawlManager
+from core.models.domain.arxiv import ArxivPaper
+
+
+@pytest.mark.asyncio
+async def test_crawl_category_stops_at_known_papers(
+    mock_db_engine: Engine,
+    mock_arxiv_server: HTTPServer,
+    mock_arxiv_source_explorer: ArxivSourceExplorer,
+) -> None:
+    """Test the first poll pages through, the next stops at the first page."""
+    manager = DailyCrawlManager(categories=["cs.AI"], batch_size=3)
+
+    assert await manager.crawl_category(
+        mock_db_engine, mock_arxiv_source_explorer, "cs.AI"
+    ) == (10, 10)
+    assert len(mock_arxiv_server.log) == 4
+
+    mock_arxiv_server.clear_log()
+    assert await manager.crawl_category(
+        mock_db_engine, mock_arxiv_source_explorer, "cs.AI"
+    ) == (3, 0)
+    assert len(mock_arxiv_server.log) == 1
+
+
+@pytest.mark.asyncio
+async def test_cross_listed_papers_stored_during_cycle_do_not_stop_paging(
+    mock_db_engine: Engine,
+    mock_arxiv_server: HTTPServer,
+    mock_arxiv_source_explorer: ArxivSourceExplorer,
+) -> None:
+    """Test papers stored after the cutoff was read are paged past."""
+    papers = await mock_arxiv_source_explorer.explore_historical_papers_by_category(
+        "cs.AI", "2025-01-01", 0, 10
+    )
+    storage_manager = ArxivStorageManager(mock_db_engine)
+    storage_manager.store_papers_bulk(papers[-2:])
+    cutoff = storage_manager.latest_published_at("cs.AI")
+    # The newest papers are cross-listed and stored by another category first
+    storage_manager.store_papers_bulk(papers[:3])
+
+    manager = DailyCrawlManager(categories=["cs.AI"], batch_size=3)
+    mock_arxiv_server.clear_log()
+    result = await manager.crawl_category(
+        mock_db_engine, mock_arxiv_source_explorer, "cs.AI", cutoff
+    )
+
+    # Pages of 3: all known, 3 new, 2 new then the cutoff
+    assert result == (9, 5)
+    assert len(mock_arxiv_server.log) == 3
+
+
+@pytest.mark.asyncio
+async def test_poll_starts_at_newest_stored_paper(
+    mock_db_engine: Engine,
+    mock_arxiv_server: HTTPServer,
+    mock_arxiv_source_explorer: ArxivSourceExplorer,
+) -> None:
+    """Test polling resumes from the day of the newest stored paper."""
+    manager = DailyCrawlManager(categories=["cs.AI"])
+    await manager.crawl_category(mock_db_engine, mock_arxiv_source_explorer, "cs.AI")
+    newest_day = manager.since_date(mock_db_engine, "cs.AI")
+
+    mock_arxiv_server.clear_log()
+    await manager.run_poll_cycle(mock_db_engine, mock_arxiv_source_explorer)
+
+    search_query = mock_arxiv_server.log[0][0].args["search_query"]
+    assert f"submittedDate:[{newest_day.replace('-', '')}0000 TO" in search_query
+
+
+def test_since_date_without_stored_papers(mock_db_engine: Engine) -> None:
+    """Test a category without stored papers is polled over the lookback."""
+    manager = DailyCrawlManager(categories=["math.AG"], lookback_days=3)
+    expected = (datetime.now(UTC) - timedelta(days=3)).strftime("%Y-%m-%d")
+
+    assert manager.since_date(mock_db_engine, "math.AG") == expected
+
+
+def test_latest_published_at_matches_whole_categories(
+    mock_db_engine: Engine, sample_arxiv_paper: ArxivPaper
+) -> None:
+    """Test a category prefix or suffix does not match a listed category."""
+    older = sample_arxiv_paper.model_copy(
+        update={
+            "arxiv_id": "2412.00001",
+            "categories": ["cs.AI"],
+            "published_date": "2024-12-01T00:00:00Z",
+        }
+    )
+    storage_manager = ArxivStorageManager(mock_db_engine)
+    storage_manager.store_papers_bulk([sample_arxiv_paper, older])
+
+    assert storage_manager.latest_published_at("cs.LG") == "2025-01-01T21:45:00Z"
+    assert storage_manager.latest_published_at("eess.IV") == "2025-01-01T21:45:00Z"
+    assert storage_manager.latest_published_at("cs.A") is None
+    assert storage_manager.latest_published_at("s.AI") is None
@@ -1,13 +1,19 @@
 """Tests for HistoricalCrawlManager."""
 
+import asyncio
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from pytest_httpserver import HTTPServer
 from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
 
 from core.extractors.concrete.arxiv_source_explorer import ArxivSourceExplorer
+from core.extractors.concrete.arxiv_storage_manager import ArxivStorageManager
 from core.extractors.concrete.historical_crawl_manager import HistoricalCrawlManager
+from core.models.rows import CrawlCompletion
+from core.utils import get_previous_date
 
 
 def get_yesterday_date() -> str:
@@ -134,7 +140,7 @@ async def test_crawl_cycle_skips_completed_dates(
     # Add completed combination to manager's state
     # Use the actual current date that the manager will return
     current_date = historical_crawl_manager.current_date
-    historical_crawl_manager._completed_combinations.add(("cs.AI", current_date))
+    historical_crawl_manager._completed_units.add("cs.AI", current_date)
 
     # Mock crawl_date_category to return empty result
     with patch.object(
@@ -151,3 +157,269 @@ async def test_crawl_cycle_skips_completed_dates(
         # The exact behavior depends on the implementation
         # For now, just verify that the method was called (even if for next combination)
         assert mock_crawl.call_count >= 0
+
+
+def test_claim_next_date_category_skips_completed(
+    historical_crawl_manager: HistoricalCrawlManager,
+) -> None:
+    """Test claiming skips completed units and never hands out a unit twice."""
+    current_date = historical_crawl_manager.current_date
+    historical_crawl_manager._completed_units.add("cs.AI", current_date)
+
+    first = historical_crawl_manager.claim_next_date_category()
+    second = historical_crawl_manager.claim_next_date_category()
+
+    assert first == (current_date, "cs.LG")
+    assert second == (current_date, "cs.CL")
+
+
+@pytest.mark.asyncio
+async def test_scheduler_runs_units_concurrently(
+    mock_db_engine: Engine,
+    mock_arxiv_source_explorer: ArxivSourceExplorer,
+) -> None:
+    """Test the scheduler keeps max_concurrency units in flight."""
+    manager = HistoricalCrawlManager(
+        categories=["cs.AI", "cs.LG", "cs.CL"], max_concurrency=3
+    )
+    manager.end_date = get_previous_date(get_previous_date(manager.current_date))
+    in_flight = 0
+    peak = 0
+    crawled: list[tuple[str, str]] = []
+
+    async def fake_crawl(
+        engine: Engine, explorer: ArxivSourceExplorer, category: str, date: str
+    ) -> tuple[int, int]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        crawled.append((category, date))
+        manager._completed_units.add(category, date)
+        return 1, 1
+
+    with patch.object(manager, "crawl_date_category", side_effect=fake_crawl):
+        manager._running = True
+        await manager._crawl_scheduler(mock_db_engine, mock_arxiv_source_explorer)
+
+    assert peak == 3
+    assert len(crawled) == 6
+    assert len(set(crawled)) == 6
+
+
+@pytest.mark.asyncio
+async def test_failed_unit_is_retried_with_growing_backoff(
+    mock_db_engine: Engine,
+    mock_arxiv_source_explorer: ArxivSourceExplorer,
+) -> None:
+    """Test a failing unit is crawled again after a backoff, not skipped."""
+    manager = HistoricalCrawlManager(categories=["cs.AI"], rate_limit_delay=0.001)
+    first_date = manager.current_date
+    manager.end_date = get_previous_date(get_previous_date(first_date))
+    crawled: list[str] = []
+
+    async def flaky_crawl(
+        engine: Engine, explorer: ArxivSourceExplorer, category: str, date: str
+    ) -> tuple[int, int]:
+        crawled.append(date)
+        manager._in_flight.discard((category, date))
+        if crawled.count(first_date) > 2:
+            manager._completed_units.add(category, date)
+        return 0, 0
+
+    with patch.object(manager, "crawl_date_category", side_effect=flaky_crawl):
+        manager._running = True
+        await manager._crawl_scheduler(mock_db_engine, mock_arxiv_source_explorer)
+
+    second_date = get_previous_date(first_date)
+    assert crawled == [first_date, first_date, first_date, second_date]
+    assert [manager.failure_backoff(n) for n in (1, 2, 3)] == [0.001, 0.002, 0.004]
+    assert manager.failure_backoff(100) == 600.0
+
+
+@pytest.mark.asyncio
+async def test_crawl_date_category_multi_day_window(
+    mock_db_engine: Engine,
+    mock_arxiv_source_explorer: ArxivSourceExplorer,
+) -> None:
+    """Test a quiet category is crawled in one window, completed per day."""
+    manager = HistoricalCrawlManager(categories=["cs.AI"], max_window_days=3)
+    manager._completed_units.add("cs.AI", "2024-12-30")
+
+    papers_found, papers_stored = await manager.crawl_date_category(
+        mock_db_engine, mock_arxiv_source_explorer, "cs.AI", "2025-01-02"
+    )
+
+    # Window stops before the completed day: 2025-01-02 .. 2024-12-31
+    assert (papers_found, papers_stored) == (10, 10)
+    with Session(mock_db_engine) as session:
+        completions = {
+            row.date: (row.papers_found, row.papers_stored)
+            for row in session.exec(select(CrawlCompletion)).all()
+        }
+    assert completions == {
+        "2025-01-02": (0, 0),
+        "2025-01-01": (10, 10),
+        "2024-12-31": (0, 0),
+    }
+    assert not manager._in_flight
+    assert manager.claim_next_date_category() is not None
+
+
+class _OversizedWindowPlanner:
+    """Planner whose probe always finds the candidate window too big."""
+
+    def __init__(self, explorer: ArxivSourceExplorer) -> None:
+        self.explorer = explorer
+
+    def window_days(self, categories: object) -> int:
+        return 4
+
+    async def plan(
+        self, categories: object, days: list[str]
+    ) -> tuple[list[str], int | None]:
+        await asyncio.sleep(0.01)
+        return days[:1], None
+
+
+@pytest.mark.asyncio
+async def test_days_released_by_window_planning_are_crawled(
+    mock_db_engine: Engine,
+    mock_arxiv_source_explorer: ArxivSourceExplorer,
+) -> None:
+    """Test days reserved during a probe and then left out are still crawled."""
+    manager = HistoricalCrawlManager(
+        categories=["cs.AI"], max_window_days=4, max_concurrency=2
+    )
+    manager._current_date = "2024-10-17"
+    manager.end_date = "2024-10-12"
+    manager._window_planner = _OversizedWindowPlanner(  # type: ignore
+        mock_arxiv_source_explorer
+    )
+
+    manager._running = True
+    await manager._crawl_scheduler(mock_db_engine, mock_arxiv_source_explorer)
+
+    assert [day for _, day in manager._completed_units] == [
+        "2024-10-13",
+        "2024-10-14",
+        "2024-10-15",
+        "2024-10-16",
+        "2024-10-17",
+    ]
+    assert not manager._in_flight
+
+
+@pytest.mark.asyncio
+async def test_crawl_date_category_combines_categories(
+    mock_db_engine: Engine,
+    mock_arxiv_server: HTTPServer,
+    mock_arxiv_source_explorer: ArxivSourceExplorer,
+) -> None:
+    """Test one OR query covers every pending category, completed per category."""
+    categories = ["cs.AI", "cs.LG", "cs.CL"]
+    manager = HistoricalCrawlManager(categories=categories, combine_categories=True)
+    manager._completed_units.add("cs.CL", "2025-01-01")
+
+    papers_found, papers_stored = await manager.crawl_date_category(
+        mock_db_engine, mock_arxiv_source_explorer, "cs.AI", "2025-01-01"
+    )
+
+    assert (papers_found, papers_stored) == (10, 10)
+    assert len(mock_arxiv_server.log) == 1
+    request = mock_arxiv_server.log[0][0]
+    assert "(cat:cs.AI OR cat:cs.LG)" in request.args["search_query"]
+
+    papers = await mock_arxiv_source_explorer.explore_historical_papers_by_category(
+        "cs.AI", "2025-01-01", 0, 10
+    )
+    cs_lg_count = sum("cs.LG" in paper.categories for paper in papers)
+    with Session(mock_db_engine) as session:
+        completions = {
+            row.category: (row.papers_found, row.papers_stored)
+            for row in session.exec(select(CrawlCompletion)).all()
+        }
+    assert completions == {
+        "cs.AI": (10, 10),
+        "cs.LG": (cs_lg_count, cs_lg_count),
+    }
+    assert not manager._in_flight
+
+
+@pytest.mark.asyncio
+async def test_crawl_date_category_resumes_checkpointed_query(
+    mock_db_engine: Engine,
+    mock_arxiv_server: HTTPServer,
+    mock_arxiv_source_explorer: ArxivSourceExplorer,
+) -> None:
+    """Test an interrupted query is resumed as is instead of being re-planned."""
+    ArxivStorageManager(mock_db_engine).save_checkpoint(
+        ["cs.AI", "cs.LG"], "2025-01-01", "2025-01-02", 5, 5, 0
+    )
+    manager = HistoricalCrawlManager(categories=["cs.AI", "cs.LG"])
+
+    await manager.crawl_date_category(
+        mock_db_engine, mock_arxiv_source_explorer, "cs.AI", "2025-01-02"
+    )
+
+    request = mock_arxiv_server.log[0][0]
+    assert request.args["start"] == "5"
+    assert "(cat:cs.AI OR cat:cs.LG)" in request.args["search_query"]
+    assert set(manager._completed_units) == {
+        ("cs.AI", "2025-01-02"),
+        ("cs.AI", "2025-01-01"),
+        ("cs.LG", "2025-01-02"),
+        ("cs.LG", "2025-01-01"),
+    }
+    assert not manager._in_flight
+
+
+@pytest.mark.asyncio
+async def test_progress_summary_aggregates_completions(
+    mock_db_engine: Engine, mock_arxiv_source_explorer: ArxivSourceExplorer
+) -> None:
+    """Test totals, rates, backlog and ETA of the progress summary."""
+    manager = HistoricalCrawlManager(categories=["cs.AI", "cs.LG"])
+    await manager.crawl_date_category(
+        mock_db_engine, mock_arxiv_source_explorer, "cs.AI", "2015-01-03"
+    )
+    manager._current_date = "2015-01-05"
+    manager._current_category_index = 1
+
+    progress = manager.get_progress_summary_for_progress(mock_db_engine)
+
+    assert (progress.total_papers_found, progress.total_papers_stored) == (10, 10)
+    assert progress.completed_date_categories == 1
+    assert progress.requests_per_minute > 0
+    assert progress.parse_ms_per_page > 0
+    # 4 days x 2 categories, minus cs.AI on the cursor day and the crawled unit
+    assert (progress.backlog_dates, progress.remaining_units) == (4, 6)
+    assert progress.eta_seconds is not None and progress.eta_seconds > 0
+
+
+def test_completed_units_load_as_runs_and_are_skipped(
+    mock_db_engine: Engine,
+) -> None:
+    """Test completions load as day runs and claiming jumps past them."""
+    manager = HistoricalCrawlManager(categories=["cs.AI", "cs.LG"])
+    yesterday = manager.current_date
+    days = [yesterday]
+    for _ in range(4):
+        days.append(get_previous_date(days[-1]))
+    for category in ["cs.AI", "cs.LG"]:
+        for day in days[:3]:
+            manager._save_completion_to_db(mock_db_engine, category, day, 1, 1)
+    manager._save_completion_to_db(mock_db_engine, "cs.LG", days[4], 1, 1)
+    manager._save_completion_to_db(mock_db_engine, "cs.LG", days[4], 1, 1)
+
+    manager._load_completed_units_from_db(mock_db_engine)
+
+    assert manager._completed_units.intervals("cs.LG") == [
+        (days[4], days[4]),
+        (days[2], days[0]),
+    ]
+    assert len(manager._completed_units) == 7
+    assert manager.claim_next_date_category() == (days[3], "cs.AI")
+    assert manager.claim_next_date_category() == (days[3], "cs.LG")
+    assert manager.claim_next_date_category() == (days[4], "cs.AI")
@@ -0,0 +1,138 @@
+"""Tests for OAI-PMH harvesting against a local stand-in server."""
+
+import pytest
+from pytest_httpserver import HTTPServer
+from sqlalchemy.engine import Engine
+from werkzeug import Request, Response
+
+from core.extractors.concrete.arxiv_crawl_manager import ArxivCrawlManager
+from core.extractors.concrete.arxiv_oai_parser import parse_list_records
+from core.extractors.concrete.oai_pmh_source_explorer import OaiPmhSourceExplorer
+from core.extractors.exceptions import ParsingError
+
+RECORD = """
+<record>
+  <header><identifier>oai:arXiv.org:{arxiv_id}</identifier></header>
+  <metadata>
+    <arXiv xmlns="http://arxiv.org/OAI/arXiv/">
+      <id>{arxiv_id}</id>
+      <created>2024-01-0{day}</created>
+      <authors>
+        <author><keyname>Lovelace</keyname><forenames>Ada</forenames></author>
+        <author><keyname>Turing</keyname><forenames>Alan M.</forenames></author>
+      </authors>
+      <title>A title
+  wrapped over lines</title>
+      <categories>{categories}</categories>
+      <doi>10.1000/{arxiv_id}</doi>
+      <abstract>  An abstract.  </abstract>
+    </arXiv>
+  </metadata>
+</record>"""
+
+DELETED_RECORD = """
+<record><header status="deleted"><identifier>oai:arXiv.org:2401.99999</identifier>
+</header></record>"""
+
+
+def _list_records(records: str, token: str = "") -> str:
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">'
+        f"<ListRecords>{records}"
+        f'<resumptionToken completeListSize="3">{token}</resumptionToken>'
+        "</ListRecords></OAI-PMH>"
+    )
+
+
+PAGES = {
+    None: _list_records(
+        RECORD.format(arxiv_id="2401.00001", day=1, categories="cs.AI cs.LG")
+        + DELETED_RECORD,
+        token="page-2",
+    ),
+    "page-2": _list_records(
+        RECORD.format(arxiv_id="2401.00002", day=2, categories="cs.CV")
+        + RECORD.format(arxiv_id="2401.00003", day=2, categories="cs.LG")
+    ),
+}
+
+
+@pytest.fixture
+def oai_server(httpserver: HTTPServer) -> HTTPServer:
+    """Serve two ListRecords pages chained by a resumption token."""
+
+    def handler(request: Request) -> Response:
+        token = request.args.get("resumptionToken")
+        return Response(PAGES[token], content_type="text/xml")
+
+    httpserver.expect_request("/oai").respond_with_handler(handler)
+    return httpserver
+
+
+@pytest.fixture
+def harvester(oai_server: HTTPServer) -> OaiPmhSourceExplorer:
+    """Explorer against the stand-in server without request pacing."""
+    return OaiPmhSourceExplorer(
+        api_base_url=oai_server.url_for("/oai"), delay_seconds=0
+    )
+
+
+def test_parse_list_records() -> None:
+    """Test fields, deleted records and the resumption token."""
+    page = parse_list_records(PAGES[None])
+
+    assert page.resumption_token == "page-2"
+    assert page.complete_list_size == 3
+    [paper] = page.papers
+    assert paper.arxiv_id == "2401.00001"
+    assert paper.title == "A title wrapped over lines"
+    assert paper.abstract == "An abstract."
+    assert paper.authors == ["Ada Lovelace", "Alan M. Turing"]
+    assert paper.categories == ["cs.AI", "cs.LG"]
+    assert paper.primary_category == "cs.AI"
+    assert paper.published_date == "2024-01-01T00:00:00+00:00"
+    assert paper.doi == "10.1000/2401.00001"
+
+    assert parse_list_records(PAGES["page-2"]).resumption_token is None
+
+
+def test_parse_list_records_errors() -> None:
+    """Test noRecordsMatch is an empty page and other errors raise."""
+    empty = (
+        '<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">'
+        '<error code="noRecordsMatch">No records</error></OAI-PMH>'
+    )
+    assert parse_list_records(empty).papers == []
+
+    with pytest.raises(ParsingError, match="badResumptionToken"):
+        parse_list_records(empty.replace("noRecordsMatch", "badResumptionToken"))
+
+
+@pytest.mark.asyncio
+async def test_harvest_follows_resumption_tokens(
+    oai_server: HTTPServer, harvester: OaiPmhSourceExplorer
+) -> None:
+    """Test the first request selects the set and dates, later ones the token."""
+    papers = await harvester.explore_papers("cs.LG", "2024-01-01", "2024-01-31")
+
+    assert [paper.arxiv_id for paper in papers] == ["2401.00001", "2401.00003"]
+    first, second = (request.args for request, _ in oai_server.log)
+    assert first["set"] == "cs"
+    assert (first["from"], first["until"]) == ("2024-01-01", "2024-01-31")
+    assert first["metadataPrefix"] == "arXiv"
+    assert dict(second) == {"verb": "ListRecords", "resumptionToken": "page-2"}
+
+
+@pytest.mark.asyncio
+async def test_harvest_and_store(
+    mock_db_engine: Engine, harvester: OaiPmhSourceExplorer
+) -> None:
+    """Test harvested pages are stored for the configured categories only."""
+    manager = ArxivCrawlManager(engine=mock_db_engine, categories=["cs.AI", "cs.LG"])
+
+    assert await manager.harvest_and_store(harvester, "cs") == (2, 2)
+    assert manager.last_metrics.pages_fetched == 2
+    assert manager.last_metrics.completed
+    assert manager.last_metrics.unit_counts("cs.LG", "2024-01-02") == (1, 1)
+    assert await manager.harvest_and_store(harvester, "cs") == (2, 0)
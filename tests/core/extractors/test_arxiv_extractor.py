@@ -1,6 +1,7 @@
 """Tests for ArXiv extractor."""
 
 import pytest
+from pytest_httpserver import HTTPServer
 
 from core.extractors.concrete.arxiv_extractor import ArxivExtractor
 from core.extractors.exceptions import ExtractionError, InvalidIdentifierError
@@ -56,6 +57,39 @@ def test_extract_identifier_invalid_url() -> None:
         extractor.extract_identifier("https://invalid-url.com/1234.5678")
 
 
+def test_extract_identifier_old_style_and_versioned() -> None:
+    """Test old-style IDs and version suffixes in bare IDs and URLs."""
+    extractor = ArxivExtractor()
+
+    assert extractor.extract_identifier("cs/0112017v2") == "cs/0112017"
+    assert extractor.extract_identifier("math.GT/0309136") == "math.GT/0309136"
+    assert (
+        extractor.extract_identifier("https://export.arxiv.org/abs/hep-th/9901001v1")
+        == "hep-th/9901001"
+    )
+    assert (
+        extractor.extract_identifier("https://arxiv.org/pdf/2501.00961v3.pdf")
+        == "2501.00961"
+    )
+
+
+def test_extract_identifiers_skips_invalid_urls() -> None:
+    """Test the batch pass matches extract_identifier and drops invalid URLs."""
+    extractor = ArxivExtractor()
+    urls = [
+        "https://arxiv.org/abs/1706.03762v5",
+        "cs/0112017",
+        "https://arxiv.org/list/cs.AI",
+        "1706.03762",
+    ]
+
+    assert extractor.extract_identifiers(urls) == {
+        "https://arxiv.org/abs/1706.03762v5": "1706.03762",
+        "cs/0112017": "cs/0112017",
+        "1706.03762": "1706.03762",
+    }
+
+
 @pytest.mark.asyncio
 async def test_extract_metadata_success(mock_arxiv_extractor) -> None:
     """Test successful metadata extraction."""
@@ -123,3 +157,42 @@ def test_custom_base_urls() -> None:
     assert extractor.base_url == "https://custom-api.example.com/query"
     assert extractor.abs_base_url == "https://custom-abs.example.com"
     assert extractor.pdf_base_url == "https://custom-pdf.example.com"
+
+
+@pytest.mark.asyncio
+async def test_extract_metadata_many_batches_id_list(
+    mock_arxiv_server: HTTPServer,
+) -> None:
+    """Test identifiers are deduplicated and fetched in id_list chunks."""
+    base_url = f"http://{mock_arxiv_server.host}:{mock_arxiv_server.port}/api/query"
+    extractor = ArxivExtractor(api_base_url=base_url, max_ids_per_request=2)
+    urls = [
+        "https://arxiv.org/abs/1706.03762",
+        "https://arxiv.org/pdf/1706.03762",
+        "2501.12345",
+        "9999.99999",
+        "https://arxiv.org/abs/not-an-id",
+    ]
+
+    results = await extractor.extract_metadata_many(urls)
+
+    # Three distinct ids in chunks of two
+    assert len(mock_arxiv_server.log) == 2
+    assert set(results) == set(urls[:3])
+    assert results[urls[0]] == await extractor.extract_metadata_async(urls[0])
+    assert results[urls[2]].raw_metadata == {"arxiv_id": "2501.12345"}
+
+
+@pytest.mark.asyncio
+async def test_extract_metadata_many_old_style_ids(
+    mock_arxiv_server: HTTPServer,
+) -> None:
+    """Test old-style ids survive the batched id_list round trip."""
+    base_url = f"http://{mock_arxiv_server.host}:{mock_arxiv_server.port}/api/query"
+    extractor = ArxivExtractor(api_base_url=base_url)
+    urls = ["https://arxiv.org/abs/cs/0112017v1", "2501.12345"]
+
+    results = await extractor.extract_metadata_many(urls)
+
+    assert set(results) == set(urls)
+    assert results[urls[0]].raw_metadata == {"arxiv_id": "cs/0112017"}
@@ -1,8 +1,14 @@
 """Tests for ArXiv source explorer."""
 
+import re
+from unittest.mock import AsyncMock, patch
+
 import pytest
 
-from core.extractors.concrete.arxiv_source_explorer import ArxivSourceExplorer
+from core.extractors.concrete.arxiv_source_explorer import (
+    ArxivSourceExplorer,
+    DateWindowPlanner,
+)
 
 
 @pytest.mark.asyncio
@@ -26,7 +32,8 @@ async def test_explore_new_papers_by_category_with_mock_server(
 
     # Check that the first paper has the expected structure
     first_paper = result[0]
-    assert first_paper.arxiv_id == "2501.00961v3"
+    assert first_paper.arxiv_id == "2501.00961"
+    assert first_paper.version == 3
     assert (
         first_paper.title
         == "Uncovering Memorization Effect in the Presence of Spurious Correlations"
@@ -124,3 +131,66 @@ async def test_error_handling_and_edge_cases(
     print(f"Small batch test: {len(small_batch)} papers")
     print(f"Zero batch test: {len(zero_batch)} papers")
     print(f"Negative start test: {len(negative_start)} papers")
+
+
+@pytest.mark.asyncio
+async def test_count_results_reads_total_results(
+    mock_arxiv_source_explorer: ArxivSourceExplorer,
+) -> None:
+    """Test the probe reads opensearch:totalResults without fetching entries."""
+    query = ArxivSourceExplorer.date_range_query("cs.AI", "2025-01-01", "2025-01-07")
+    assert query == "submittedDate:[202501010000+TO+202501072359]+AND+cat:cs.AI"
+    assert ArxivSourceExplorer.date_range_query(
+        ["cs.AI", "cs.LG"], "2025-01-01", "2025-01-01"
+    ) == ("submittedDate:[202501010000+TO+202501012359]+AND+(cat:cs.AI+OR+cat:cs.LG)")
+
+    assert await mock_arxiv_source_explorer.count_results(query) == 42
+
+
+@pytest.mark.asyncio
+async def test_attribute_categories(
+    mock_arxiv_source_explorer: ArxivSourceExplorer,
+) -> None:
+    """Test combined-query results are attributed to the queried categories."""
+    papers = await mock_arxiv_source_explorer.explore_historical_papers_by_category(
+        category="cs.AI", date="2025-01-01", limit=1
+    )
+
+    # First paper is primary cs.LG and cross-listed in cs.AI
+    assert ArxivSourceExplorer.attribute_categories(
+        papers[0], ["cs.CL", "cs.LG", "cs.AI"]
+    ) == ["cs.LG", "cs.AI"]
+
+
+@pytest.mark.asyncio
+async def test_date_window_planner_splits_and_widens() -> None:
+    """Test the planner halves busy windows and doubles quiet ones."""
+    explorer = ArxivSourceExplorer(delay_seconds=0)
+    planner = DateWindowPlanner(explorer, max_window_days=8, max_results=100)
+    days = [f"2025-01-{day:02d}" for day in range(20, 4, -1)]  # newest first
+    per_day = 30
+
+    def count(query: str) -> int:
+        start, end = re.findall(r"202501(\d\d)\d{4}", query)
+        return (int(end) - int(start) + 1) * per_day
+
+    with patch.object(
+        explorer, "count_results", new=AsyncMock(side_effect=count)
+    ) as probe:
+        window, total = await planner.plan("cs.AI", days)
+        assert window == days[:2]  # 8 -> 4 -> 2 days
+        assert total == 60
+        assert probe.await_count == 3
+        assert planner.window_days("cs.AI") == 2
+
+        per_day = 5
+        window, total = await planner.plan("cs.AI", days[2:])
+        assert window == days[2:4]
+        assert total == 10
+        assert planner.window_days("cs.AI") == 4
+
+        # A single-day window is crawled without probing
+        probe.reset_mock()
+        window, total = await planner.plan("cs.AI", days[:1])
+        assert (window, total) == (days[:1], None)
+        probe.assert_not_awaited()
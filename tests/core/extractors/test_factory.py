@@ -0,0 +1,76 @@
+"""Tests for the extractor registry and host routing."""
+
+import pytest
+
+from core.extractors import factory
+from core.extractors.base import BaseExtractor
+from core.extractors.concrete.arxiv_extractor import ArxivExtractor
+from core.extractors.exceptions import UnsupportedURLError
+from core.extractors.factory import (
+    find_extractor_for_url,
+    register_extractor,
+    route_urls,
+)
+from core.models.domain.paper_extraction import PaperMetadata
+
+
+class _HostlessExtractor(BaseExtractor):
+    """Extractor declaring no hosts, matched by ``can_extract`` only."""
+
+    def can_extract(self, url: str) -> bool:
+        return "example.org/papers/" in url
+
+    def extract_identifier(self, url: str) -> str:
+        return url.rsplit("/", 1)[-1]
+
+    async def extract_metadata_async(self, url: str) -> PaperMetadata:
+        raise NotImplementedError
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give every test an empty extractor registry and routing table."""
+    monkeypatch.setattr(factory, "_extractors", {})
+    monkeypatch.setattr(factory, "_routes", {})
+
+
+def test_hosts_and_subdomains_route_to_extractor() -> None:
+    """Test host routing, parent-domain lookup and the hostless fallback."""
+    arxiv = ArxivExtractor()
+    hostless = _HostlessExtractor()
+    register_extractor("arxiv", arxiv)
+    register_extractor("example", hostless)
+
+    assert find_extractor_for_url("https://arxiv.org/abs/1706.03762") is arxiv
+    assert find_extractor_for_url("https://EXPORT.arxiv.org/abs/cs/0112017") is arxiv
+    assert find_extractor_for_url("arxiv.org/abs/1706.03762") is arxiv
+    assert find_extractor_for_url("https://example.org/papers/42") is hostless
+
+    # A host only mentioned in the path does not route to its extractor
+    with pytest.raises(UnsupportedURLError):
+        find_extractor_for_url("https://mirror.test/arxiv.org/abs/1706.03762")
+
+
+def test_route_urls_groups_in_order() -> None:
+    """Test URLs are grouped per extractor and unsupported ones kept apart."""
+    arxiv = ArxivExtractor()
+    register_extractor("arxiv", arxiv)
+    urls = [
+        "https://arxiv.org/abs/1706.03762",
+        "https://pubmed.gov/12345",
+        "https://www.arxiv.org/pdf/cs/0112017",
+    ]
+
+    routed, unsupported = route_urls(urls)
+
+    assert routed == {arxiv: [urls[0], urls[2]]}
+    assert unsupported == ["https://pubmed.gov/12345"]
+
+
+def test_cleared_registry_does_not_use_stale_routes() -> None:
+    """Test routes of extractors removed from the registry are ignored."""
+    register_extractor("arxiv", ArxivExtractor())
+    factory._extractors.clear()
+
+    with pytest.raises(UnsupportedURLError):
+        find_extractor_for_url("https://arxiv.org/abs/1706.03762")
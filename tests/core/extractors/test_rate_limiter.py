@@ -0,0 +1,71 @@
+"""Tests for the shared async token-bucket rate limiter."""
+
+import time
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from core.extractors.http_client import create_http_client, http_get
+from core.extractors.rate_limiter import AsyncTokenBucket, parse_retry_after
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_then_paces() -> None:
+    """Test burst tokens are immediate and later ones follow the rate."""
+    limiter = AsyncTokenBucket(rate=20.0, burst=2)
+
+    start = time.monotonic()
+    await limiter.acquire()
+    await limiter.acquire()
+    burst_elapsed = time.monotonic() - start
+
+    await limiter.acquire()
+    await limiter.acquire()
+    total_elapsed = time.monotonic() - start
+
+    assert burst_elapsed < 0.04
+    assert total_elapsed >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_penalize_blocks_next_request() -> None:
+    """Test penalize pauses the bucket even when tokens were available."""
+    limiter = AsyncTokenBucket(rate=100.0, burst=5)
+    limiter.penalize(0.1)
+
+    start = time.monotonic()
+    await limiter.acquire()
+
+    assert time.monotonic() - start >= 0.09
+
+
+def test_token_bucket_rejects_invalid_rate() -> None:
+    """Test invalid limiter configuration is rejected."""
+    with pytest.raises(ValueError, match="Rate must be positive"):
+        AsyncTokenBucket(rate=0)
+
+
+def test_parse_retry_after() -> None:
+    """Test Retry-After parsing for delta-seconds, dates and garbage."""
+    assert parse_retry_after("5") == 5.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+@pytest.mark.asyncio
+async def test_http_get_backs_off_on_503(httpserver: HTTPServer) -> None:
+    """Test a 503 with Retry-After pauses the limiter and retries."""
+    httpserver.expect_ordered_request("/api/query").respond_with_data(
+        "busy", status=503, headers={"Retry-After": "0"}
+    )
+    httpserver.expect_ordered_request("/api/query").respond_with_data("ok")
+    limiter = AsyncTokenBucket(rate=100.0, burst=1)
+
+    async with create_http_client() as client:
+        response = await http_get(
+            httpserver.url_for("/api/query"), client=client, rate_limiter=limiter
+        )
+
+    assert response.text == "ok"
+    httpserver.check_assertions()
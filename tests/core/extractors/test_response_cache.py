@@ -0,0 +1,76 @@
+"""Tests for the on-disk arXiv response cache."""
+
+from datetime import date
+from pathlib import Path
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from core.extractors.response_cache import ResponseCache
+
+OLD_QUERY = (
+    "search_query=submittedDate:[202401010000+TO+202401012359]+AND+cat:cs.AI"
+    "&start=0&max_results=100"
+)
+
+
+def test_normalize_url_sorts_params_and_keeps_plus() -> None:
+    """Test equivalent queries share a key and '+' is not decoded."""
+    first = ResponseCache.normalize_url("HTTP://Export.arxiv.org/api/query?b=2&a=x+y")
+    second = ResponseCache.normalize_url(
+        "http://export.arxiv.org/api/query?a=x+y", {"b": "2"}
+    )
+
+    assert first == second == "http://export.arxiv.org/api/query?a=x+y&b=2"
+
+
+def test_ttl_depends_on_data_age(tmp_path: Path) -> None:
+    """Test old date ranges never expire while recent ones use the short TTL."""
+    cache = ResponseCache(tmp_path, recent_ttl_seconds=60, immutable_after_days=7)
+    url = f"http://x/api/query?{OLD_QUERY}"
+
+    assert cache.ttl_for(url, today=date(2024, 1, 20)) is None
+    assert cache.ttl_for(url, today=date(2024, 1, 5)) == 60
+    assert cache.ttl_for("http://x/api/query?id_list=2501.00001") == 60
+
+
+@pytest.mark.asyncio
+async def test_fetch_serves_fresh_entries_from_disk(
+    httpserver: HTTPServer, tmp_path: Path
+) -> None:
+    """Test an immutable page is fetched once and then served from disk."""
+    httpserver.expect_request("/api/query").respond_with_data("<feed/>")
+    url = f"{httpserver.url_for('/api/query')}?{OLD_QUERY}"
+
+    cache = ResponseCache(tmp_path)
+    assert await cache.fetch(url) == "<feed/>"
+    # A new instance sees the entry, as after a restart
+    assert await ResponseCache(tmp_path).fetch(url) == "<feed/>"
+
+    assert len(httpserver.log) == 1
+    assert len(list(tmp_path.rglob("*.xml.gz"))) == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_revalidates_stale_entries(
+    httpserver: HTTPServer, tmp_path: Path
+) -> None:
+    """Test a stale entry is revalidated with its ETag and reused on 304."""
+
+    def handler(request: Request) -> Response:
+        if request.headers.get("If-None-Match") == '"v1"':
+            return Response(status=304, headers={"ETag": '"v1"'})
+        return Response("<feed>v1</feed>", headers={"ETag": '"v1"'})
+
+    httpserver.expect_request("/api/query").respond_with_handler(handler)
+    url = httpserver.url_for("/api/query") + "?search_query=cat:cs.AI"
+    cache = ResponseCache(tmp_path, recent_ttl_seconds=0)
+
+    assert await cache.fetch(url) == "<feed>v1</feed>"
+    assert await cache.fetch(url) == "<feed>v1</feed>"
+
+    first_request, second_request = (request for request, _ in httpserver.log)
+    assert "If-None-Match" not in first_request.headers
+    assert second_request.headers["If-None-Match"] == '"v1"'
+    assert httpserver.log[1][1].status_code == 304
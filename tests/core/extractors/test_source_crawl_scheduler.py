@@ -0,0 +1,124 @@
+"""Tests for the source-agnostic SourceCrawlScheduler."""
+
+import asyncio
+import time
+
+import pytest
+
+from core.extractors import factory
+from core.extractors.base import BaseSourceExplorer
+from core.extractors.exceptions import NetworkError
+from core.extractors.factory import register_source_explorer
+from core.extractors.source_crawl_scheduler import SourceCrawlScheduler
+from core.models.domain.paper_extraction import PaperMetadata, SourceCrawlConfig
+
+
+class _LocalSource(BaseSourceExplorer):
+    """Stand-in source serving generated papers after a fixed latency."""
+
+    def __init__(self, latency: float, failing: set[str] | None = None) -> None:
+        self.latency = latency
+        self.failing = failing or set()
+        self.started_at: list[float] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def explore_recent(self, limit: int = 100) -> list[PaperMetadata]:
+        return await self.explore_by_category("recent", limit)
+
+    async def explore_by_category(
+        self, category: str, limit: int = 100
+    ) -> list[PaperMetadata]:
+        self.started_at.append(time.monotonic())
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if category in self.failing:
+                raise NetworkError(f"{category} unavailable")
+            return [
+                PaperMetadata(
+                    title=f"{category} paper {index}",
+                    abstract="Abstract",
+                    published_date="2025-01-01",
+                    updated_date="2025-01-01",
+                    url_abs=f"https://example.org/{category}/{index}",
+                    categories=[category],
+                )
+                for index in range(limit)
+            ]
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give every test an empty source explorer registry."""
+    monkeypatch.setattr(factory, "_source_explorers", {})
+
+
+@pytest.mark.asyncio
+async def test_sources_run_concurrently_within_their_budgets() -> None:
+    """Test each source keeps its own rate and concurrency budget."""
+    wide = _LocalSource(latency=0.05, failing={"c5"})
+    paced = _LocalSource(latency=0.0)
+    register_source_explorer("wide", wide)
+    register_source_explorer("paced", paced)
+    scheduler = SourceCrawlScheduler(
+        configs={
+            "wide": SourceCrawlConfig(
+                categories=[f"c{index}" for index in range(6)],
+                limit=2,
+                requests_per_second=1000.0,
+                burst=10,
+                max_concurrency=3,
+            ),
+            "paced": SourceCrawlConfig(
+                categories=["a", "b", "c"],
+                limit=1,
+                requests_per_second=20.0,
+                max_concurrency=3,
+            ),
+        }
+    )
+    received: list[tuple[str, str | None, int]] = []
+
+    async def sink(source: str, category: str | None, papers: list) -> None:
+        received.append((source, category, len(papers)))
+
+    start = time.monotonic()
+    results = await scheduler.run_cycle(sink)
+    elapsed = time.monotonic() - start
+
+    assert results["wide"].model_dump() == {
+        "source": "wide",
+        "explorations": 6,
+        "failures": 1,
+        "papers_found": 10,
+    }
+    assert (results["paced"].explorations, results["paced"].papers_found) == (3, 3)
+    assert len(received) == 8
+
+    # Six 50 ms explorations three at a time, overlapping the paced source
+    assert wide.max_in_flight == 3
+    assert 0.09 <= elapsed < 0.3
+    gaps = [b - a for a, b in zip(paced.started_at, paced.started_at[1:], strict=False)]
+    assert all(gap >= 0.04 for gap in gaps)
+
+
+@pytest.mark.asyncio
+async def test_source_without_categories_explores_recent() -> None:
+    """Test unconfigured sources use the default config and recent papers."""
+    source = _LocalSource(latency=0.0)
+    register_source_explorer("local", source)
+    scheduler = SourceCrawlScheduler(default_config=SourceCrawlConfig(limit=3))
+    received: list[tuple[str, str | None, int]] = []
+
+    async def sink(source: str, category: str | None, papers: list) -> None:
+        received.append((source, category, len(papers)))
+
+    results = await scheduler.run_cycle(sink)
+
+    assert results["local"].papers_found == 3
+    assert received == [("local", None, 3)]
+    assert scheduler.rate_limiter("local") is scheduler.rate_limiter("local")
@@ -5,6 +5,9 @@ from sqlmodel import Session
 
 from core.database.repository import (
     PaperRepository,
+    SummaryReadRepository,
+    SummaryRepository,
+    UserStarRepository,
 )
 from core.extractors.concrete import ArxivExtractor
 from core.llm.openai_client import UnifiedOpenAIClient
@@ -12,9 +15,10 @@ from core.models import PaperCreateRequest
 from core.models.api.responses import (
     PaperResponse,
 )
-from core.models.rows import Paper
+from core.models.rows import Paper, User
 from core.services.paper_service import PaperService
 from tests.utils.test_helpers import (
+    TestDataFactory,
     TestSetupHelper,
 )
 
@@ -150,6 +154,47 @@ async def test_get_paper_by_identifier_not_found(
         await paper_service.get_paper("nonexistent", mock_db_session)
 
 
+@pytest.mark.asyncio
+async def test_get_paper_detail_prefers_language_with_english_fallback(
+    paper_service: PaperService,
+    saved_paper: Paper,
+    saved_user: User,
+    mock_db_session: Session,
+) -> None:
+    """Test detail lookup picks the requested language, else English, with flags."""
+    assert saved_paper.paper_id is not None and saved_user.user_id is not None
+    summary_repo = SummaryRepository(mock_db_session)
+    english = summary_repo.create(
+        TestDataFactory.create_test_summary(saved_paper.paper_id, overview="EN")
+    )
+    UserStarRepository(mock_db_session).add_user_star(
+        saved_user.user_id, saved_paper.paper_id
+    )
+    assert english.summary_id is not None
+    SummaryReadRepository(mock_db_session).mark_as_read(
+        saved_user.user_id, english.summary_id
+    )
+
+    fallback = await paper_service.get_paper(
+        saved_paper.arxiv_id, mock_db_session, saved_user.user_id, "Korean"
+    )
+    assert fallback.summary is not None
+    assert fallback.summary.overview == "EN"
+    assert fallback.is_starred is True
+    assert fallback.is_read is True
+
+    summary_repo.create(
+        TestDataFactory.create_test_summary(
+            saved_paper.paper_id, overview="KO", language="Korean"
+        )
+    )
+    preferred = await paper_service.get_paper_summary(
+        saved_paper.paper_id, mock_db_session, saved_user.user_id, "Korean"
+    )
+    assert preferred.summary.overview == "KO"
+    assert preferred.is_read is False
+
+
 # =============================================================================
 # CRUD Operations Tests
 # =============================================================================
@@ -3,6 +3,7 @@
 import pytest
 from sqlmodel import Session
 
+from core.models.api.requests import StarBatchItem
 from core.models.rows import Paper, User
 from core.services.star_service import StarService
 
@@ -105,3 +106,46 @@ def test_remove_star_user_not_found(
             999,
             saved_paper.paper_id,
         )
+
+
+def test_apply_star_batch_replays_in_order(
+    star_service: StarService,
+    saved_paper: Paper,
+    saved_user: User,
+    mock_db_session: Session,
+) -> None:
+    """Test batch operations replay in order and write only the net change."""
+    star_service.add_star(
+        mock_db_session, saved_user.user_id, saved_paper.paper_id, note="old"
+    )
+
+    response = star_service.apply_star_batch(
+        mock_db_session,
+        saved_user.user_id,
+        [
+            StarBatchItem(paper_id=saved_paper.paper_id, action="unstar"),
+            StarBatchItem(paper_id=saved_paper.paper_id, action="star", note="new"),
+            StarBatchItem(paper_id=999, action="unstar"),
+        ],
+    )
+
+    assert [result.success for result in response.results] == [True, True, False]
+    status = star_service.is_paper_starred(
+        mock_db_session, saved_user.user_id, saved_paper.paper_id
+    )
+    assert status.is_starred
+    assert status.note == "new"
+
+
+def test_apply_star_batch_user_not_found(
+    star_service: StarService,
+    saved_paper: Paper,
+    mock_db_session: Session,
+) -> None:
+    """Test batch star operations with non-existent user."""
+    with pytest.raises(ValueError, match="not found"):
+        star_service.apply_star_batch(
+            mock_db_session,
+            999,
+            [StarBatchItem(paper_id=saved_paper.paper_id, action="star")],
+        )
@@ -74,3 +74,21 @@ def test_arxiv_categories_with_spaces(spaced_categories_settings: Settings) -> N
     """Test ArXiv categories with spaces are handled correctly."""
     # Since arxiv_categories is now a list, spaces are already handled during parsing
     assert spaced_categories_settings.arxiv_categories == ["cs.AI", "cs.LG", "cs.CL"]
+
+
+def test_arxiv_rate_split_with_crawler_worker() -> None:
+    """Test the API and the worker share one ArXiv request budget."""
+    alone = Settings(arxiv_requests_per_second=1.0)
+    assert alone.api_arxiv_requests_per_second == 1.0
+
+    with patch.dict(
+        os.environ,
+        {
+            "THEARK_ARXIV_REQUESTS_PER_SECOND": "1.0",
+            "THEARK_CRAWLER_WORKER_ENABLED": "true",
+            "THEARK_CRAWLER_WORKER_RATE_SHARE": "0.75",
+        },
+    ):
+        split = load_settings()
+    assert split.worker_arxiv_requests_per_second == 0.75
+    assert split.api_arxiv_requests_per_second == 0.25
@@ -1,5 +1,7 @@
 """Integration tests for paper CRUD operations."""
 
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -172,3 +174,93 @@ def test_delete_paper_not_found(integration_client: TestClient):
     response = integration_client.delete("/v1/papers/99999")
 
     assert response.status_code == 404
+
+
+def test_stream_papers_lightweight_ndjson(integration_client: TestClient):
+    """Test NDJSON streaming of the lightweight paper list."""
+    paper_data = {
+        "url": "https://arxiv.org/abs/1706.03762",
+        "skip_auto_summarization": True,
+        "summary_language": "English",
+    }
+    create_response = integration_client.post("/v1/papers/", json=paper_data)
+    assert create_response.status_code == 201
+
+    response = integration_client.get("/v1/papers/lightweight/stream?limit=10")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [line for line in response.text.splitlines() if line]
+    assert len(lines) == 1
+    item = json.loads(lines[0])
+    assert item["arxiv_id"] == "1706.03762"
+    assert item["has_summary"] is False
+    assert item["is_starred"] is False
+
+
+@pytest.fixture
+def low_gzip_threshold(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Compress every response body regardless of size."""
+    monkeypatch.setenv("THEARK_GZIP_MINIMUM_SIZE", "1")
+
+
+def test_get_papers_gzip_encoded(
+    low_gzip_threshold: None, integration_client: TestClient
+):
+    """Test that large list responses are gzip-compressed when accepted."""
+    paper_data = {
+        "url": "https://arxiv.org/abs/1706.03762",
+        "skip_auto_summarization": True,
+        "summary_language": "English",
+    }
+    create_response = integration_client.post("/v1/papers/", json=paper_data)
+    assert create_response.status_code == 201
+
+    response = integration_client.get(
+        "/v1/papers/lightweight", headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers.get("content-encoding") == "gzip"
+    assert response.json()["papers"][0]["arxiv_id"] == "1706.03762"
+
+
+def test_import_papers_batch(integration_client: TestClient) -> None:
+    """Test bulk import creates new papers and reports existing and invalid URLs."""
+    create_response = integration_client.post(
+        "/v1/papers/",
+        json={
+            "url": "https://arxiv.org/abs/1706.03762",
+            "skip_auto_summarization": True,
+        },
+    )
+    assert create_response.status_code == 201
+
+    urls = [
+        "https://arxiv.org/abs/1706.03762",
+        "https://arxiv.org/abs/2501.11111",
+        "https://arxiv.org/abs/2501.22222v2",
+        "https://invalid-url.com/paper",
+        "https://arxiv.org/pdf/2501.11111v1",
+        "https://arxiv.org/abs/1706.03762v7",
+    ]
+    response = integration_client.post("/v1/papers/import:batch", json={"urls": urls})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["created_count"], data["existing_count"], data["failed_count"]) == (
+        2,
+        1,
+        1,
+    )
+    results = {item["url"]: item for item in data["results"]}
+    assert results[urls[0]]["created"] is False
+    assert results[urls[1]]["paper"]["arxiv_id"] == "2501.11111"
+    assert results[urls[2]]["paper"]["arxiv_id"] == "2501.22222"
+    assert results[urls[3]]["success"] is False
+    # Other URL forms of the same papers are reported but not counted again
+    assert results[urls[4]]["paper"]["arxiv_id"] == "2501.11111"
+    assert results[urls[5]]["created"] is False
+
+    get_response = integration_client.get("/v1/papers/2501.11111")
+    assert get_response.status_code == 200
@@ -301,3 +301,40 @@ async def test_is_paper_starred_false(
     assert data["is_starred"] is False
     assert data["paper_id"] == paper_id
     assert data["note"] is None
+
+
+@pytest.mark.asyncio
+async def test_star_batch_end_to_end(
+    integration_client: TestClient, created_paper_id: int
+) -> None:
+    """Test batched star operations are applied in order with per-item results."""
+    paper_id = created_paper_id
+
+    response = integration_client.post(
+        "/v1/papers/stars:batch",
+        json={
+            "items": [
+                {"paper_id": paper_id, "action": "star", "note": "first"},
+                {"paper_id": paper_id, "action": "star"},
+                {"paper_id": 99999, "action": "star"},
+            ]
+        },
+    )
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["success"] for r in results] == [True, False, False]
+    assert results[2]["message"] == "Paper 99999 not found"
+
+    response = integration_client.get(f"/v1/papers/{paper_id}/star")
+    assert response.json()["is_starred"] is True
+    assert response.json()["note"] == "first"
+
+    response = integration_client.post(
+        "/v1/papers/stars:batch",
+        json={"items": [{"paper_id": paper_id, "action": "unstar"}]},
+    )
+    assert response.status_code == 200
+    assert response.json()["results"][0]["is_starred"] is False
+
+    response = integration_client.get(f"/v1/papers/{paper_id}/star")
+    assert response.json()["is_starred"] is False
@@ -162,3 +162,38 @@ async def test_mark_summary_as_read_not_found(integration_client: TestClient):
     response = integration_client.post("/v1/papers/1/summary/99999/read")
 
     assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_mark_summaries_as_read_batch(integration_client: TestClient):
+    """Test batch read marking returns per-paper results."""
+    response = integration_client.post(
+        "/v1/papers/stream-summary",
+        json={
+            "url": "https://arxiv.org/abs/1409.0575",
+            "summary_language": "English",
+        },
+        headers={"Accept": "text/event-stream"},
+    )
+    assert response.status_code == 200
+    events = parse_sse_events(response.content.decode("utf-8"))
+    paper_id = [e for e in events if e.get("type") == "complete"][-1]["paper"][
+        "paper_id"
+    ]
+
+    response = integration_client.post(
+        "/v1/papers/summaries/read:batch",
+        json={"paper_ids": [paper_id, 99999], "language": "English"},
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["paper_id"] for r in results] == [paper_id, 99999]
+    assert results[0]["success"] is True
+    assert results[0]["is_read"] is True
+    assert results[1]["success"] is False
+
+    summary_response = integration_client.get(
+        f"/v1/papers/{paper_id}/summary?language=English"
+    )
+    assert summary_response.json()["is_read"] is True
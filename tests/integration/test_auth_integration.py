@@ -3,6 +3,13 @@
 
 from fastapi.testclient import TestClient
 
+from core.config import load_settings
+
+
+def _reload_settings(client: TestClient) -> None:
+    """Settings are resolved once per process; swap them in after env changes."""
+    client.app.state.settings = load_settings()  # type: ignore[attr-defined]
+
 
 def test_development_mode_no_auth_required(integration_client: TestClient) -> None:
     """Test that development mode doesn't require auth."""
@@ -23,6 +30,7 @@ def test_production_mode_auth_required(
     # Patch environment variables to simulate production mode
     monkeypatch.setenv("THEARK_ENV", "production")
     monkeypatch.setenv("THEARK_AUTH_REQUIRED", "true")
+    _reload_settings(integration_client)
 
     # Test auth endpoint without auth header - should fail
     response = integration_client.get("/test-auth")
@@ -41,6 +49,7 @@ def test_production_mode_with_auth_header(
     # Patch environment variables to simulate production mode
     monkeypatch.setenv("THEARK_ENV", "production")
     monkeypatch.setenv("THEARK_AUTH_REQUIRED", "true")
+    _reload_settings(integration_client)
 
     # Test auth endpoint with auth header
     headers = {"Authorization": "Bearer test-token"}
@@ -97,6 +106,7 @@ def test_custom_auth_header(monkeypatch, integration_client: TestClient) -> None
     monkeypatch.setenv("THEARK_ENV", "production")
     monkeypatch.setenv("THEARK_AUTH_REQUIRED", "true")
     monkeypatch.setenv("THEARK_AUTH_HEADER", "X-API-Key")
+    _reload_settings(integration_client)
 
     # Should fail with default Authorization header
     headers = {"Authorization": "Bearer test-token"}
@@ -0,0 +1,37 @@
+"""Latency of arXiv fetches with per-request clients versus a shared pool."""
+
+import logging
+import time
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from core.extractors.concrete.arxiv_extractor import ArxivExtractor
+from core.extractors.http_client import create_http_client
+
+logger = logging.getLogger(__name__)
+
+REQUESTS = 50
+
+
+async def _time_fetches(extractor: ArxivExtractor) -> float:
+    start_time = time.perf_counter()
+    for _ in range(REQUESTS):
+        await extractor._fetch_paper_xml("1706.03762")
+    return (time.perf_counter() - start_time) / REQUESTS
+
+
+@pytest.mark.asyncio
+async def test_shared_http_client_latency(mock_arxiv_server: HTTPServer) -> None:
+    """Compare mean fetch latency against the mock arXiv server."""
+    base_url = f"http://{mock_arxiv_server.host}:{mock_arxiv_server.port}/api/query"
+
+    per_request_time = await _time_fetches(ArxivExtractor(api_base_url=base_url))
+
+    async with create_http_client() as client:
+        pooled_extractor = ArxivExtractor(api_base_url=base_url, http_client=client)
+        pooled_time = await _time_fetches(pooled_extractor)
+        assert not client.is_closed
+
+    logger.info(f"Per-request client: {per_request_time * 1000:.2f} ms/request")
+    logger.info(f"Shared pooled client: {pooled_time * 1000:.2f} ms/request")
@@ -0,0 +1,127 @@
+"""Throughput and peak memory of Atom feed parsing on a 1,000-entry feed."""
+
+import logging
+import re
+import time
+import tracemalloc
+import xml.etree.ElementTree as ElementTree
+from collections.abc import Callable
+from pathlib import Path
+
+from core.extractors.concrete.arxiv_atom_parser import iter_atom_papers
+from core.models.domain.arxiv import ArxivPaper
+from core.utils import (
+    extract_xml_authors,
+    extract_xml_categories,
+    extract_xml_date,
+    extract_xml_text,
+    split_arxiv_version,
+)
+
+logger = logging.getLogger(__name__)
+
+ENTRIES = 1000
+ROUNDS = 5
+NAMESPACE = {
+    "atom": "http://www.w3.org/2005/Atom",
+    "arxiv": "http://arxiv.org/schemas/atom",
+}
+
+
+def _make_feed() -> str:
+    """Repeat the entries of the sample feed with unique ids."""
+    xml_content = Path(
+        "tests", "assets", "example_arxiv_range_query_response.xml"
+    ).read_text(encoding="utf-8")
+    head, _, rest = xml_content.partition("<entry>")
+    body, _, tail = ("<entry>" + rest).rpartition("</entry>")
+    sample_entries = re.findall(r"<entry>.*?</entry>", body + "</entry>", re.S)
+
+    entries = []
+    for i in range(ENTRIES):
+        entry = sample_entries[i % len(sample_entries)]
+        entries.append(
+            re.sub(r"abs/[^<]+</id>", f"abs/2501.{i:05d}v1</id>", entry, count=1)
+        )
+    return head + "".join(entries) + tail
+
+
+def _legacy_parse(xml_content: str) -> list[ArxivPaper]:
+    """Previous path: full tree, then namespace-qualified finds per field."""
+    root = ElementTree.fromstring(xml_content)
+    papers = []
+    for entry in root.findall("atom:entry", NAMESPACE):
+        entry_id = extract_xml_text(entry, "atom:id", NAMESPACE)
+        versioned_id = entry_id.split("/")[-1] if entry_id else ""
+        arxiv_id, version = split_arxiv_version(versioned_id)
+        categories = extract_xml_categories(entry, NAMESPACE)
+        papers.append(
+            ArxivPaper(
+                arxiv_id=arxiv_id,
+                version=version,
+                title=extract_xml_text(entry, "atom:title", NAMESPACE),
+                abstract=extract_xml_text(entry, "atom:summary", NAMESPACE),
+                authors=extract_xml_authors(entry, NAMESPACE),
+                categories=categories,
+                primary_category=categories[0] if categories else "",
+                published_date=extract_xml_date(entry, "atom:published", NAMESPACE),
+                updated_date=extract_xml_date(entry, "atom:updated", NAMESPACE),
+                url_pdf=f"https://arxiv.org/pdf/{versioned_id}",
+                url_abs=f"https://arxiv.org/abs/{versioned_id}",
+                doi=None,
+                journal=None,
+                volume=None,
+                pages=None,
+                keywords=[],
+                raw_metadata={},
+            )
+        )
+    return papers
+
+
+def _streaming_parse(xml_content: str) -> list[ArxivPaper]:
+    return list(iter_atom_papers(xml_content))
+
+
+def _measure(
+    parse: Callable[[str], list[ArxivPaper]], xml_content: str
+) -> tuple[float, int]:
+    """Return (entries per second, peak traced bytes) for a parser."""
+    start_time = time.perf_counter()
+    for _ in range(ROUNDS):
+        parse(xml_content)
+    throughput = ENTRIES * ROUNDS / (time.perf_counter() - start_time)
+
+    tracemalloc.start()
+    try:
+        parse(xml_content)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return throughput, peak
+
+
+def test_streaming_parser_matches_legacy_output() -> None:
+    """Streaming parser must produce the same papers as the tree parser."""
+    xml_content = _make_feed()
+    papers = _streaming_parse(xml_content)
+
+    assert len(papers) == ENTRIES
+    assert papers == _legacy_parse(xml_content)
+
+
+def test_streaming_parser_benchmark() -> None:
+    """Compare throughput and peak memory on a 1,000-entry feed."""
+    xml_content = _make_feed()
+
+    legacy_throughput, legacy_peak = _measure(_legacy_parse, xml_content)
+    streaming_throughput, streaming_peak = _measure(_streaming_parse, xml_content)
+
+    logger.info(
+        f"Tree parser: {legacy_throughput:,.0f} entries/s, "
+        f"peak {legacy_peak / 1024 / 1024:.2f} MiB"
+    )
+    logger.info(
+        f"Streaming parser: {streaming_throughput:,.0f} entries/s, "
+        f"peak {streaming_peak / 1024 / 1024:.2f} MiB"
+    )
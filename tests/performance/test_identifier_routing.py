@@ -0,0 +1,89 @@
+"""Benchmark of URL routing and identifier parsing for bulk imports."""
+
+import logging
+import re
+import time
+
+from core.extractors import factory
+from core.extractors.base import BaseExtractor
+from core.extractors.concrete.arxiv_extractor import ArxivExtractor
+from core.extractors.factory import register_extractor, route_urls
+
+logger = logging.getLogger(__name__)
+
+URL_COUNT = 20000
+EXTRACTOR_COUNT = 8
+
+
+def _legacy_identifier(url: str) -> str | None:
+    """Previous parser: four uncompiled patterns tried in sequence."""
+    if re.match(r"^\d{4}\.\d{4,5}(v\d+)?$", url):
+        return re.sub(r"v\d+$", "", url)
+    for pattern in (
+        r"arxiv\.org/abs/(\d{4}\.\d{4,5})",
+        r"arxiv\.org/pdf/(\d{4}\.\d{4,5})",
+        r"arxiv\.org/abs/(\d{4}\.\d{4,5})v\d+",
+    ):
+        match = re.search(pattern, url)
+        if match:
+            return match.group(1)
+    return None
+
+
+def _legacy_route(extractors: list[BaseExtractor], url: str) -> BaseExtractor | None:
+    """Previous router: linear ``can_extract`` scan over all extractors."""
+    for extractor in extractors:
+        if extractor.can_extract(url):
+            return extractor
+    return None
+
+
+class _OtherSourceExtractor(ArxivExtractor):
+    """Extractor of another source registered ahead of arXiv."""
+
+    def __init__(self, host: str) -> None:
+        super().__init__()
+        self.host = host
+        self.hosts = (host,)
+
+    def can_extract(self, url: str) -> bool:
+        return self.host in url
+
+
+def test_identifier_routing_benchmark(monkeypatch) -> None:
+    """Compare linear routing plus regex chains with host routing in one pass."""
+    monkeypatch.setattr(factory, "_extractors", {})
+    monkeypatch.setattr(factory, "_routes", {})
+    others = [
+        _OtherSourceExtractor(f"source{index}.org") for index in range(EXTRACTOR_COUNT)
+    ]
+    arxiv = ArxivExtractor()
+    for index, extractor in enumerate(others):
+        register_extractor(f"source{index}", extractor)
+    register_extractor("arxiv", arxiv)
+    urls = [
+        f"https://arxiv.org/abs/{2000 + index % 500}.{index:05d}v{index % 3 + 1}"
+        for index in range(URL_COUNT)
+    ]
+    extractors = [*others, arxiv]
+
+    start_time = time.perf_counter()
+    legacy = {}
+    for url in urls:
+        if _legacy_route(extractors, url) is arxiv:
+            legacy[url] = _legacy_identifier(url)
+    legacy_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    routed, _ = route_urls(urls)
+    identifiers = {
+        url: identifier
+        for extractor, extractor_urls in routed.items()
+        for url, identifier in extractor.extract_identifiers(extractor_urls).items()
+    }
+    routed_time = time.perf_counter() - start_time
+
+    logger.info(f"Linear routing + regex chain: {legacy_time * 1e3:.1f} ms")
+    logger.info(f"Host routing + batch parse: {routed_time * 1e3:.1f} ms")
+
+    assert identifiers == legacy
@@ -0,0 +1,84 @@
+"""Microbenchmark for serializing a 100-row paper list page."""
+
+import logging
+import time
+
+from pydantic import TypeAdapter
+
+from api.utils.json_response import model_json_response
+from core.models.api.responses import (
+    PaperListItemResponse,
+    PaperListLightweightResponse,
+)
+from core.models.rows import Paper
+from tests.utils.test_helpers import TestDataFactory
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 100
+ROUNDS = 50
+
+
+def _make_rows() -> list[Paper]:
+    rows = []
+    for i in range(PAGE_SIZE):
+        paper = TestDataFactory.create_test_paper(
+            arxiv_id=f"2508.{i:05d}",
+            title=f"Test Paper {i}",
+            abstract="A fairly long abstract sentence. " * 40,
+        )
+        paper.paper_id = i + 1
+        rows.append(paper)
+    return rows
+
+
+def _legacy_page(rows: list[Paper]) -> bytes:
+    """Previous path: dump + revalidate each row, then FastAPI validation."""
+    items = [
+        PaperListItemResponse(overview="Overview", has_summary=True, **row.model_dump())
+        for row in rows
+    ]
+    page = PaperListLightweightResponse(
+        papers=items, total_count=PAGE_SIZE, limit=PAGE_SIZE, offset=0, has_more=False
+    )
+    adapter = TypeAdapter(PaperListLightweightResponse)
+    revalidated = adapter.validate_python(page.model_dump())
+    return adapter.dump_json(revalidated)
+
+
+def _fast_page(rows: list[Paper]) -> bytes:
+    items = [
+        PaperListItemResponse.from_paper_with_overview(
+            row, overview="Overview", has_summary=True
+        )
+        for row in rows
+    ]
+    page = PaperListLightweightResponse(
+        papers=items, total_count=PAGE_SIZE, limit=PAGE_SIZE, offset=0, has_more=False
+    )
+    return bytes(model_json_response(page).body)
+
+
+def test_fast_list_serialization_matches_legacy_output() -> None:
+    """Fast path must produce byte-identical JSON to the validated path."""
+    rows = _make_rows()
+    assert _fast_page(rows) == _legacy_page(rows)
+
+
+def test_fast_list_serialization_benchmark() -> None:
+    """Compare legacy and fast serialization of a 100-row page."""
+    rows = _make_rows()
+
+    start_time = time.perf_counter()
+    for _ in range(ROUNDS):
+        _legacy_page(rows)
+    legacy_time = (time.perf_counter() - start_time) / ROUNDS
+
+    start_time = time.perf_counter()
+    for _ in range(ROUNDS):
+        _fast_page(rows)
+    fast_time = (time.perf_counter() - start_time) / ROUNDS
+
+    logger.info(f"Legacy 100-row page: {legacy_time * 1000:.3f} ms")
+    logger.info(f"Fast 100-row page: {fast_time * 1000:.3f} ms")
+    logger.info(f"Speedup: {legacy_time / fast_time:.1f}x")
@@ -0,0 +1,64 @@
+"""Benchmark of per-request dependency overhead before and after caching."""
+
+import logging
+import time
+from types import SimpleNamespace
+
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from api.dependencies import (
+    get_current_user,
+    get_paper_service,
+    get_settings,
+    load_default_user,
+)
+from core.config import load_settings
+from core.database.engine import create_database_tables
+from core.database.repository import UserRepository
+from core.services.paper_service import PaperService
+
+logger = logging.getLogger(__name__)
+
+ROUNDS = 200
+
+
+def _legacy_request(engine: Engine) -> None:
+    """Previous path: reload settings, build services, look the user up."""
+    load_settings()
+    PaperService()
+    with Session(engine) as session:
+        UserRepository(session).get_or_create(1, "default@example.com")
+
+
+def _cached_request(request: SimpleNamespace, engine: Engine) -> None:
+    get_settings(request)  # type: ignore[arg-type]
+    get_paper_service(request)  # type: ignore[arg-type]
+    get_current_user(request, engine)  # type: ignore[arg-type]
+
+
+def test_request_overhead_benchmark(mock_db_engine: Engine) -> None:
+    """Compare per-request dependency resolution with and without caching."""
+    create_database_tables(mock_db_engine)
+    settings = load_settings()
+    state = SimpleNamespace(
+        settings=settings,
+        paper_service=PaperService(settings),
+        default_user=load_default_user(mock_db_engine),
+    )
+    request = SimpleNamespace(app=SimpleNamespace(state=state))
+
+    start_time = time.perf_counter()
+    for _ in range(ROUNDS):
+        _legacy_request(mock_db_engine)
+    legacy_time = (time.perf_counter() - start_time) / ROUNDS
+
+    start_time = time.perf_counter()
+    for _ in range(ROUNDS):
+        _cached_request(request, mock_db_engine)
+    cached_time = (time.perf_counter() - start_time) / ROUNDS
+
+    logger.info(f"Legacy per-request overhead: {legacy_time * 1e6:.1f} us")
+    logger.info(f"Cached per-request overhead: {cached_time * 1e6:.1f} us")
+
+    assert state.default_user.user_id == 1